@@ -0,0 +1,54 @@
+"""
+Micro-benchmark: generic extraction chain vs per-site extractors.
+
+For each article in the fixture corpus, times Summarizer._extract_content
+without a URL (trafilatura → JSON-LD → CSS selectors) and with the article
+URL (services/article_extractors.py rules), and reports extracted length.
+
+Run from the backend/ directory:
+    cd backend && python3 benchmarks/bench_article_extraction.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.summarizer import Summarizer  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+CORPUS = [
+    ("laodong_article.html", "https://laodong.vn/kinh-doanh/thu-ngan-sach.ldo"),
+    ("dantri_article.html", "https://dantri.com.vn/kinh-doanh/goi-ho-tro.htm"),
+    ("hanoimoi_article.html", "https://hanoimoi.vn/phuong-hai-ba-trung-94-lo-duc.html"),
+    ("vnexpress_article.html", "https://vnexpress.net/cpi-thang-3-tang.html"),
+    ("tuoitre_article.html", "https://tuoitre.vn/phan-luong-nut-giao-an-phu.htm"),
+    ("vov_article.html", "https://vov.vn/the-gioi/hop-bao.vov"),
+]
+
+
+def _best_ms(fn, number: int = 10, repeat: int = 3) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e3
+
+
+def main() -> None:
+    summarizer = Summarizer()
+    total_generic = total_site = 0.0
+    for name, url in CORPUS:
+        with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+            html = f.read()
+
+        generic_text = summarizer._extract_content(html, limit=15000)
+        site_text = summarizer._extract_content(html, limit=15000, url=url)
+        generic_ms = _best_ms(lambda: summarizer._extract_content(html, limit=15000))
+        site_ms = _best_ms(lambda: summarizer._extract_content(html, limit=15000, url=url))
+        total_generic += generic_ms
+        total_site += site_ms
+        print(f"{name:24s} {len(html):7d} chars | generic {generic_ms:7.2f} ms ({len(generic_text):5d} chars) | "
+              f"per-site {site_ms:6.2f} ms ({len(site_text):5d} chars) | {generic_ms / site_ms:5.1f}x")
+    print(f"{'total':24s} generic {total_generic:7.2f} ms | per-site {total_site:6.2f} ms | "
+          f"{total_generic / total_site:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: memory and response serialization for a full-day fetch
+(1000 articles) as dicts + pydantic Article vs ArticleRecord.
+
+Run from the backend/ directory:
+    cd backend && python3 benchmarks/bench_article_record.py [articles]
+"""
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from routes.news import Article, FetchArticlesResponse  # noqa: E402
+from services.article_record import ArticleRecord, clean_description, json_default  # noqa: E402
+
+SOURCES = ["DÂN TRÍ", "LAO ĐỘNG", "VOV", "TUỔI TRẺ"]
+CATEGORIES = ["KINH TẾ", "XÃ HỘI", "PHÁP LUẬT", "THẾ GIỚI"]
+RAW = "<p>Mô tả bài viết số {i} với <b>định dạng</b> và&nbsp;khoảng trắng thừa ....</p>"
+
+
+def _fields(i: int) -> tuple:
+    # Fresh strings per article, as parsed feeds produce them
+    return (
+        f"https://x.vn/bai-{i}.html",
+        f"Tiêu đề bài viết số {i}",
+        "".join(CATEGORIES[i % 4]),
+        "07:00 16/03/2026",
+        "".join(SOURCES[i % 4]),
+        f"https://x.vn/img/{i}.jpg",
+        RAW.format(i=i),
+    )
+
+
+def as_dict(i: int) -> dict:
+    url, title, category, published_at, source, thumbnail, raw = _fields(i)
+    article = {
+        "url": url, "title": title, "category": category, "published_at": published_at,
+        "description": clean_description(raw), "source": source, "thumbnail": thumbnail,
+    }
+    article.update(group_id=f"g{i // 3}", is_master=i % 3 == 0, duplicate_count=0, event_summary="", official_source_link=None)
+    return article
+
+
+def as_record(i: int) -> ArticleRecord:
+    url, title, category, published_at, source, thumbnail, raw = _fields(i)
+    record = ArticleRecord(url, title, category, published_at, source, thumbnail, raw_description=raw)
+    record.update(group_id=f"g{i // 3}", is_master=i % 3 == 0, duplicate_count=0, event_summary="", official_source_link=None)
+    return record
+
+
+def _measure(build, count: int):
+    tracemalloc.start()
+    articles = [build(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return articles, size
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    dicts, dict_bytes = _measure(as_dict, count)
+    records, record_bytes = _measure(as_record, count)
+
+    def old_response():
+        return FetchArticlesResponse(articles=[Article(**a) for a in dicts]).model_dump_json()
+
+    def new_response():
+        return json.dumps({"articles": records}, ensure_ascii=False, default=json_default)
+
+    assert json.loads(old_response()) == json.loads(new_response())
+    old_ms = min(timeit.repeat(old_response, number=5, repeat=3)) / 5 * 1e3
+    new_ms = min(timeit.repeat(new_response, number=5, repeat=3)) / 5 * 1e3
+
+    print(f"{count} articles")
+    print(f"{'':<28}{'memory KB':>10}{'response ms':>13}")
+    print(f"{'dict + pydantic Article':<28}{dict_bytes / 1024:>10.0f}{old_ms:>13.2f}")
+    print(f"{'ArticleRecord':<28}{record_bytes / 1024:>10.0f}{new_ms:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
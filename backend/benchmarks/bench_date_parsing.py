@@ -0,0 +1,65 @@
+"""
+Micro-benchmark: pubDate parsing — legacy (_normalize_gmt_offset + dateutil)
+vs services.date_parsing (learned stdlib fast path + memo).
+
+Uses the pubDates of the fixture feeds. "cold" clears the memo on every run
+(first fetch of a feed); "warm" keeps it (the same feed refreshed).
+
+Run from the backend/ directory:
+    cd backend && python3 benchmarks/bench_date_parsing.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dateutil import parser as date_parser  # noqa: E402
+
+from services.date_parsing import FeedDateParser, _normalize_gmt_offset  # noqa: E402
+from services.feed_parser import feed_parser  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+FIXTURES = ["dantri_feed.xml", "atom_feed.xml", "hanoimoi_feed.xml"]
+
+
+def _load_dates() -> list:
+    dates = []
+    for name in FIXTURES:
+        with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+            for entry in feed_parser.parse(f.read()).entries:
+                dates.append((entry.get("published", ""), name))
+    return dates
+
+
+def main() -> None:
+    dates = _load_dates()
+
+    def legacy():
+        for value, _ in dates:
+            date_parser.parse(_normalize_gmt_offset(value))
+
+    def cold():
+        parser = FeedDateParser()
+        for value, feed in dates:
+            parser.parse(value, feed_key=feed)
+
+    warm_parser = FeedDateParser()
+
+    def warm():
+        for value, feed in dates:
+            warm_parser.parse(value, feed_key=feed)
+
+    for value, feed in dates:
+        assert warm_parser.parse(value, feed_key=feed) == date_parser.parse(_normalize_gmt_offset(value))
+
+    results = {}
+    for label, fn in (("legacy dateutil", legacy), ("fast path (cold)", cold), ("fast path (warm)", warm)):
+        results[label] = min(timeit.repeat(fn, number=20, repeat=5)) / 20 / len(dates) * 1e6
+    print(f"{len(dates)} pubDate strings from {len(FIXTURES)} fixture feeds")
+    for label, us in results.items():
+        print(f"{label:18s}: {us:7.2f} µs/date  ({results['legacy dateutil'] / us:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Micro-benchmark: feedparser vs the lxml iterparse engine in services.feed_parser.
+
+Parses each fixture feed with both engines (same str input the fetchers pass)
+and reports per-feed time plus entry counts.
+
+Run from the backend/ directory:
+    cd backend && python3 benchmarks/bench_feed_parsing.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser  # noqa: E402
+
+from services.feed_parser import ENGINE_LXML, FeedParser  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+FIXTURES = ["dantri_feed.xml", "atom_feed.xml", "hanoimoi_feed.xml"]
+
+
+def _best_us(fn, content: str, number: int = 50, repeat: int = 5) -> float:
+    return min(timeit.repeat(lambda: fn(content), number=number, repeat=repeat)) / number * 1e6
+
+
+def main() -> None:
+    lxml_parser = FeedParser(ENGINE_LXML)
+    total_fp = total_lx = 0.0
+    for name in FIXTURES:
+        with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+            content = f.read()
+
+        fast = lxml_parser.parse(content)
+        assert fast.engine == ENGINE_LXML, f"{name}: lxml engine fell back"
+        assert len(fast.entries) == len(feedparser.parse(content).entries), f"{name}: entry count differs"
+
+        fp_us = _best_us(feedparser.parse, content)
+        lx_us = _best_us(lxml_parser.parse, content)
+        total_fp += fp_us
+        total_lx += lx_us
+        print(f"{name:20s} {len(content):7d} chars {len(fast.entries):3d} entries | "
+              f"feedparser {fp_us:9.1f} µs | lxml {lx_us:8.1f} µs | {fp_us / lx_us:5.1f}x")
+    print(f"{'total':20s} feedparser {total_fp:9.1f} µs | lxml {total_lx:8.1f} µs | {total_fp / total_lx:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
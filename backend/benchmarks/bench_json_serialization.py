@@ -0,0 +1,73 @@
+"""
+Micro-benchmark: encoding the final SSE event / /api/rss/fetch body for a
+1000-article payload.
+
+    pydantic     FetchArticlesResponse(articles=[Article(**a)]) + json.dumps (before)
+    json         json.dumps(ensure_ascii=False, default=json_default) + encode
+    orjson       services.fast_json with orjson (when installed)
+
+Run from the backend/ directory:
+    cd backend && python3 benchmarks/bench_json_serialization.py [articles]
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from routes.news import Article, FetchArticlesResponse  # noqa: E402
+from services import fast_json  # noqa: E402
+from services.article_record import ArticleRecord  # noqa: E402
+
+SOURCES = ["DÂN TRÍ", "LAO ĐỘNG", "VOV", "TUỔI TRẺ"]
+CATEGORIES = ["KINH TẾ", "XÃ HỘI", "PHÁP LUẬT", "THẾ GIỚI"]
+
+
+def _records(count: int):
+    records = []
+    for i in range(count):
+        record = ArticleRecord(
+            f"https://x.vn/bai-viet-so-{i}.html",
+            f"Tiêu đề bài viết số {i}: giá vàng, lãi suất và thị trường chứng khoán",
+            CATEGORIES[i % 4],
+            "07:00 16/03/2026",
+            SOURCES[i % 4],
+            f"https://x.vn/img/{i}.jpg",
+            description="Mô tả ngắn gọn của bài viết với tiếng Việt có dấu đầy đủ. " * 3,
+        )
+        record.update(group_id=f"nhom_{i // 3}", is_master=i % 3 == 0, duplicate_count=2 if i % 3 == 0 else 0,
+                      event_summary="Tóm tắt sự kiện", official_source_link=None)
+        records.append(record)
+    return records
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    records = _records(count)
+    dicts = [r.to_dict() for r in records]
+    event = {"step": "complete", "status": "done", "articles": records}
+
+    candidates = {
+        "pydantic": lambda: json.dumps(
+            {**event, "articles": FetchArticlesResponse(articles=[Article(**a) for a in dicts]).model_dump()["articles"]},
+            ensure_ascii=False,
+        ).encode("utf-8"),
+        "json": lambda: fast_json.get_dumps("json")(event),
+    }
+    if fast_json.ORJSON_AVAILABLE:
+        candidates["orjson"] = lambda: fast_json.get_dumps("orjson")(event)
+
+    expected = json.loads(candidates["pydantic"]())
+    print(f"{count} articles, complete event")
+    print(f"{'serializer':<12}{'ms':>8}{'KB':>8}{'speedup':>9}")
+    baseline = None
+    for name, fn in candidates.items():
+        assert json.loads(fn()) == expected, f"{name}: output differs"
+        ms = min(timeit.repeat(fn, number=10, repeat=5)) / 10 * 1e3
+        baseline = baseline or ms
+        print(f"{name:<12}{ms:>8.2f}{len(fn()) / 1024:>8.0f}{baseline / ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: event-loop stall while many feeds are parsed at once.
+
+Parses N copies of the fixture feeds concurrently through
+FeedParser.parse_async with each FEED_PARSE_EXECUTOR mode, while a 10 ms
+ticker (an SSE heartbeat stand-in) records the worst delay it sees.
+
+Run from the backend/ directory:
+    cd backend && python3 benchmarks/bench_parse_executor.py [feeds]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.feed_parser import (  # noqa: E402
+    ENGINE_LXML,
+    EXECUTOR_OFF,
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    FeedParser,
+    ParseExecutor,
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+FIXTURES = ["dantri_feed.xml", "atom_feed.xml", "hanoimoi_feed.xml"]
+TICK = 0.01
+
+
+async def _run(parser: FeedParser, bodies) -> tuple:
+    worst_lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal worst_lag
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            worst_lag = max(worst_lag, time.perf_counter() - start - TICK)
+
+    tick_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    feeds = await asyncio.gather(*(parser.parse_async(body) for body in bodies))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick_task
+    return elapsed, worst_lag, sum(len(f.entries) for f in feeds)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    contents = []
+    for name in FIXTURES:
+        with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+            contents.append(f.read())
+    bodies = [contents[i % len(contents)] for i in range(count)]
+
+    print(f"{count} feeds, {sum(map(len, bodies)) / 1e6:.1f} MB, {os.cpu_count()} CPUs")
+    print(f"{'mode':<10}{'workers':>8}{'wall ms':>10}{'max lag ms':>12}{'entries':>9}")
+    for mode in (EXECUTOR_OFF, EXECUTOR_THREAD, EXECUTOR_PROCESS):
+        executor = ParseExecutor(mode, min_bytes=0)
+        parser = FeedParser(ENGINE_LXML, executor=executor)
+        try:
+            if executor.enabled:
+                # Warm the pool (process start-up is not what we measure)
+                asyncio.run(_run(parser, bodies[:executor.workers]))
+            elapsed, lag, entries = asyncio.run(_run(parser, bodies))
+        finally:
+            executor.shutdown()
+        workers = executor.workers if executor.enabled else 0
+        print(f"{mode:<10}{workers:>8}{elapsed * 1e3:>10.1f}{lag * 1e3:>12.1f}{entries:>9}")
+
+
+if __name__ == "__main__":
+    main()
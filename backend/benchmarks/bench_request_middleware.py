@@ -0,0 +1,93 @@
+"""
+Micro-benchmark: requests/second on GET /health through the request-logging
+middleware, in-process (httpx ASGITransport, no network).
+
+    basehttp     former @app.middleware("http") request_db_logging_middleware (before)
+    asgi         services.request_logging.RequestLoggingMiddleware (after)
+    none         no logging middleware (ceiling)
+
+Both variants do the same work (request id, ContextVar, latency, log call);
+app_logger output is raised to WARNING so console I/O doesn't dominate.
+
+Run from the backend/ directory:
+    cd backend && python3 benchmarks/bench_request_middleware.py [requests] [concurrency]
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+
+from services.app_logger import logger  # noqa: E402
+from services.request_context import request_id_var  # noqa: E402
+from services.request_logging import RequestLoggingMiddleware  # noqa: E402
+
+
+def _app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
+
+    if variant == "asgi":
+        app.add_middleware(RequestLoggingMiddleware)
+    elif variant == "basehttp":
+        # Request id / latency / log path of the old middleware (DB logging off in both)
+        @app.middleware("http")
+        async def request_db_logging_middleware(request: Request, call_next):
+            request_id = request.headers.get("x-request-id") or uuid.uuid4().hex
+            start = time.perf_counter()
+            ctx_token = request_id_var.set(request_id)
+            xff = request.headers.get("x-forwarded-for")
+            client_ip = xff.split(",")[0].strip()[:128] if xff else (request.client.host if request.client else None)
+            try:
+                response = await call_next(request)
+                latency_ms = int((time.perf_counter() - start) * 1000)
+                response.headers["X-Request-ID"] = request_id
+                logger.info(
+                    "%s %s %s %dms", request.method, str(request.url.path), response.status_code, latency_ms,
+                    extra={"client_ip": client_ip, "request_id": request_id},
+                )
+                return response
+            finally:
+                request_id_var.reset(ctx_token)
+    return app
+
+
+async def _rps(app: FastAPI, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(n: int) -> None:
+            for _ in range(n):
+                r = await client.get("/health")
+                assert r.status_code == 200
+
+        await worker(50)  # warm-up
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+        return (requests // concurrency) * concurrency / (time.perf_counter() - start)
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    logger.setLevel(logging.WARNING)
+
+    print(f"GET /health, {requests} requests, concurrency {concurrency}")
+    print(f"{'middleware':<12}{'req/s':>10}{'speedup':>9}")
+    baseline = None
+    for variant in ("basehttp", "asgi", "none"):
+        rps = max(asyncio.run(_rps(_app(variant), requests, concurrency)) for _ in range(3))
+        baseline = baseline or rps
+        print(f"{variant:<12}{rps:>10.0f}{rps / baseline:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
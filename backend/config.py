@@ -55,6 +55,126 @@ class Settings:
     SUMMARIZER_MAX_CONCURRENCY: int = int(os.getenv("SUMMARIZER_MAX_CONCURRENCY", "4"))
     SUMMARIZER_BATCH_SIZE: int = int(os.getenv("SUMMARIZER_BATCH_SIZE", "4"))
 
+    # Central crawl scheduler (services/crawl_scheduler.py) — applies to every
+    # outbound crawl request (RSS, VOV detail pages, article HTML).
+    # - CRAWL_MAX_IN_FLIGHT: global cap on concurrent crawl requests
+    # - CRAWL_PER_HOST_CONCURRENCY: default concurrent requests per host
+    # - CRAWL_HOST_MIN_INTERVAL_MS: minimum gap between request starts on one host
+    # - CRAWL_HOST_LIMITS: per-host overrides, e.g. "vov.vn=8,dantri.com.vn=2"
+    #   (defaults per newspaper are declared in services/source_registry.py)
+    CRAWL_MAX_IN_FLIGHT: int = int(os.getenv("CRAWL_MAX_IN_FLIGHT", "16"))
+    CRAWL_PER_HOST_CONCURRENCY: int = int(os.getenv("CRAWL_PER_HOST_CONCURRENCY", "4"))
+    CRAWL_HOST_MIN_INTERVAL_MS: int = int(os.getenv("CRAWL_HOST_MIN_INTERVAL_MS", "100"))
+    CRAWL_HOST_LIMITS: str = os.getenv("CRAWL_HOST_LIMITS", "")
+    # Low-priority crawl budget (background article prefetch): never more than
+    # CRAWL_LOW_PRIORITY_MAX_IN_FLIGHT slots overall / CRAWL_LOW_PRIORITY_PER_HOST per host,
+    # and only when no normal request is waiting for the capacity.
+    CRAWL_LOW_PRIORITY_MAX_IN_FLIGHT: int = int(os.getenv("CRAWL_LOW_PRIORITY_MAX_IN_FLIGHT", "4"))
+    CRAWL_LOW_PRIORITY_PER_HOST: int = int(os.getenv("CRAWL_LOW_PRIORITY_PER_HOST", "1"))
+
+    # Article prefetch (services/article_prefetcher.py): while dedup/verification
+    # runs, fetch + extract master articles into the article cache so that
+    # summarization starts with content already local.
+    ARTICLE_PREFETCH_ENABLED: bool = os.getenv("ARTICLE_PREFETCH_ENABLED", "true").lower() in ("1", "true", "yes", "on")
+    ARTICLE_PREFETCH_MAX_PER_RUN: int = int(os.getenv("ARTICLE_PREFETCH_MAX_PER_RUN", "60"))
+    ARTICLE_CACHE_TTL_SEC: int = int(os.getenv("ARTICLE_CACHE_TTL_SEC", "1800"))
+    ARTICLE_CACHE_MAX_ENTRIES: int = int(os.getenv("ARTICLE_CACHE_MAX_ENTRIES", "300"))
+
+    # Persistent crawl cache (SQLite) for facts that never change, e.g. VOV
+    # article published_time. Empty = backend/.cache/cache.sqlite3.
+    # On read-only filesystems (Vercel) point this at /tmp/... or it falls back to memory.
+    CACHE_DB_PATH: str = os.getenv("CACHE_DB_PATH", "")
+    # Bounds per namespace: rows older than the max age (days since first written)
+    # are ignored and pruned on write, and at most CACHE_MAX_ROWS newest rows are kept.
+    # Per-namespace override: "vov_published_time=30,article_category=90".
+    # CACHE_MEMORY_MAX_ENTRIES bounds the in-memory fallback (LRU).
+    CACHE_MAX_AGE_DAYS: float = float(os.getenv("CACHE_MAX_AGE_DAYS", "90"))
+    CACHE_NAMESPACE_MAX_AGE_DAYS: str = os.getenv("CACHE_NAMESPACE_MAX_AGE_DAYS", "vov_published_time=30")
+    CACHE_MAX_ROWS: int = int(os.getenv("CACHE_MAX_ROWS", "50000"))
+    CACHE_MEMORY_MAX_ENTRIES: int = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "20000"))
+
+    # Feed parsing engine (services/feed_parser.py)
+    # - "lxml": streaming lxml iterparse, falls back to feedparser on malformed XML
+    # - "feedparser": always use feedparser (previous behaviour)
+    FEED_PARSER_ENGINE: str = os.getenv("FEED_PARSER_ENGINE", "lxml").lower()
+
+    # Off-loop feed parsing (FeedParser.parse_async)
+    # - FEED_PARSE_EXECUTOR: "thread" | "process" | "off" (always parse on the event loop)
+    # - FEED_PARSE_WORKERS: pool size, 0 = from CPU count
+    # - FEED_PARSE_OFFLOAD_MIN_BYTES: smaller bodies are parsed inline
+    FEED_PARSE_EXECUTOR: str = os.getenv("FEED_PARSE_EXECUTOR", "thread").lower()
+    FEED_PARSE_WORKERS: int = int(os.getenv("FEED_PARSE_WORKERS", "0"))
+    FEED_PARSE_OFFLOAD_MIN_BYTES: int = int(os.getenv("FEED_PARSE_OFFLOAD_MIN_BYTES", str(16 * 1024)))
+
+    # Early termination when scanning reverse-chronological feeds:
+    # stop after FEED_EARLY_STOP_AFTER consecutive entries older than
+    # (window start - FEED_EARLY_STOP_MARGIN_MIN). 0 disables early stop.
+    FEED_EARLY_STOP_AFTER: int = int(os.getenv("FEED_EARLY_STOP_AFTER", "5"))
+    FEED_EARLY_STOP_MARGIN_MIN: int = int(os.getenv("FEED_EARLY_STOP_MARGIN_MIN", "60"))
+
+    # Request-level result cache for /api/rss/fetch(_stream) (services/response_cache.py).
+    # Identical requests share one computation; finished results are kept for
+    # FETCH_CACHE_TTL_TODAY_SEC when the date is today (articles keep arriving)
+    # and FETCH_CACHE_TTL_PAST_SEC for past dates. Bounded by entry count and by the
+    # bytes of recorded events (FETCH_CACHE_MAX_BYTES, least recently used dropped first).
+    FETCH_CACHE_ENABLED: bool = os.getenv("FETCH_CACHE_ENABLED", "true").lower() in ("1", "true", "yes", "on")
+    FETCH_CACHE_TTL_TODAY_SEC: int = int(os.getenv("FETCH_CACHE_TTL_TODAY_SEC", "300"))
+    FETCH_CACHE_TTL_PAST_SEC: int = int(os.getenv("FETCH_CACHE_TTL_PAST_SEC", str(60 * 60 * 24)))
+    FETCH_CACHE_MAX_ENTRIES: int = int(os.getenv("FETCH_CACHE_MAX_ENTRIES", "64"))
+    FETCH_CACHE_MAX_BYTES: int = int(os.getenv("FETCH_CACHE_MAX_BYTES", str(128 * 1024 * 1024)))
+
+    # Asynchronous summarization jobs (services/summarize_jobs.py, /api/jobs/*)
+    # - JOBS_DB_PATH: SQLite file for jobs + their event logs; empty = backend/.cache/jobs.sqlite3.
+    #   May be shared by several workers: startup cleanup only fails jobs whose owner
+    #   process (host:pid) is gone; jobs of a dead process on another host stay queued/running.
+    # - JOB_WORKERS: jobs processed concurrently (articles are still bounded by SUMMARIZER_MAX_CONCURRENCY)
+    # - JOB_RETENTION_SEC: finished jobs older than this are purged (0 = keep forever)
+    JOBS_DB_PATH: str = os.getenv("JOBS_DB_PATH", "")
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_RETENTION_SEC: int = int(os.getenv("JOB_RETENTION_SEC", str(60 * 60 * 24 * 7)))
+
+    # Streaming download caps (services/stream_fetch.py). Pages are decoded
+    # incrementally; article reads also stop once the per-site body container
+    # has closed, so per-article memory stays bounded. 0 = no cap.
+    ARTICLE_MAX_BYTES: int = int(os.getenv("ARTICLE_MAX_BYTES", str(1024 * 1024)))
+    FEED_MAX_BYTES: int = int(os.getenv("FEED_MAX_BYTES", str(5 * 1024 * 1024)))
+
+    # Batched article categorization (services/article_categorizer.py)
+    # - CATEGORIZE_BATCH_SIZE: titles+descriptions classified per LLM call
+    # - CATEGORIZE_MAX_CONCURRENCY: LLM calls in flight across both categorizers
+    #   (services/ai_limiter.py; separate from the crawl scheduler's caps)
+    # Results are cached per URL in the persistent cache (namespace "article_category").
+    CATEGORIZE_BATCH_SIZE: int = int(os.getenv("CATEGORIZE_BATCH_SIZE", "20"))
+    CATEGORIZE_MAX_CONCURRENCY: int = int(os.getenv("CATEGORIZE_MAX_CONCURRENCY", "3"))
+
+    # Local naive Bayes category classifier (services/category_classifier.py).
+    # Predictions at or above the confidence threshold skip the LLM.
+    # Off by default: the shipped model is trained on the seed corpus only; enable it
+    # after retraining on archived articles with a threshold picked from `evaluate`.
+    # CATEGORY_MODEL_PATH empty = backend/models/category_nb.json; a missing file disables it.
+    CATEGORY_CLASSIFIER_ENABLED: bool = os.getenv("CATEGORY_CLASSIFIER_ENABLED", "false").lower() in ("1", "true", "yes", "on")
+    CATEGORY_MODEL_PATH: str = os.getenv("CATEGORY_MODEL_PATH", "")
+    CATEGORY_CLASSIFIER_MIN_CONFIDENCE: float = float(os.getenv("CATEGORY_CLASSIFIER_MIN_CONFIDENCE", "0.98"))
+
+    # /api/articles/categorize (services/categorizer.py)
+    # - "local": parse URLs + category metadata with regexes, LLM only for unresolved lines
+    # - "llm": send the whole text to the LLM (previous behaviour)
+    CATEGORIZE_MODE: str = os.getenv("CATEGORIZE_MODE", "local").lower()
+
+    # Serializer for SSE / NDJSON events and /api/rss/fetch (services/fast_json.py)
+    # - "auto": orjson when installed, else json; "orjson" | "json" to force one
+    JSON_SERIALIZER: str = os.getenv("JSON_SERIALIZER", "auto").lower()
+
+    # Response compression (services/compression.py): gzip, or br when brotli is installed
+    # - COMPRESSION_MIN_BYTES: non-streamed bodies smaller than this are sent as-is
+    # - COMPRESSION_ROUTES: per-route mode overrides, e.g. "/api/jobs=off,/api/rss/fetch=buffer"
+    #   (flush = per-event flush for SSE/NDJSON, buffer = compress whole body, off)
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes", "on")
+    COMPRESSION_MIN_BYTES: int = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+    COMPRESSION_ROUTES: str = os.getenv("COMPRESSION_ROUTES", "")
+
     # -----------------------------------------------------------------------
     # Auth (cookie session)
     # -----------------------------------------------------------------------
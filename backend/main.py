@@ -1,19 +1,18 @@
 import asyncio
-import time
-import uuid
-from typing import Optional
 
 from fastapi import FastAPI
-from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
 from routes.news import router as news_router
 from routes.auth import router as auth_router
+from routes.jobs import router as jobs_router
 from config import settings
 
-from services.request_db_logger import init_db_pool, log_request_to_db, new_request_id
-from services.request_context import set_request_id, get_request_id
-from services.app_logger import logger
+from services.request_db_logger import init_db_pool
 from services.auth_store import ensure_tables as ensure_auth_tables, seed_admin_if_missing
+from services.summarize_jobs import summarize_jobs
+from services.feed_parser import feed_parser
+from services.compression import CompressionMiddleware, parse_route_modes
+from services.request_logging import RequestLoggingMiddleware
 
 app = FastAPI(
     title="News Aggregator API",
@@ -39,9 +38,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON / SSE / NDJSON responses (SSE events are flushed one by one)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_BYTES,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        routes=parse_route_modes(settings.COMPRESSION_ROUTES),
+    )
+
+# Request id + access log (pure ASGI, added last → outermost, streams untouched)
+app.add_middleware(RequestLoggingMiddleware)
+
 # Register routes
 app.include_router(news_router)
 app.include_router(auth_router)
+app.include_router(jobs_router)
 
 
 @app.on_event("startup")
@@ -67,102 +80,19 @@ async def _init_logging_db() -> None:
         # Do not crash the API startup if auth seeding fails.
         pass
 
-
-@app.middleware("http")
-async def request_db_logging_middleware(request: Request, call_next):
-    request_id = request.headers.get("x-request-id") or uuid.uuid4().hex
-    start = time.perf_counter()
-
-    # Set request id in ContextVar for correlation across async steps.
-    ctx_token = set_request_id(request_id)
-
-    # Prefer proxy-provided IP if present.
-    xff = request.headers.get("x-forwarded-for")
-    client_ip: Optional[str] = None
-    if xff:
-        client_ip = xff.split(",")[0].strip()[:128]
-    elif request.client and request.client.host:
-        client_ip = request.client.host[:128]
-
-    user_agent = request.headers.get("user-agent", "")
-
+    # Summarization jobs left unfinished by a previous process cannot resume
+    # (API keys are never persisted) — fail them so clients stop waiting.
+    # Jobs of other live workers sharing JOBS_DB_PATH are left alone.
     try:
-        response = await call_next(request)
-        latency_ms = int((time.perf_counter() - start) * 1000)
-
-        # Ensure correlation id is visible to the client.
-        response.headers["X-Request-ID"] = request_id
-
-        # Log request summary at INFO level (does not read body — safe for streaming).
-        logger.info(
-            "%s %s %s %dms",
-            request.method,
-            str(request.url.path),
-            response.status_code,
-            latency_ms,
-            extra={
-                "method": request.method,
-                "path": str(request.url.path),
-                "status_code": response.status_code,
-                "latency_ms": latency_ms,
-                "client_ip": client_ip,
-                "request_id": request_id,
-            },
-        )
+        await summarize_jobs.fail_interrupted()
+    except Exception:
+        pass
 
-        asyncio.create_task(
-            log_request_to_db(
-                request_id=request_id,
-                method=request.method,
-                path=str(request.url.path),
-                client_ip=client_ip,
-                user_agent=user_agent,
-                status_code=response.status_code,
-                latency_ms=latency_ms,
-                error_message=None,
-            )
-        )
-        return response
-    except Exception as exc:
-        latency_ms = int((time.perf_counter() - start) * 1000)
-
-        # Log error with traceback + correlation fields.
-        logger.error(
-            "Unhandled exception: %s %s — %s",
-            request.method,
-            str(request.url.path),
-            exc,
-            exc_info=True,
-            extra={
-                "method": request.method,
-                "path": str(request.url.path),
-                "latency_ms": latency_ms,
-                "client_ip": client_ip,
-                "request_id": request_id,
-            },
-        )
 
-        asyncio.create_task(
-            log_request_to_db(
-                request_id=request_id,
-                method=request.method,
-                path=str(request.url.path),
-                client_ip=client_ip,
-                user_agent=user_agent,
-                status_code=500,
-                latency_ms=latency_ms,
-                error_message=str(exc)[:1000],
-            )
-        )
-        raise
-    finally:
-        # Reset ContextVar to avoid leak between requests in the same thread/task.
-        from contextvars import copy_context  # noqa: F401 – just ensure reset happens
-        try:
-            from services.request_context import request_id_var
-            request_id_var.reset(ctx_token)
-        except Exception:
-            pass
+@app.on_event("shutdown")
+async def _shutdown_parse_executor() -> None:
+    if feed_parser.executor is not None:
+        feed_parser.executor.shutdown()
 
 
 @app.get("/")
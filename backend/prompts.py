@@ -50,6 +50,23 @@ Dưới đây là tổng hợp toàn bộ link tin tức tìm thấy:
 ..."""
 
 
+# Chỉ dùng cho các dòng mà bộ phân tích cục bộ không phân loại được (Categorizer, CATEGORIZE_MODE=local)
+CATEGORIZE_LINES_PROMPT = """Phân loại TỪNG dòng tin tức dưới đây vào 1 trong 4 nhóm.
+
+# MÃ NHÓM
+- KT = Kinh tế: Tài chính, Kinh doanh, Thị trường, Bất động sản, Tiền tệ, Doanh nghiệp
+- XH = Xã hội: Thời sự, Chính trị, Y tế, Giáo dục, Đời sống, Giao thông, Môi trường, Văn hóa
+- TG = Thế giới: Tin quốc tế, Ngoại giao, Quân sự thế giới
+- PL = Pháp luật: An ninh, Trật tự, Hình sự, Tòa án, Vụ án
+
+# CÁC DÒNG (số thứ tự | nội dung)
+{lines}
+
+# ĐẦU RA
+Chỉ trả về MỘT object JSON trên một dòng, khóa là số thứ tự, giá trị là mã nhóm, không giải thích.
+Ví dụ: {{"1":"KT","2":"TG"}}
+"""
+
 # Prompt cho việc tóm tắt bài viết
 SUMMARIZE_PROMPT = """# VAI TRÒ
 Bạn là một Chuyên gia Tổng hợp Tin tức. Nhiệm vụ của bạn là đọc nội dung các bài viết, trích xuất tiêu đề chính xác và tóm tắt nội dung.
@@ -142,6 +159,23 @@ PHÁP LUẬT
 """
 
 
+# Phân loại nhiều bài trong 1 lần gọi (ArticleCategorizer.categorize_articles_batch)
+ARTICLE_BATCH_CATEGORIZE_PROMPT = """Bạn là chuyên gia phân loại tin tức. Phân loại TỪNG bài viết dưới đây vào đúng 1 trong 4 chuyên mục.
+
+# MÃ CHUYÊN MỤC
+- KT = KINH TẾ: Kinh doanh, Thương mại, Doanh nghiệp, Xuất nhập khẩu, Sản xuất, Công nghiệp, Nông nghiệp, Du lịch, Khởi nghiệp
+- TC = TÀI CHÍNH: Ngân hàng, Chứng khoán, Bất động sản, Tiền tệ, Đầu tư, Thuế, Bảo hiểm, Vàng
+- XH = XÃ HỘI: Thời sự, Chính trị, Y tế, Giáo dục, Đời sống, Giao thông, Môi trường, Văn hóa, Thể thao, Giải trí, Khoa học
+- PL = PHÁP LUẬT: An ninh, Trật tự, Hình sự, Tòa án, Vụ án, Tội phạm, Cảnh sát, Luật pháp
+
+# DANH SÁCH BÀI VIẾT (số thứ tự | tiêu đề | mô tả)
+{articles}
+
+# ĐẦU RA
+Chỉ trả về MỘT object JSON trên một dòng, khóa là số thứ tự, giá trị là mã chuyên mục, không giải thích.
+Ví dụ: {{"1":"KT","2":"XH","3":"PL"}}
+"""
+
 # Prompt tóm tắt từng bài viết đơn lẻ (cho xử lý song song)
 
 
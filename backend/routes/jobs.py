@@ -0,0 +1,84 @@
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from routes.news import SummarizeRequest, _articles_metadata, _resolve_api_key
+from services.app_logger import logger
+from services.job_store import job_store
+from services.request_context import get_request_id
+from services.summarize_jobs import summarize_jobs
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: str  # queued | running | done | failed
+    total: int
+    completed: int
+    events: int  # number of events so far — resume streaming with ?offset=
+    result: Optional[str] = None
+    error: Optional[str] = None
+
+
+async def _job_response(job: dict) -> JobResponse:
+    return JobResponse(
+        job_id=job["id"],
+        kind=job["kind"],
+        status=job["status"],
+        total=job["total"],
+        completed=job["completed"],
+        events=await job_store.aevent_count(job["id"]),
+        result=job["result"],
+        error=job["error"],
+    )
+
+
+@router.post("/summarize", response_model=JobResponse, status_code=202)
+async def create_summarize_job(
+    request: SummarizeRequest,
+    x_api_key: Optional[str] = Header(None)
+):
+    """
+    Create an asynchronous summarization job (same body as /api/articles/summarize).
+    Poll GET /api/jobs/{job_id} or stream GET /api/jobs/{job_id}/stream?offset=N.
+    """
+    job = await summarize_jobs.submit(
+        request.urls,
+        _articles_metadata(request),
+        api_key=_resolve_api_key(x_api_key),
+    )
+    logger.info(
+        "jobs.created",
+        extra={"event": "jobs.created", "request_id": get_request_id(), "job_id": job["id"], "urls_count": len(request.urls)}
+    )
+    return await _job_response(job)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """Job status, progress counters and (when done) the final summary."""
+    job = await job_store.aget(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return await _job_response(job)
+
+
+@router.get("/{job_id}/stream")
+async def stream_job(job_id: str, offset: int = Query(0, ge=0)):
+    """
+    NDJSON stream of the job's events starting at `offset` (each line has its
+    "seq"); follows the job live until it finishes. Reconnect with
+    offset = last seq + 1 to resume without losing anything.
+    """
+    if await job_store.aget(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_generator():
+        async for line in summarize_jobs.tail(job_id, offset):
+            yield line + "\n"
+
+    return StreamingResponse(event_generator(), media_type="application/x-ndjson")
@@ -1,18 +1,19 @@
-from fastapi import APIRouter, HTTPException, Header, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Header, Query, Response, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
 import json
 import asyncio
 from services.rss_matcher import rss_matcher
-from services.rss_fetcher import rss_fetcher
 from services.categorizer import categorizer
 from services.summarizer import summarizer
 from services.article_categorizer import article_categorizer
-from services.dedup_service import dedup_service
-from services.nhandan_fetcher import nhandan_fetcher
+from services.pipeline import CATEGORY_DONE, FETCH_DONE, SOURCE_DONE, news_pipeline, order_by_sources
+from services.response_cache import fetch_cache_key, fetch_cache_ttl, fetch_result_cache
 from services.app_logger import logger
 from services.request_context import get_request_id
+from services.fast_json import ORJSONResponse, ndjson_line
+from services.article_pages import DEFAULT_LIMIT, MAX_LIMIT, ArticleQuery, ArticleQueryError, page_articles
 
 import httpx
 from config import settings
@@ -90,6 +91,21 @@ class SummarizeResponse(BaseModel):
     summary: str
 
 
+def _articles_metadata(request: SummarizeRequest) -> dict:
+    """Per-URL metadata (keyed by URL without trailing slash) for the summarizer."""
+    articles_metadata = {}
+    for article in request.articles:
+        clean_url = article.url.strip().rstrip("/")
+        articles_metadata[clean_url] = {
+            "source": article.source,
+            "category": article.category,
+            "title": article.title,
+            "description": article.description or "",
+            "event_summary": article.event_summary or "",
+        }
+    return articles_metadata
+
+
 @router.post("/rss/match", response_model=MatchRSSResponse)
 async def match_rss_feeds(request: MatchRSSRequest):
     """
@@ -103,6 +119,104 @@ async def match_rss_feeds(request: MatchRSSRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _fetch_events(request: FetchArticlesRequest, api_key: Optional[str], dedup: bool, verify: bool):
+    """
+    Fetch → (dedup → verification) pipeline as SSE event dicts.
+    Runs inside a response-cache flight, so it is shared by identical requests.
+    """
+    try:
+        _rid = get_request_id()
+        logger.info(
+            "stream.sse.started",
+            extra={"event": "stream.sse.started", "request_id": _rid, "rss_urls_count": len(request.rss_urls)}
+        )
+
+        # Step 1: Fetch RSS
+        logger.info("stream.sse.step", extra={"event": "fetch_rss", "status": "running", "request_id": _rid})
+        yield {'step': 'fetch_rss', 'status': 'running', 'message': f'Đang tải từ {len(request.rss_urls)} nguồn RSS...'}
+        # Pipelined: each category is deduped + verified as soon as its sources finish
+        if dedup:
+            logger.info("stream.sse.step", extra={"event": "dedup", "status": "running", "request_id": _rid})
+            yield {'step': 'dedup', 'status': 'running', 'message': 'Đang phân tích trùng lặp (AI) theo từng chuyên mục...'}
+        if verify:
+            logger.info("stream.sse.step", extra={"event": "verification", "status": "running", "request_id": _rid})
+            yield {'step': 'verification', 'status': 'running', 'message': 'Đang xác thực Báo Nhân Dân...'}
+
+        fetched_count = 0
+        total_sources = len(dict.fromkeys(request.rss_urls))
+        sources_done = 0
+        by_category = {}
+        async for event in news_pipeline.run(
+            rss_urls=request.rss_urls,
+            target_date=request.date,
+            time_range=request.time_range,
+            api_key=api_key,
+            dedup=dedup,
+            verify=verify,
+        ):
+            if event.kind == SOURCE_DONE:
+                # Stream each source's articles as soon as that source finishes
+                sources_done += 1
+                fetched_count += len(event.articles)
+                yield {'step': 'articles_partial', 'status': 'running', 'source': event.source, 'sources_done': sources_done, 'sources_total': total_sources, 'articles': event.articles, 'message': f'Đã tải {sources_done}/{total_sources} nguồn ({fetched_count} bài)'}
+            elif event.kind == FETCH_DONE:
+                logger.info("stream.sse.step", extra={"event": "fetch_rss", "status": "done", "articles_count": fetched_count, "request_id": _rid})
+                yield {'step': 'fetch_rss', 'status': 'done', 'message': f'✅ Đã tải {fetched_count} bài viết'}
+            elif event.kind == CATEGORY_DONE:
+                by_category.setdefault(event.category, []).extend(event.articles)
+                yield {'step': 'category_done', 'status': 'done', 'category': event.category, 'articles_count': len(event.articles), 'message': f'✅ {event.category}: {len(event.articles)} bài'}
+
+        articles = order_by_sources(request.rss_urls, by_category)
+
+        # Step 2: Deduplication
+        if dedup:
+            # Count duplicates
+            duplicate_count = sum(1 for a in articles if a.get('duplicate_count', 0) > 0)
+            logger.info("stream.sse.step", extra={"event": "dedup", "status": "done", "duplicate_count": duplicate_count, "request_id": _rid})
+            yield {'step': 'dedup', 'status': 'done', 'message': f'✅ Tìm thấy {duplicate_count} nhóm trùng lặp'}
+        else:
+            logger.debug("stream.sse.step", extra={"event": "dedup", "status": "skipped", "request_id": _rid})
+            yield {'step': 'dedup', 'status': 'skipped', 'message': '⊘ Bỏ qua phân tích trùng lặp'}
+
+        # Step 3: Nhan Dan Verification
+        if verify:
+            verified_count = sum(1 for a in articles if a.get('official_source_link'))
+            logger.info("stream.sse.step", extra={"event": "verification", "status": "done", "verified_count": verified_count, "request_id": _rid})
+            yield {'step': 'verification', 'status': 'done', 'message': f'✅ Tìm thấy {verified_count} bài trên Báo Nhân Dân'}
+        else:
+            logger.debug("stream.sse.step", extra={"event": "verification", "status": "skipped", "request_id": _rid})
+            yield {'step': 'verification', 'status': 'skipped', 'message': '⊘ Bỏ qua xác thực'}
+
+        # Final: Send articles (serialization errors are turned into an 'error' event by the flight)
+        logger.info("stream.sse.step", extra={"event": "complete", "status": "done", "articles_count": len(articles), "request_id": _rid})
+        yield {'step': 'complete', 'status': 'done', 'articles': articles}
+
+    except Exception as e:
+        logger.error(
+            "stream.sse.error",
+            extra={"event": "stream.sse.error", "request_id": get_request_id(), "error": str(e)}
+        )
+        yield {'step': 'error', 'status': 'error', 'message': str(e)}
+
+
+def _start_fetch(request: FetchArticlesRequest, api_key: Optional[str], dedup: bool, verify: bool):
+    """Join / replay / start the shared computation for this request (see services/response_cache.py)."""
+    key = fetch_cache_key(
+        request.rss_urls, request.date, request.time_range,
+        settings.AI_PROVIDER, api_key, dedup, verify,
+    )
+    flight, cache_status = fetch_result_cache.get_or_start(
+        key,
+        fetch_cache_ttl(request.date),
+        lambda: _fetch_events(request, api_key, dedup, verify),
+    )
+    logger.info(
+        "rss.fetch.cache",
+        extra={"event": "rss.fetch.cache", "request_id": get_request_id(), "cache": cache_status}
+    )
+    return flight, cache_status
+
+
 @router.post("/rss/fetch", response_model=FetchArticlesResponse)
 async def fetch_articles(
     request: FetchArticlesRequest,
@@ -113,30 +227,18 @@ async def fetch_articles(
     Category is automatically extracted from RSS URL path
     Phase 2: Apply duplicate detection and Nhan Dan verification
     """
-    try:
-        # Fetch and filter articles (category extracted from RSS URL)
-        articles = await rss_fetcher.fetch_and_filter(
-            rss_urls=request.rss_urls,
-            target_date=request.date,
-            time_range=request.time_range
-        )
-        
-        # Phase 2: Semantic duplicate detection (RE-ENABLED with advanced prompt)
-        if len(articles) > 1:
-            articles = await dedup_service.cluster_articles_semantically(
-                articles,
-                api_key=_resolve_gemini_key(x_api_key)
-            )
-
-        # Phase 2: Check Nhan Dan official coverage (ENABLED)
-        articles = await nhandan_fetcher.check_official_coverage(
-            articles,
-            api_key=_resolve_gemini_key(x_api_key)
-        )
-        
-        return FetchArticlesResponse(articles=articles)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # Fetch and filter articles (category extracted from RSS URL), then
+    # Phase 2 per category, pipelined: semantic dedup → Nhan Dan verification
+    flight, cache_status = _start_fetch(request, _resolve_gemini_key(x_api_key), dedup=True, verify=True)
+    await flight.wait()
+    if flight.error is not None or flight.result is None:
+        raise HTTPException(status_code=500, detail=flight.error or "Fetch failed")
+
+    # ArticleRecords serialize straight to the Article shape — no per-article pydantic rebuild
+    return ORJSONResponse(
+        {"articles": flight.result},
+        headers={"X-Cache": cache_status, "X-Result-Set": flight.set_id},
+    )
 
 
 @router.post("/rss/fetch_stream")
@@ -147,93 +249,54 @@ async def fetch_articles_stream(
     """
     Streaming version of /rss/fetch with real-time progress updates
     Returns Server-Sent Events (SSE) stream
-    """
-    async def event_generator():
-        try:
-            _rid = get_request_id()
-            logger.info(
-                "stream.sse.started",
-                extra={"event": "stream.sse.started", "request_id": _rid, "rss_urls_count": len(request.rss_urls)}
-            )
-            # Step 1: Fetch RSS
-            logger.info("stream.sse.step", extra={"event": "fetch_rss", "status": "running", "request_id": _rid})
-            yield f"data: {json.dumps({'step': 'fetch_rss', 'status': 'running', 'message': f'Đang tải từ {len(request.rss_urls)} nguồn RSS...'}, ensure_ascii=False)}\n\n"
-
-            articles = await rss_fetcher.fetch_and_filter(
-                rss_urls=request.rss_urls,
-                target_date=request.date,
-                time_range=request.time_range
-            )
-            
-            logger.info("stream.sse.step", extra={"event": "fetch_rss", "status": "done", "articles_count": len(articles), "request_id": _rid})
-            yield f"data: {json.dumps({'step': 'fetch_rss', 'status': 'done', 'message': f'✅ Đã tải {len(articles)} bài viết'}, ensure_ascii=False)}\n\n"
 
-            # Step 2: Deduplication
-            if len(articles) > 1 and _resolve_gemini_key(x_api_key):
-                logger.info("stream.sse.step", extra={"event": "dedup", "status": "running", "request_id": _rid})
-                yield f"data: {json.dumps({'step': 'dedup', 'status': 'running', 'message': 'Đang phân tích trùng lặp (AI)...'}, ensure_ascii=False)}\n\n"
-
-                articles = await dedup_service.cluster_articles_semantically(
-                    articles,
-                    api_key=_resolve_gemini_key(x_api_key)
-                )
+    Identical concurrent requests share one computation; finished results are
+    replayed from the response cache (X-Cache: MISS / JOIN / HIT).
+    The 'complete' event carries "result_set" for GET /api/articles.
+    """
+    api_key = _resolve_gemini_key(x_api_key)
+    use_ai = bool(api_key)
+    flight, cache_status = _start_fetch(request, api_key, dedup=use_ai, verify=use_ai)
 
-                # Count duplicates
-                duplicate_count = sum(1 for a in articles if a.get('duplicate_count', 0) > 0)
-                logger.info("stream.sse.step", extra={"event": "dedup", "status": "done", "duplicate_count": duplicate_count, "request_id": _rid})
-                yield f"data: {json.dumps({'step': 'dedup', 'status': 'done', 'message': f'✅ Tìm thấy {duplicate_count} nhóm trùng lặp'}, ensure_ascii=False)}\n\n"
-            else:
-                logger.debug("stream.sse.step", extra={"event": "dedup", "status": "skipped", "request_id": _rid})
-                yield f"data: {json.dumps({'step': 'dedup', 'status': 'skipped', 'message': '⊘ Bỏ qua phân tích trùng lặp'}, ensure_ascii=False)}\n\n"
-
-            # Step 3: Nhan Dan Verification
-            if _resolve_gemini_key(x_api_key):
-                logger.info("stream.sse.step", extra={"event": "verification", "status": "running", "request_id": _rid})
-                yield f"data: {json.dumps({'step': 'verification', 'status': 'running', 'message': 'Đang xác thực Báo Nhân Dân...'}, ensure_ascii=False)}\n\n"
-
-                articles = await nhandan_fetcher.check_official_coverage(
-                    articles,
-                    api_key=_resolve_gemini_key(x_api_key)
-                )
-                
-                verified_count = sum(1 for a in articles if a.get('official_source_link'))
-                logger.info("stream.sse.step", extra={"event": "verification", "status": "done", "verified_count": verified_count, "request_id": _rid})
-                yield f"data: {json.dumps({'step': 'verification', 'status': 'done', 'message': f'✅ Tìm thấy {verified_count} bài trên Báo Nhân Dân'}, ensure_ascii=False)}\n\n"
-            else:
-                logger.debug("stream.sse.step", extra={"event": "verification", "status": "skipped", "request_id": _rid})
-                yield f"data: {json.dumps({'step': 'verification', 'status': 'skipped', 'message': '⊘ Bỏ qua xác thực'}, ensure_ascii=False)}\n\n"
-            
-            # Final: Send articles (ensure proper serialization)
-            try:
-                articles_json = json.dumps({
-                    'step': 'complete',
-                    'status': 'done',
-                    'articles': articles
-                }, ensure_ascii=False, default=str)
-                logger.info("stream.sse.step", extra={"event": "complete", "status": "done", "articles_count": len(articles), "request_id": _rid})
-                yield f"data: {articles_json}\n\n"
-            except Exception as json_err:
-                print(f"JSON serialization error: {json_err}")
-                yield f"data: {json.dumps({'step': 'error', 'status': 'error', 'message': f'Lỗi serialize: {str(json_err)}'}, ensure_ascii=False)}\n\n"
-
-        except Exception as e:
-            logger.error(
-                "stream.sse.error",
-                extra={"event": "stream.sse.error", "request_id": get_request_id(), "error": str(e)}
-            )
-            yield f"data: {json.dumps({'step': 'error', 'status': 'error', 'message': str(e)}, ensure_ascii=False)}\n\n"
-    
     return StreamingResponse(
-        event_generator(),
+        flight.tail(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"  # Disable nginx buffering
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+            "X-Cache": cache_status,
+            "X-Result-Set": flight.set_id,
         }
     )
 
 
+@router.get("/articles")
+async def list_articles(
+    result_set: str = Query(..., alias="set", description="X-Result-Set / 'result_set' of a fetch"),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    fields: Optional[str] = Query(None, description="Comma-separated, e.g. url,title,source"),
+    source: Optional[str] = Query(None, description="Comma-separated source names"),
+    category: Optional[str] = Query(None, description="Comma-separated categories"),
+    is_master: Optional[bool] = None,
+):
+    """
+    Cursor-paginated read over a fetched article set, with field projection
+    and filters (see services/article_pages.py). 404 once the set has expired
+    from the response cache — fetch again to get a new one.
+    """
+    articles = fetch_result_cache.result_set(result_set)
+    if articles is None:
+        raise HTTPException(status_code=404, detail="Result set not found or expired")
+    try:
+        query = ArticleQuery.parse(fields=fields, source=source, category=category, is_master=is_master)
+        page, next_cursor = page_articles(articles, query, cursor=cursor, limit=limit)
+    except ArticleQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse({"articles": page, "next_cursor": next_cursor})
+
+
 @router.post("/articles/categorize", response_model=CategorizeResponse)
 async def categorize_articles(request: CategorizeRequest):
     """
@@ -258,17 +321,7 @@ async def summarize_articles(
     """
     try:
         # Pass article metadata if available
-        articles_metadata = {}
-        if request.articles:
-            for article in request.articles:
-                clean = article.url.strip().rstrip("/")
-                articles_metadata[clean] = {
-                    "source": article.source,
-                    "category": article.category,
-                    "title": article.title,
-                    "description": article.description or "",
-                    "event_summary": article.event_summary or "",
-                }
+        articles_metadata = _articles_metadata(request)
         
         summary = await summarizer.summarize_articles(
             request.urls, 
@@ -298,17 +351,7 @@ async def summarize_articles_stream(
             extra={"event": "stream.ndjson.started", "request_id": _rid, "urls_count": len(request.urls)}
         )
         # Pass article metadata if available
-        articles_metadata = {}
-        if request.articles:
-            for article in request.articles:
-                clean_url = article.url.strip().rstrip("/")
-                articles_metadata[clean_url] = {
-                    "source": article.source,
-                    "category": article.category,
-                    "title": article.title,
-                    "description": article.description or "",
-                    "event_summary": article.event_summary or "",
-                }
+        articles_metadata = _articles_metadata(request)
 
         async for update in summarizer.summarize_articles_generator(
             request.urls,
@@ -325,7 +368,7 @@ async def summarize_articles_stream(
             elif update_type == "complete":
                 logger.info(
                     "stream.ndjson.complete",
-                    extra={"event": "stream.ndjson.complete", "request_id": _rid}
+                    extra={"event": "stream.ndjson.complete", "request_id": _rid, "retry_metrics": update.get("metrics")}
                 )
             elif update_type == "error":
                 logger.error(
@@ -334,7 +377,7 @@ async def summarize_articles_stream(
                            "error": update.get("message")}
                 )
             # Yield JSON line
-            yield json.dumps(update, ensure_ascii=False) + "\n"
+            yield ndjson_line(update)
 
     return StreamingResponse(event_generator(), media_type="application/x-ndjson")
             
@@ -0,0 +1,50 @@
+"""
+Concurrency limiter for outbound LLM calls.
+
+Kept apart from crawl_scheduler on purpose: AI calls must not count against
+the crawl cap (CRAWL_MAX_IN_FLIGHT) nor wait out the per-host politeness
+interval meant for news sites, and a categorize burst must not starve feed /
+article fetches (or the other way round). No pacing here — the provider's
+429s are handled by AI_RATE_LIMIT_RETRY.
+
+Usage:
+    from services.ai_limiter import ai_limiter
+
+    async with ai_limiter.slot():
+        response = await gemini_client.async_generate_content(...)
+
+ai_limiter (CATEGORIZE_MAX_CONCURRENCY) is shared by the batched categorizers,
+which call the server's key. The summarizer holds its own AILimiter
+(SUMMARIZER_MAX_CONCURRENCY) since it spends the caller's key.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from config import settings
+
+
+class AILimiter:
+    """At most *max_in_flight* LLM calls at once; waiters are served FIFO."""
+
+    def __init__(self, max_in_flight: int = 3):
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one LLM call slot for the duration of the block."""
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+
+
+ai_limiter = AILimiter(settings.CATEGORIZE_MAX_CONCURRENCY)
@@ -0,0 +1,61 @@
+"""
+In-process cache of extracted article content (URL → main text).
+
+Filled by the background prefetcher (services/article_prefetcher.py) while
+/api/rss/fetch is still deduplicating, and by the summarizer itself after a
+fetch; read by the summarizer before hitting the network.
+
+Usage:
+    from services.article_cache import article_cache
+
+    article_cache.set(url, extracted_text)
+    text = article_cache.get(url)   # None when missing / expired
+"""
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from config import settings
+
+
+def _normalize(url: str) -> str:
+    return url.strip().rstrip("/")
+
+
+class ArticleCache:
+    """Small TTL + LRU map; entries are plain strings."""
+
+    def __init__(self, ttl_sec: float = 1800, max_entries: int = 300):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def get(self, url: str) -> Optional[str]:
+        key = _normalize(url)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, content = entry
+        if time.monotonic() - stored_at > self.ttl_sec:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return content
+
+    def set(self, url: str, content: str) -> None:
+        if not content:
+            return
+        key = _normalize(url)
+        self._entries[key] = (time.monotonic(), content)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+article_cache = ArticleCache(settings.ARTICLE_CACHE_TTL_SEC, settings.ARTICLE_CACHE_MAX_ENTRIES)
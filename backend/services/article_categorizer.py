@@ -1,8 +1,28 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from config import settings
 from services.gemini_client import gemini_client
-from prompts import ARTICLE_CATEGORIZE_PROMPT
+from services.persistent_cache import persistent_cache
+from services.ai_limiter import ai_limiter
+from services.category_classifier import category_classifier
+from services.retry_policy import AI_RATE_LIMIT_RETRY
+from prompts import ARTICLE_CATEGORIZE_PROMPT, ARTICLE_BATCH_CATEGORIZE_PROMPT
 import asyncio
+import json
+import re
+
+# Category of a URL never changes once decided — cached across requests/restarts
+CATEGORY_CACHE_NS = "article_category"
+
+# Thinking models (default gemini-3-flash-preview) count thoughts against
+# maxOutputTokens; a budget sized for the JSON alone often comes back empty.
+# Unused budget costs nothing.
+THINKING_HEADROOM_TOKENS = 8192
+
+
+def batch_output_budget(items: int) -> int:
+    """maxOutputTokens for a batched classification reply of *items* entries."""
+    return 16 * items + 64 + THINKING_HEADROOM_TOKENS
+
 
 class ArticleCategorizer:
     """
@@ -11,6 +31,25 @@ class ArticleCategorizer:
     """
     
     VALID_CATEGORIES = ["KINH TẾ", "TÀI CHÍNH", "XÃ HỘI", "PHÁP LUẬT"]
+    # Compact codes used by the batched prompt
+    CATEGORY_CODES = {"KT": "KINH TẾ", "TC": "TÀI CHÍNH", "XH": "XÃ HỘI", "PL": "PHÁP LUẬT"}
+
+    def __init__(self, cache=persistent_cache, batch_size: int = 20, classifier=category_classifier, limiter=ai_limiter):
+        self.cache = cache
+        # Local naive Bayes model: confident predictions skip the LLM
+        self.classifier = classifier
+        self.batch_size = max(1, batch_size)
+        # LLM calls in flight, shared across requests (CATEGORIZE_MAX_CONCURRENCY)
+        self.limiter = limiter
+
+    def _normalize_category(self, value) -> Optional[str]:
+        label = str(value or "").strip().upper()
+        if label in self.CATEGORY_CODES:
+            return self.CATEGORY_CODES[label]
+        for valid_cat in self.VALID_CATEGORIES:
+            if valid_cat in label:
+                return valid_cat
+        return None
     
     async def categorize_article(self, title: str, description: str) -> str:
         """
@@ -23,8 +62,11 @@ class ArticleCategorizer:
         Returns:
             One of: KINH TẾ, TÀI CHÍNH, XÃ HỘI, PHÁP LUẬT
         """
+        local = self._local_category(title, description)
+        if local:
+            return local
+
         # Clean description (remove HTML tags)
-        import re
         clean_desc = re.sub(r'<[^>]+>', '', description)
         
         # Create prompt
@@ -38,7 +80,7 @@ class ArticleCategorizer:
                 prompt=prompt,
                 model_name=settings.GEMINI_MODEL,
                 temperature=0,
-                max_tokens=50,
+                max_tokens=batch_output_budget(1),
             )
             
             # Clean and validate response
@@ -60,35 +102,123 @@ class ArticleCategorizer:
             print(f"Categorization error for '{title}': {str(e)}")
             return "XÃ HỘI"  # Default category on error
     
-    async def categorize_articles_batch(self, articles: List[Dict]) -> List[Dict]:
+    def _local_category(self, title: str, description: str) -> Optional[str]:
+        """Category from the local classifier when it is confident, else None."""
+        if self.classifier is None:
+            return None
+        prediction = self.classifier.predict(title or "", description or "")
+        if prediction is not None and prediction.confident:
+            return prediction.label
+        return None
+
+    def _parse_batch_response(self, response: str, count: int) -> Dict[int, str]:
+        """{"1": "KT", ...} (possibly wrapped in ```json fences) → {0: "KINH TẾ", ...}."""
+        match = re.search(r"\{.*\}", response or "", re.S)
+        if not match:
+            return {}
+        try:
+            data = json.loads(match.group(0))
+        except ValueError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        parsed: Dict[int, str] = {}
+        for key, value in data.items():
+            try:
+                index = int(str(key).strip()) - 1
+            except ValueError:
+                continue
+            category = self._normalize_category(value)
+            if 0 <= index < count and category:
+                parsed[index] = category
+        return parsed
+
+    async def _categorize_chunk(self, chunk: List[Dict]) -> List[Tuple[str, bool]]:
         """
-        Categorize multiple articles (process in batches to avoid rate limits)
-        
+        One LLM call for a chunk of articles → [(category, cacheable)].
+        Items the model skipped fall back to single calls (concurrently, under
+        the same limiter); those may be the error default, so they are not cached.
+        """
+        lines = []
+        for n, article in enumerate(chunk, 1):
+            title = " ".join(str(article.get('title', '')).split())
+            desc = " ".join(re.sub(r'<[^>]+>', ' ', str(article.get('description', ''))).split())
+            lines.append(f"{n} | {title} | {desc[:300]}")
+        prompt = ARTICLE_BATCH_CATEGORIZE_PROMPT.format(articles="\n".join(lines))
+
+        parsed: Dict[int, str] = {}
+        for attempt in range(AI_RATE_LIMIT_RETRY.attempts):
+            try:
+                async with self.limiter.slot():
+                    response = await gemini_client.async_generate_content(
+                        prompt=prompt,
+                        model_name=settings.GEMINI_MODEL,
+                        temperature=0,
+                        max_tokens=batch_output_budget(len(chunk)),
+                    )
+                parsed = self._parse_batch_response(response, len(chunk))
+                break
+            except Exception as e:
+                error = str(e)
+                if ("429" in error or "resource exhausted" in error.lower()) and attempt < AI_RATE_LIMIT_RETRY.attempts - 1:
+                    await AI_RATE_LIMIT_RETRY.sleep(attempt + 1)
+                    continue
+                print(f"Batch categorization error ({len(chunk)} bài): {error}")
+                break
+
+        missing = [index for index in range(len(chunk)) if index not in parsed]
+        fallbacks = await asyncio.gather(*[self._categorize_single(chunk[index]) for index in missing])
+        fallback_by_index = dict(zip(missing, fallbacks))
+        return [
+            (parsed[index], True) if index in parsed else (fallback_by_index[index], False)
+            for index in range(len(chunk))
+        ]
+
+    async def _categorize_single(self, article: Dict) -> str:
+        async with self.limiter.slot():
+            return await self.categorize_article(article.get('title', ''), article.get('description', ''))
+
+    async def categorize_articles_batch(self, articles: List[Dict], batch_size: Optional[int] = None) -> List[Dict]:
+        """
+        Categorize multiple articles: cached URLs and confident local predictions
+        first, the rest up to *batch_size* per LLM call, chunks run concurrently
+        (bounded by the shared AI limiter); per-URL LLM results are cached.
+
         Args:
-            articles: List of article dictionaries with 'title' and 'description'
-            
+            articles: List of article dictionaries with 'title', 'description' and 'url'
+            batch_size: articles per LLM call (default: CATEGORIZE_BATCH_SIZE)
+
         Returns:
             Same list with 'category' field updated
         """
-        categorized = []
-        
-        # Process in smaller batches with longer delays to avoid rate limits
-        batch_size = 3  # Reduced from 5 to 3
-        for i in range(0, len(articles), batch_size):
-            batch = articles[i:i + batch_size]
-            
-            for article in batch:
-                category = await self.categorize_article(
-                    article.get('title', ''),
-                    article.get('description', '')
-                )
+        batch_size = max(1, batch_size or self.batch_size)
+
+        urls = [article.get('url') or article.get('link') or "" for article in articles]
+        cached = await self.cache.aget_many(CATEGORY_CACHE_NS, [u for u in urls if u])
+        pending = []
+        for article, url in zip(articles, urls):
+            category = self._normalize_category(cached.get(url)) if url else None
+            if not category:
+                # Not cached: local predictions are cheap and track model retrains
+                category = self._local_category(article.get('title', ''), article.get('description', ''))
+            if category:
                 article['category'] = category
-                categorized.append(article)
-            
-            # Longer delay between batches (2 seconds)
-            if i + batch_size < len(articles):
-                await asyncio.sleep(2.0)
-        
-        return categorized
+            else:
+                pending.append((article, url))
+
+        if pending:
+            chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            results = await asyncio.gather(*[
+                self._categorize_chunk([article for article, _ in chunk]) for chunk in chunks
+            ])
+            new_entries = {}
+            for chunk, categories in zip(chunks, results):
+                for (article, url), (category, cacheable) in zip(chunk, categories):
+                    article['category'] = category
+                    if url and cacheable:
+                        new_entries[url] = category
+            await self.cache.aset_many(CATEGORY_CACHE_NS, new_entries)
+
+        return articles
 
-article_categorizer = ArticleCategorizer()
+article_categorizer = ArticleCategorizer(batch_size=settings.CATEGORIZE_BATCH_SIZE)
@@ -0,0 +1,113 @@
+"""
+Cursor pagination, filters and field projection over a fetched article set.
+
+/api/rss/fetch(_stream) return every article with every field in one
+response (~1 MB for a full day). GET /api/articles pages through the same
+result set (see response_cache: a random id per cached fetch) so a
+list view can load a few KB and fetch details lazily:
+
+    GET /api/articles?set=<id>&fields=url,title,source&source=VOV&is_master=true&limit=50
+    → {"articles": [...], "next_cursor": "MTAw"}     (null on the last page)
+
+The cursor is an opaque position in the (immutable) result set; filters are
+applied while scanning from it, so a page costs O(limit + skipped items).
+
+Usage:
+    query = ArticleQuery.parse(fields="url,title", source="VOV, DÂN TRÍ", is_master=True)
+    page, next_cursor = page_articles(articles, query, cursor=None, limit=50)
+"""
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+from services.article_record import ARTICLE_FIELDS, project
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class ArticleQueryError(ValueError):
+    """Invalid fields / cursor (reported as 400 by the route)."""
+
+
+def _folded_set(raw: Optional[str]) -> Optional[FrozenSet[str]]:
+    values = frozenset(v.strip().casefold() for v in (raw or "").split(",") if v.strip())
+    return values or None
+
+
+def encode_cursor(position: int) -> str:
+    return base64.urlsafe_b64encode(str(position).encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = int(raw.decode("ascii"))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ArticleQueryError(f"Invalid cursor: {cursor!r}")
+    if position < 0:
+        raise ArticleQueryError(f"Invalid cursor: {cursor!r}")
+    return position
+
+
+@dataclass(frozen=True)
+class ArticleQuery:
+    fields: Sequence[str] = ARTICLE_FIELDS
+    sources: Optional[FrozenSet[str]] = None      # casefolded, any of
+    categories: Optional[FrozenSet[str]] = None   # casefolded, any of
+    is_master: Optional[bool] = None
+
+    @classmethod
+    def parse(
+        cls,
+        fields: Optional[str] = None,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        is_master: Optional[bool] = None,
+    ) -> "ArticleQuery":
+        """Build from comma-separated query parameters; unknown field names raise ArticleQueryError."""
+        selected = tuple(dict.fromkeys(f.strip() for f in (fields or "").split(",") if f.strip()))
+        unknown = [f for f in selected if f not in ARTICLE_FIELDS]
+        if unknown:
+            raise ArticleQueryError(
+                f"Unknown fields: {', '.join(unknown)} (allowed: {', '.join(ARTICLE_FIELDS)})"
+            )
+        return cls(
+            fields=selected or ARTICLE_FIELDS,
+            sources=_folded_set(source),
+            categories=_folded_set(category),
+            is_master=is_master,
+        )
+
+    def matches(self, article: Mapping[str, Any]) -> bool:
+        if self.sources is not None and str(article.get("source", "")).casefold() not in self.sources:
+            return False
+        if self.categories is not None and str(article.get("category", "")).casefold() not in self.categories:
+            return False
+        if self.is_master is not None and bool(article.get("is_master", True)) != self.is_master:
+            return False
+        return True
+
+
+def page_articles(
+    articles: Sequence[Mapping[str, Any]],
+    query: ArticleQuery,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_LIMIT,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """One page of projected articles matching query, and the cursor of the next page (None at the end)."""
+    limit = max(1, min(int(limit), MAX_LIMIT))
+    position = decode_cursor(cursor)
+    page: List[Dict[str, Any]] = []
+    total = len(articles)
+    while position < total and len(page) < limit:
+        article = articles[position]
+        position += 1
+        if query.matches(article):
+            page.append(project(article, query.fields))
+    # Only hand out a cursor when something may follow
+    next_cursor = encode_cursor(position) if position < total else None
+    return page, next_cursor
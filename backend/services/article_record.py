@@ -0,0 +1,199 @@
+"""
+Compact article representation shared by fetch → dedup → verification → response.
+
+ArticleRecord is a __slots__ MutableMapping (interned source/category, lazily
+cleaned description), so pipeline code written for dicts keeps working;
+to_dict() / json_default() give serializers the routes.news.Article shape.
+"""
+import html
+import re
+import sys
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+_DOTS_RE = re.compile(r"\.{4,}$")
+_ELLIPSES_RE = re.compile(r"…{2,}$")
+
+
+def clean_description(raw_description: str) -> str:
+    """
+    Chuẩn hóa mô tả lấy từ RSS:
+    - Bỏ HTML tags
+    - Chuẩn hóa whitespace
+    - Tránh trường hợp dấu ba chấm bị lặp (....)
+    """
+    if not raw_description:
+        return ""
+
+    text = _TAG_RE.sub(" ", raw_description)
+    text = html.unescape(text)
+    text = _SPACE_RE.sub(" ", text).strip()
+
+    # Chuẩn hóa phần kết thúc nếu RSS đã cắt ngắn
+    text = _DOTS_RE.sub("…", text)
+    text = _ELLIPSES_RE.sub("…", text)
+    return text
+
+
+# Marks pipeline fields that have not been assigned yet ("key not in dict")
+_UNSET: Any = type("_Unset", (), {"__repr__": lambda self: "<unset>", "__slots__": ()})()
+
+# Fields set by dedup / verification, with the response default when unset
+_OPTIONAL_DEFAULTS: Dict[str, Any] = {
+    "group_id": "",
+    "is_master": True,
+    "duplicate_count": 0,
+    "event_summary": "",
+    "official_source_link": None,
+}
+# Dedup's exact-title pre-filter (never serialized)
+_PRIVATE_KEYS = {"_exact_duplicate_group": "exact_duplicate_group", "_is_exact_master": "is_exact_master"}
+_REQUIRED = ("url", "title", "category", "published_at", "description", "source", "thumbnail")
+# Response fields, in routes.news.Article order
+ARTICLE_FIELDS = _REQUIRED + tuple(_OPTIONAL_DEFAULTS)
+
+
+class ArticleRecord(MutableMapping):
+    __slots__ = (
+        "url", "title", "category", "published_at", "source", "thumbnail",
+        "_description", "_raw_description",
+        "group_id", "is_master", "duplicate_count", "event_summary", "official_source_link",
+        "exact_duplicate_group", "is_exact_master",
+    )
+
+    def __init__(
+        self,
+        url: str,
+        title: str,
+        category: str,
+        published_at: str,
+        source: str,
+        thumbnail: str = "",
+        description: Optional[str] = None,
+        raw_description: str = "",
+    ):
+        self.url = url
+        self.title = title
+        self.category = sys.intern(category)
+        self.published_at = published_at
+        self.source = sys.intern(source)
+        self.thumbnail = thumbnail
+        # description given = already clean; otherwise cleaned from raw on first read
+        self._description = description
+        self._raw_description = raw_description if description is None else ""
+        self.group_id = _UNSET
+        self.is_master = _UNSET
+        self.duplicate_count = _UNSET
+        self.event_summary = _UNSET
+        self.official_source_link = _UNSET
+        self.exact_duplicate_group = _UNSET
+        self.is_exact_master = _UNSET
+
+    @classmethod
+    def from_mapping(cls, data: Dict[str, Any]) -> "ArticleRecord":
+        record = cls(
+            data.get("url", ""),
+            data.get("title", ""),
+            data.get("category", ""),
+            data.get("published_at", ""),
+            data.get("source", ""),
+            data.get("thumbnail", "") or "",
+            description=data.get("description", "") or "",
+        )
+        for key in (*_OPTIONAL_DEFAULTS, *_PRIVATE_KEYS):
+            if key in data:
+                record[key] = data[key]
+        return record
+
+    @property
+    def description(self) -> str:
+        if self._description is None:
+            self._description = clean_description(self._raw_description)
+            self._raw_description = ""
+        return self._description
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
+        self._raw_description = ""
+
+    # ------------------------------------------------------------------
+    # Mapping interface (pipeline code written for dicts)
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _REQUIRED:
+            return getattr(self, key)
+        attr = _PRIVATE_KEYS.get(key, key)
+        if key in _OPTIONAL_DEFAULTS or key in _PRIVATE_KEYS:
+            value = getattr(self, attr)
+            if value is not _UNSET:
+                return value
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _REQUIRED or key in _OPTIONAL_DEFAULTS:
+            setattr(self, key, value)
+        elif key in _PRIVATE_KEYS:
+            setattr(self, _PRIVATE_KEYS[key], value)
+        else:
+            raise KeyError(f"ArticleRecord has no field {key!r}")
+
+    def __delitem__(self, key: str) -> None:
+        if key in _OPTIONAL_DEFAULTS or key in _PRIVATE_KEYS:
+            self[key]  # KeyError when unset, like dict
+            setattr(self, _PRIVATE_KEYS.get(key, key), _UNSET)
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _REQUIRED
+        for key in _OPTIONAL_DEFAULTS:
+            if getattr(self, key) is not _UNSET:
+                yield key
+        for key, attr in _PRIVATE_KEYS.items():
+            if getattr(self, attr) is not _UNSET:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"ArticleRecord(url={self.url!r}, source={self.source!r}, category={self.category!r})"
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Response shape: public fields only, unset pipeline fields filled with their defaults."""
+        group_id, is_master, duplicate_count = self.group_id, self.is_master, self.duplicate_count
+        event_summary, official_source_link = self.event_summary, self.official_source_link
+        return {
+            "url": self.url,
+            "title": self.title,
+            "category": self.category,
+            "published_at": self.published_at,
+            "description": self.description,
+            "source": self.source,
+            "thumbnail": self.thumbnail,
+            "group_id": "" if group_id is _UNSET else group_id,
+            "is_master": True if is_master is _UNSET else is_master,
+            "duplicate_count": 0 if duplicate_count is _UNSET else duplicate_count,
+            "event_summary": "" if event_summary is _UNSET else event_summary,
+            "official_source_link": None if official_source_link is _UNSET else official_source_link,
+        }
+
+
+def project(article: Mapping[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """Subset of the response shape (record or plain dict), unset fields filled with their defaults."""
+    return {name: article.get(name, _OPTIONAL_DEFAULTS.get(name)) for name in fields}
+
+
+def json_default(obj: Any) -> Any:
+    """`default=` hook for json / orjson: records serialize to their response shape, anything else is an error."""
+    if isinstance(obj, ArticleRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -1,36 +1,268 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+import asyncio
+import json
+import re
+import unicodedata
 from config import settings
 from services.gemini_client import gemini_client
-from prompts import CATEGORIZE_PROMPT
+from services.persistent_cache import persistent_cache
+from services.article_categorizer import CATEGORY_CACHE_NS, batch_output_budget
+from services.ai_limiter import ai_limiter
+from services.app_logger import logger
+from services.request_context import get_request_id
+from services.category_classifier import category_classifier, url_label
+from prompts import CATEGORIZE_PROMPT, CATEGORIZE_LINES_PROMPT
+
+# Sections of the /api/articles/categorize report, in output order
+SECTIONS = ["Kinh tế", "Xã hội", "Thế giới", "Pháp luật"]
+_SECTION_CODES = {"KT": "Kinh tế", "XH": "Xã hội", "TG": "Thế giới", "PL": "Pháp luật"}
+# Article labels (RSSFetcher / ArticleCategorizer) → report section
+_LABEL_TO_SECTION = {
+    "KINH TẾ": "Kinh tế",
+    "TÀI CHÍNH": "Kinh tế",
+    "XÃ HỘI": "Xã hội",
+    "THẾ GIỚI": "Thế giới",
+    "PHÁP LUẬT": "Pháp luật",
+}
+# Section decided for a URL by this endpoint's LLM fallback
+SECTION_CACHE_NS = "article_section"
+
+_URL_RE = re.compile(r"https?://[^\s<>\[\]()\"'`|]+")
+_URL_TRAILING = ".,;:!?»”’"
+_TAG_RE = re.compile(r"<[^>]+>")
+# Matched against diacritic-folded, lowercased text (see _fold)
+_METADATA_RE = re.compile(r"(?:chuyen muc|danh muc|category)\s*[:\-]?\s*([^|,;]+)")
+_ERROR_LINE_RE = re.compile(r"khong co bai|khong tim thay|loi khi|error")
+_RULE_RE = re.compile(r"^[-=*_\s]{3,}$")
+_SECTION_PATTERNS = [
+    ("Pháp luật", re.compile(r"\b(?:phap luat|an ninh|trat tu|hinh su|toa an|vu an)\b")),
+    ("Thế giới", re.compile(r"\b(?:the gioi|quoc te|ngoai giao)\b")),
+    ("Kinh tế", re.compile(r"\b(?:kinh te|kinh doanh|tai chinh|thi truong|bat dong san|tien te|doanh nghiep|chung khoan|ngan hang)\b")),
+    ("Xã hội", re.compile(r"\b(?:xa hoi|thoi su|chinh tri|y te|giao duc|doi song|giao thong|moi truong|van hoa)\b")),
+]
+
+
+def _fold(text: str) -> str:
+    """Lowercase, strip Vietnamese diacritics, slug separators → spaces ("Kinh-tế" → "kinh te")."""
+    text = unicodedata.normalize("NFD", text.lower().replace("đ", "d"))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return re.sub(r"[-_/]+", " ", text)
+
+
+def _section_from_text(text: str) -> Optional[str]:
+    folded = _fold(text)
+    for section, pattern in _SECTION_PATTERNS:
+        if pattern.search(folded):
+            return section
+    return None
+
 
 class Categorizer:
     """
     Categorizes articles into 4 main categories using Gemini AI
     Uses prompt from prompts.py file
+
+    CATEGORIZE_MODE=local (default) parses the input deterministically and
+    only asks the LLM about lines it cannot place (CATEGORIZE_BATCH_SIZE lines
+    per call); if some still go unanswered, the whole text goes through the
+    full LLM prompt instead.
     """
-    
+
+    def __init__(
+        self,
+        cache=persistent_cache,
+        classifier=category_classifier,
+        mode: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        limiter=ai_limiter,
+    ):
+        self.cache = cache
+        self.classifier = classifier
+        self.mode = mode
+        self.batch_size = max(1, batch_size or settings.CATEGORIZE_BATCH_SIZE)
+        # LLM calls in flight, shared with ArticleCategorizer
+        self.limiter = limiter
+
     async def categorize_articles(self, articles_text: str) -> str:
         """
         Categorize articles into: Xã hội, Kinh tế, Pháp luật, Thế giới
-        
+
         Args:
             articles_text: Raw text containing article URLs and metadata
-            
+
         Returns:
             Categorized article list as formatted text
         """
+        if (self.mode or settings.CATEGORIZE_MODE) == "llm":
+            return await self._categorize_with_llm(articles_text)
+        return await self.categorize_locally(articles_text)
+
+    async def _categorize_with_llm(self, articles_text: str) -> str:
         # Load prompt from prompts.py
         prompt = CATEGORIZE_PROMPT.format(articles_text=articles_text)
 
         try:
-            response = await gemini_client.async_generate_content(
-                prompt=prompt,
-                model_name=settings.GEMINI_MODEL,
-                temperature=0,
-                max_tokens=30000
-            )
+            async with self.limiter.slot():
+                response = await gemini_client.async_generate_content(
+                    prompt=prompt,
+                    model_name=settings.GEMINI_MODEL,
+                    temperature=0,
+                    max_tokens=30000
+                )
             return response
         except Exception as e:
             raise Exception(f"Categorization failed: {str(e)}")
 
+    # ------------------------------------------------------------------
+    # Deterministic mode
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def parse_lines(articles_text: str) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Extract (url, line text, section from metadata) in input order, URLs de-duplicated.
+
+        "Chuyên mục: X" on the URL's line wins; otherwise the last metadata /
+        short heading line above it ("## Kinh tế", "Chuyên mục Pháp luật") applies,
+        until a "---" rule.
+        """
+        entries: List[Tuple[str, str, Optional[str]]] = []
+        seen = set()
+        context: Optional[str] = None
+        for raw_line in (articles_text or "").splitlines():
+            line = _TAG_RE.sub(" ", raw_line).strip()
+            if not line:
+                continue
+            if _RULE_RE.match(line):
+                # "---" separates blocks: a heading above it no longer applies
+                context = None
+                continue
+            urls = [u.rstrip(_URL_TRAILING) for u in _URL_RE.findall(line)]
+            folded = _fold(line)
+            metadata = _METADATA_RE.search(folded)
+            line_section = _section_from_text(metadata.group(1)) if metadata else None
+            if not urls:
+                if _ERROR_LINE_RE.search(folded):
+                    continue
+                if line_section:
+                    context = line_section
+                elif len(line) <= 60 and (line.startswith("#") or line.endswith(":")):
+                    context = _section_from_text(line) or context
+                continue
+            text = _URL_RE.sub(" ", line).strip(" -|:")
+            for url in urls:
+                if url in seen:
+                    continue
+                seen.add(url)
+                entries.append((url, text, line_section or context))
+        return entries
+
+    def _resolve(self, url: str, text: str, section: Optional[str], cached: Dict[str, str], labels: Dict[str, str]) -> Optional[str]:
+        if section:
+            return section
+        if url in cached:
+            return cached[url]
+        if url in labels and labels[url] in _LABEL_TO_SECTION:
+            return _LABEL_TO_SECTION[labels[url]]
+        label = url_label(url, allowed=list(_LABEL_TO_SECTION))
+        if label:
+            return _LABEL_TO_SECTION[label]
+        if text and self.classifier is not None:
+            prediction = self.classifier.predict(text)
+            if prediction is not None and prediction.confident:
+                return _LABEL_TO_SECTION[prediction.label]
+        return None
+
+    async def _ask_llm(self, pending: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Unresolved lines → {url: section}: batch_size lines per LLM call, calls
+        run concurrently under the shared limiter; lines the model skipped are
+        asked once more. Lines still missing from the result went unanswered.
+        """
+        resolved = await self._ask_llm_batches(pending)
+        missing = [entry for entry in pending if entry[0] not in resolved]
+        if missing and len(missing) < len(pending):
+            resolved.update(await self._ask_llm_batches(missing))
+        return resolved
+
+    async def _ask_llm_batches(self, pending: List[Tuple[str, str]]) -> Dict[str, str]:
+        chunks = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        resolved: Dict[str, str] = {}
+        for answered in await asyncio.gather(*[self._ask_llm_chunk(chunk) for chunk in chunks]):
+            resolved.update(answered)
+        return resolved
+
+    async def _ask_llm_chunk(self, pending: List[Tuple[str, str]]) -> Dict[str, str]:
+        """One compact LLM call for a chunk of unresolved lines → {url: section}."""
+        lines = "\n".join(f"{n} | {text[:300]} {url}" for n, (url, text) in enumerate(pending, 1))
+        try:
+            async with self.limiter.slot():
+                response = await gemini_client.async_generate_content(
+                    prompt=CATEGORIZE_LINES_PROMPT.format(lines=lines),
+                    model_name=settings.GEMINI_MODEL,
+                    temperature=0,
+                    max_tokens=batch_output_budget(len(pending)),
+                )
+            match = re.search(r"\{.*\}", response or "", re.S)
+            data = json.loads(match.group(0)) if match else {}
+        except Exception as e:
+            logger.warning(
+                "categorize.lines.error",
+                extra={"event": "categorize.lines.error", "request_id": get_request_id(),
+                       "lines": len(pending), "error": str(e)},
+            )
+            return {}
+        resolved: Dict[str, str] = {}
+        for key, code in (data.items() if isinstance(data, dict) else []):
+            try:
+                index = int(str(key).strip()) - 1
+            except ValueError:
+                continue
+            section = _SECTION_CODES.get(str(code).strip().upper())
+            if section and 0 <= index < len(pending):
+                resolved[pending[index][0]] = section
+        return resolved
+
+    async def categorize_locally(self, articles_text: str) -> str:
+        """Same report as the LLM prompt's template, built from parsed URLs."""
+        entries = self.parse_lines(articles_text)
+        urls = [url for url, _, _ in entries]
+        cached = await self.cache.aget_many(SECTION_CACHE_NS, urls)
+        labels = await self.cache.aget_many(CATEGORY_CACHE_NS, urls)
+
+        grouped: Dict[str, List[str]] = {section: [] for section in SECTIONS}
+        assigned: Dict[str, str] = {}
+        pending: List[Tuple[str, str]] = []
+        for url, text, section in entries:
+            resolved = self._resolve(url, text, section, cached, labels)
+            if resolved:
+                assigned[url] = resolved
+            else:
+                pending.append((url, text))
+
+        if pending:
+            answered = await self._ask_llm(pending)
+            await self.cache.aset_many(SECTION_CACHE_NS, answered)
+            unanswered = len(pending) - len(answered)
+            if unanswered:
+                # Never guess a section: the full prompt categorizes everything (or raises)
+                logger.warning(
+                    "categorize.lines.fallback",
+                    extra={"event": "categorize.lines.fallback", "request_id": get_request_id(),
+                           "pending": len(pending), "unanswered": unanswered},
+                )
+                return await self._categorize_with_llm(articles_text)
+            assigned.update(answered)
+
+        for url in urls:
+            grouped[assigned[url]].append(url)
+
+        parts = ["Dưới đây là tổng hợp toàn bộ link tin tức tìm thấy:", ""]
+        for n, section in enumerate(SECTIONS, 1):
+            parts.append(f"## {n}. Chuyên mục {section} ({len(grouped[section])} bài)")
+            parts.extend(f"- {url}" for url in grouped[section])
+            parts.append("")
+        return "\n".join(parts).rstrip() + "\n"
+
+
 categorizer = Categorizer()
@@ -0,0 +1,294 @@
+"""
+Local category classifier (multinomial naive Bayes) for the 4 article labels.
+
+ArticleCategorizer used to spend an LLM round-trip per article just to pick
+one of KINH TẾ / TÀI CHÍNH / XÃ HỘI / PHÁP LUẬT. This model scores the
+title + description in-process (microseconds); only predictions below
+CATEGORY_CLASSIFIER_MIN_CONFIDENCE still go to the LLM.
+
+Off by default (CATEGORY_CLASSIFIER_ENABLED): the shipped model is trained on
+the 160-title seed corpus only (5-fold: confident_accuracy ~0.93, i.e. about
+one confident answer in 14 is wrong). Retrain on archived articles and pick
+the threshold from the held-out `evaluate` numbers before turning it on.
+
+Features: Vietnamese-normalized text (NFC, lowercase, HTML/punctuation
+stripped) → syllable unigrams + bigrams ("lãi suất" → "lãi", "suất",
+"lãi_suất"), since Vietnamese words are mostly two syllables.
+
+Training data is JSONL, one article per line:
+    {"title": ..., "description": ..., "category": "KINH TẾ"}
+    {"title": ..., "url": "https://laodong.vn/rss/kinh-doanh.rss"}   # labelled by feed URL
+Records without "category" are labelled with RSSFetcher._extract_category_from_url
+(only when the URL names one of the 4 labels). data/category_seed.jsonl is
+the hand-labelled seed corpus; append archived articles to improve it.
+
+CLI (from backend/):
+    python -m services.category_classifier train --data data/category_seed.jsonl --out models/category_nb.json
+    python -m services.category_classifier evaluate --data data/category_seed.jsonl --folds 5
+    python -m services.category_classifier predict "Giá vàng SJC lập kỷ lục mới"
+
+Usage:
+    from services.category_classifier import category_classifier
+
+    prediction = category_classifier.predict(title, description)   # None = disabled / model missing
+    if prediction and prediction.confident: ...
+"""
+import argparse
+import json
+import math
+import os
+import random
+import re
+import sys
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config import settings
+
+LABELS = ["KINH TẾ", "TÀI CHÍNH", "XÃ HỘI", "PHÁP LUẬT"]
+MODEL_VERSION = 1
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MODEL_PATH = os.path.join(_BACKEND_DIR, "models", "category_nb.json")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+_URL_SOCIAL_RE = re.compile(r"xa-?hoi|xa_hoi|doi-?song|thoi-?su")
+
+
+def tokenize(text: str) -> List[str]:
+    """NFC + lowercase syllables (HTML, digits and punctuation dropped)."""
+    text = unicodedata.normalize("NFC", _TAG_RE.sub(" ", text or "")).lower()
+    return _TOKEN_RE.findall(text)
+
+
+def features(title: str, description: str = "") -> List[str]:
+    syllables = tokenize(f"{title} . {description}")
+    return syllables + [f"{a}_{b}" for a, b in zip(syllables, syllables[1:])]
+
+
+@dataclass
+class Prediction:
+    label: str
+    confidence: float
+    confident: bool
+
+
+class NaiveBayesModel:
+    """Multinomial naive Bayes with Laplace smoothing; log-probabilities precomputed at load."""
+
+    def __init__(self, labels: Sequence[str], doc_counts: Dict[str, int], token_counts: Dict[str, Dict[str, int]], alpha: float = 1.0):
+        self.labels = list(labels)
+        self.doc_counts = dict(doc_counts)
+        self.token_counts = token_counts
+        self.alpha = alpha
+        vocab = set()
+        for counts in token_counts.values():
+            vocab.update(counts)
+        vocab_size = max(1, len(vocab))
+        total_docs = sum(doc_counts.values()) or 1
+        self._log_prior: Dict[str, float] = {}
+        # token → [log P(token | label) for label in labels]
+        self._log_likelihood: Dict[str, List[float]] = {}
+        denominators = {}
+        for label in self.labels:
+            self._log_prior[label] = math.log((doc_counts.get(label, 0) + alpha) / (total_docs + alpha * len(self.labels)))
+            denominators[label] = sum(token_counts.get(label, {}).values()) + alpha * vocab_size
+        for token in vocab:
+            self._log_likelihood[token] = [
+                math.log((token_counts.get(label, {}).get(token, 0) + alpha) / denominators[label])
+                for label in self.labels
+            ]
+
+    @classmethod
+    def fit(cls, samples: Iterable[Tuple[List[str], str]], alpha: float = 1.0) -> "NaiveBayesModel":
+        doc_counts: Counter = Counter()
+        token_counts: Dict[str, Counter] = {label: Counter() for label in LABELS}
+        for tokens, label in samples:
+            doc_counts[label] += 1
+            token_counts.setdefault(label, Counter()).update(tokens)
+        return cls(LABELS, doc_counts, {k: dict(v) for k, v in token_counts.items()}, alpha)
+
+    def scores(self, tokens: Iterable[str]) -> List[Tuple[str, float]]:
+        """[(label, probability)] sorted best first. Tokens outside the vocabulary are ignored."""
+        log_scores = [self._log_prior[label] for label in self.labels]
+        for token in tokens:
+            row = self._log_likelihood.get(token)
+            if row is None:
+                continue
+            for i, value in enumerate(row):
+                log_scores[i] += value
+        top = max(log_scores)
+        exp = [math.exp(s - top) for s in log_scores]
+        total = sum(exp)
+        return sorted(((label, e / total) for label, e in zip(self.labels, exp)), key=lambda x: -x[1])
+
+    def knows_any(self, tokens: Iterable[str]) -> bool:
+        return any(token in self._log_likelihood for token in tokens)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": MODEL_VERSION,
+            "alpha": self.alpha,
+            "labels": self.labels,
+            "doc_counts": self.doc_counts,
+            "token_counts": self.token_counts,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NaiveBayesModel":
+        if data.get("version") != MODEL_VERSION:
+            raise ValueError(f"Unsupported model version: {data.get('version')}")
+        return cls(data["labels"], data["doc_counts"], data["token_counts"], data.get("alpha", 1.0))
+
+
+class CategoryClassifier:
+    """Loads the serialized model lazily; predict() returns None when disabled or no model is available."""
+
+    def __init__(self, model_path: str = DEFAULT_MODEL_PATH, min_confidence: float = 0.98, enabled: bool = True):
+        self.model_path = model_path
+        self.min_confidence = min_confidence
+        self.enabled = enabled
+        self._model: Optional[NaiveBayesModel] = None
+        self._loaded = False
+
+    @property
+    def model(self) -> Optional[NaiveBayesModel]:
+        if not self._loaded:
+            self._loaded = True
+            try:
+                with open(self.model_path, encoding="utf-8") as f:
+                    self._model = NaiveBayesModel.from_dict(json.load(f))
+            except FileNotFoundError:
+                self._model = None
+            except Exception as e:
+                print(f"⚠️ Category model unavailable ({self.model_path}): {e}")
+                self._model = None
+        return self._model
+
+    def set_model(self, model: Optional[NaiveBayesModel]) -> None:
+        self._model = model
+        self._loaded = True
+
+    def predict(self, title: str, description: str = "") -> Optional[Prediction]:
+        if not self.enabled:
+            return None
+        model = self.model
+        if model is None:
+            return None
+        tokens = features(title, description)
+        if not model.knows_any(tokens):
+            return None
+        label, confidence = model.scores(tokens)[0]
+        return Prediction(label, confidence, confidence >= self.min_confidence)
+
+
+# ---------------------------------------------------------------------------
+# Training / evaluation
+# ---------------------------------------------------------------------------
+
+def url_label(url: str, allowed: Sequence[str] = LABELS) -> Optional[str]:
+    """Label implied by a feed/article URL; None when the URL does not name one of *allowed*."""
+    from services.rss_fetcher import rss_fetcher
+
+    label = rss_fetcher._extract_category_from_url(url)
+    if label not in allowed:
+        return None
+    # XÃ HỘI is also _extract_category_from_url's default — require evidence in the URL
+    if label == "XÃ HỘI" and not _URL_SOCIAL_RE.search(url.lower()):
+        return None
+    return label
+
+
+def load_samples(paths: Sequence[str]) -> List[Tuple[List[str], str]]:
+    samples: List[Tuple[List[str], str]] = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                label = (record.get("category") or "").strip().upper()
+                if label not in LABELS:
+                    url = record.get("feed") or record.get("rss_url") or record.get("url") or ""
+                    label = url_label(url) if url else None
+                if label:
+                    samples.append((features(record.get("title", ""), record.get("description", "")), label))
+    return samples
+
+
+def cross_validate(samples: List[Tuple[List[str], str]], folds: int, min_confidence: float, seed: int = 13) -> dict:
+    shuffled = list(samples)
+    random.Random(seed).shuffle(shuffled)
+    folds = max(2, min(folds, len(shuffled)))
+    correct = confident = confident_correct = 0
+    for k in range(folds):
+        test = shuffled[k::folds]
+        train = [s for i, s in enumerate(shuffled) if i % folds != k]
+        model = NaiveBayesModel.fit(train)
+        for tokens, label in test:
+            predicted, confidence = model.scores(tokens)[0]
+            correct += predicted == label
+            if confidence >= min_confidence:
+                confident += 1
+                confident_correct += predicted == label
+    n = len(shuffled) or 1
+    return {
+        "samples": len(shuffled),
+        "accuracy": round(correct / n, 3),
+        "coverage": round(confident / n, 3),
+        "confident_accuracy": round(confident_correct / confident, 3) if confident else None,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m services.category_classifier", description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    train = sub.add_parser("train", help="train on JSONL data and write the model file")
+    train.add_argument("--data", nargs="+", required=True)
+    train.add_argument("--out", default=DEFAULT_MODEL_PATH)
+    train.add_argument("--alpha", type=float, default=1.0)
+
+    evaluate = sub.add_parser("evaluate", help="k-fold cross-validation on JSONL data")
+    evaluate.add_argument("--data", nargs="+", required=True)
+    evaluate.add_argument("--folds", type=int, default=5)
+    evaluate.add_argument("--min-confidence", type=float, default=settings.CATEGORY_CLASSIFIER_MIN_CONFIDENCE)
+
+    predict = sub.add_parser("predict", help="classify a title with the saved model")
+    predict.add_argument("title")
+    predict.add_argument("--description", default="")
+    predict.add_argument("--model", default=DEFAULT_MODEL_PATH)
+
+    args = parser.parse_args(argv)
+    if args.command == "train":
+        samples = load_samples(args.data)
+        model = NaiveBayesModel.fit(samples, alpha=args.alpha)
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(model.to_dict(), f, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        print(f"✅ Trained on {len(samples)} articles → {args.out}")
+    elif args.command == "evaluate":
+        print(json.dumps(cross_validate(load_samples(args.data), args.folds, args.min_confidence), ensure_ascii=False))
+    else:
+        classifier = CategoryClassifier(args.model, min_confidence=0.0)
+        prediction = classifier.predict(args.title, args.description)
+        if prediction is None:
+            print("No model / no known tokens")
+            return 1
+        print(f"{prediction.label} ({prediction.confidence:.3f})")
+    return 0
+
+
+category_classifier = CategoryClassifier(
+    settings.CATEGORY_MODEL_PATH or DEFAULT_MODEL_PATH,
+    min_confidence=settings.CATEGORY_CLASSIFIER_MIN_CONFIDENCE,
+    enabled=settings.CATEGORY_CLASSIFIER_ENABLED,
+)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
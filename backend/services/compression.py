@@ -0,0 +1,217 @@
+"""
+Streaming-safe response compression (pure ASGI middleware).
+
+The final SSE "complete" event and /api/rss/fetch bodies are MBs of
+Vietnamese text; Starlette's GZipMiddleware buffers streams, which would hold
+back SSE progress events. Here the encoder is flushed per body chunk for
+streams instead:
+
+    flush    compress + Z_SYNC_FLUSH (brotli: flush()) after every chunk, so
+             each SSE/NDJSON event reaches the client as soon as it is sent
+    buffer   compress normally, finish at the end (regular JSON responses);
+             single-chunk bodies under COMPRESSION_MIN_BYTES are sent as-is
+    off      never compress
+
+Mode per route comes from COMPRESSION_ROUTES ("/api/jobs=off,/api/rss=flush",
+longest path prefix wins); unlisted routes get "flush" for text/event-stream
+and application/x-ndjson, "buffer" for other text / JSON types.
+
+Encoding is negotiated from Accept-Encoding: br (when the optional `brotli`
+or `brotlicffi` package is installed) > gzip > identity.
+"""
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import brotli as _brotli
+except ImportError:
+    try:
+        import brotlicffi as _brotli
+    except ImportError:
+        _brotli = None
+
+BROTLI_AVAILABLE = _brotli is not None
+
+MODE_FLUSH = "flush"
+MODE_BUFFER = "buffer"
+MODE_OFF = "off"
+
+_STREAM_TYPES = ("text/event-stream", "application/x-ndjson")
+_COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "application/x-ndjson")
+
+
+def parse_route_modes(raw: str) -> Dict[str, str]:
+    """Parse "/api/jobs=off,/api/rss=flush" into {"/api/jobs": "off", "/api/rss": "flush"}."""
+    modes: Dict[str, str] = {}
+    for part in (raw or "").split(","):
+        if "=" not in part:
+            continue
+        path, _, mode = part.partition("=")
+        mode = mode.strip().lower()
+        if path.strip() and mode in (MODE_FLUSH, MODE_BUFFER, MODE_OFF):
+            modes[path.strip()] = mode
+    return modes
+
+
+def negotiate_encoding(accept_encoding: str, brotli: bool = BROTLI_AVAILABLE) -> Optional[str]:
+    """Best supported coding from an Accept-Encoding header (q=0 excluded)."""
+    accepted: Dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = q
+    candidates = (["br"] if brotli else []) + ["gzip"]
+    for coding in candidates:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > 0:
+            return coding
+    return None
+
+
+class _Encoder:
+    """Incremental encoder: compress(data, flush) → bytes; finish() → trailing bytes."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = _brotli.Compressor(quality=brotli_quality)
+            # brotli exposes process(); brotlicffi exposes compress()
+            self._br_process = getattr(self._br, "process", None) or self._br.compress
+        else:
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        if self.encoding == "br":
+            out = self._br_process(data) if data else b""
+            return out + self._br.flush() if flush else out
+        out = self._gz.compress(data)
+        return out + self._gz.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._br.finish()
+        return self._gz.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        routes: Optional[Dict[str, str]] = None,
+        brotli: bool = BROTLI_AVAILABLE,
+    ):
+        self.app = app
+        self.minimum_size = max(0, int(minimum_size))
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        # Longest prefix first
+        self.routes: List[Tuple[str, str]] = sorted((routes or {}).items(), key=lambda x: -len(x[0]))
+        self.brotli = brotli and BROTLI_AVAILABLE
+
+    def route_mode(self, path: str) -> Optional[str]:
+        for prefix, mode in self.routes:
+            if path.startswith(prefix):
+                return mode
+        return None
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope.get("method") == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        route_mode = self.route_mode(scope.get("path", ""))
+        if route_mode == MODE_OFF:
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for name, value in scope.get("headers", ()):
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = negotiate_encoding(accept, brotli=self.brotli)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressedResponder(self, send, encoding, route_mode)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressedResponder:
+    def __init__(self, middleware: CompressionMiddleware, send: Callable, encoding: str, route_mode: Optional[str]):
+        self.middleware = middleware
+        self._send = send
+        self.encoding = encoding
+        self.route_mode = route_mode
+        self.mode: Optional[str] = None  # decided at http.response.start
+        self.start_message: Optional[dict] = None
+        self.encoder: Optional[_Encoder] = None
+
+    def _decide(self, message: dict) -> str:
+        if message["status"] < 200 or message["status"] in (204, 304):
+            return MODE_OFF
+        content_type = ""
+        for name, value in message.get("headers", ()):
+            if name == b"content-encoding":
+                return MODE_OFF  # already encoded
+            if name == b"content-type":
+                content_type = value.decode("latin-1").lower()
+        if not content_type.startswith(_COMPRESSIBLE_TYPES):
+            return MODE_OFF
+        if self.route_mode is not None:
+            return self.route_mode
+        return MODE_FLUSH if content_type.startswith(_STREAM_TYPES) else MODE_BUFFER
+
+    def _encoded_start(self) -> dict:
+        headers = [
+            (name, value) for name, value in self.start_message.get("headers", ())
+            if name != b"content-length"
+        ]
+        headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+        vary = [value for name, value in headers if name == b"vary"]
+        if not any(b"accept-encoding" in v.lower() for v in vary):
+            headers.append((b"vary", b"Accept-Encoding"))
+        self.encoder = _Encoder(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+        return {**self.start_message, "headers": headers}
+
+    async def send(self, message: dict) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            self.mode = self._decide(message)
+            if self.mode == MODE_OFF:
+                await self._send(message)
+            elif self.mode == MODE_FLUSH:
+                # Streams: headers go out now, events are not held back
+                await self._send(self._encoded_start())
+            return
+        if message_type != "http.response.body" or self.mode == MODE_OFF:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.encoder is None:
+            # MODE_BUFFER, first body chunk: small complete bodies are not worth it
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.mode = MODE_OFF
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+            await self._send(self._encoded_start())
+
+        if more_body:
+            data = self.encoder.compress(body, flush=self.mode == MODE_FLUSH)
+            if data:
+                await self._send({"type": "http.response.body", "body": data, "more_body": True})
+        else:
+            data = self.encoder.compress(body, flush=False) + self.encoder.finish()
+            await self._send({"type": "http.response.body", "body": data, "more_body": False})
@@ -0,0 +1,257 @@
+"""
+Central crawl scheduler for all outbound crawl traffic (RSS feeds, VOV detail
+pages, article HTML for the summarizer).
+
+- Per-host concurrency limit + politeness interval between request starts
+  (avoids bursts that get us 403/429 from dantri/vnexpress).
+- Global in-flight cap across every caller.
+- Fair queuing: when slots are contended, waiters are served round-robin per
+  request id, so one large request cannot starve a concurrent editor.
+- Low priority (background prefetch): served only when no normal waiter can
+  use the free capacity, and capped globally / per host so interactive
+  crawls always keep headroom.
+
+Usage:
+    from services.crawl_scheduler import crawl_scheduler
+
+    async with crawl_scheduler.slot(url):
+        resp = await client.get(url)
+
+Do not nest slots for the same URL (e.g. hold a slot and call a helper that
+acquires one again) — take the slot at the outermost call-site only.
+"""
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional
+from urllib.parse import urlparse
+
+from config import settings
+from services.request_context import get_request_id
+
+_DEFAULT_OWNER = "_default"
+
+
+def host_key(url: str) -> str:
+    """Normalize a URL to the host used for per-host accounting ("www." stripped)."""
+    try:
+        host = (urlparse(url).hostname or "").lower()
+    except ValueError:
+        host = ""
+    if host.startswith("www."):
+        host = host[4:]
+    return host or url
+
+
+def parse_host_limits(raw: str) -> Dict[str, int]:
+    """Parse "vov.vn=8,dantri.com.vn=2" into {"vov.vn": 8, "dantri.com.vn": 2}."""
+    limits: Dict[str, int] = {}
+    for part in (raw or "").split(","):
+        if "=" not in part:
+            continue
+        host, _, value = part.partition("=")
+        host = host.strip().lower()
+        if host.startswith("www."):
+            host = host[4:]
+        try:
+            limits[host] = max(1, int(value.strip()))
+        except ValueError:
+            continue
+    return limits
+
+
+class _Waiter:
+    __slots__ = ("host", "future", "low")
+
+    def __init__(self, host: str, future: asyncio.Future, low: bool = False):
+        self.host = host
+        self.future = future
+        self.low = low
+
+
+class CrawlScheduler:
+    """
+    Grants crawl slots under a global cap and per-host caps.
+    Waiters are grouped by owner (request id) and served round-robin.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 16,
+        per_host: int = 4,
+        min_interval: float = 0.0,
+        host_limits: Optional[Dict[str, int]] = None,
+        low_max_in_flight: int = 4,
+        low_per_host: int = 1,
+    ):
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.per_host = max(1, int(per_host))
+        self.min_interval = max(0.0, float(min_interval))
+        self.host_limits: Dict[str, int] = dict(host_limits or {})
+        self.low_max_in_flight = max(1, int(low_max_in_flight))
+        self.low_per_host = max(1, int(low_per_host))
+
+        self._in_flight = 0
+        self._host_in_flight: Dict[str, int] = {}
+        self._host_next_start: Dict[str, float] = {}
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._low_in_flight = 0
+        self._host_low_in_flight: Dict[str, int] = {}
+        self._low_queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Introspection (used by tests / logging)
+    # ------------------------------------------------------------------
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def host_in_flight(self, host: str) -> int:
+        return self._host_in_flight.get(host, 0)
+
+    @property
+    def low_in_flight(self) -> int:
+        return self._low_in_flight
+
+    def host_limit(self, host: str) -> int:
+        return self.host_limits.get(host, self.per_host)
+
+    # ------------------------------------------------------------------
+    # Slot accounting
+    # ------------------------------------------------------------------
+
+    def _has_capacity(self, host: str, low: bool = False) -> bool:
+        if low and (
+            self._low_in_flight >= self.low_max_in_flight
+            or self._host_low_in_flight.get(host, 0) >= self.low_per_host
+        ):
+            return False
+        return (
+            self._in_flight < self.max_in_flight
+            and self._host_in_flight.get(host, 0) < self.host_limit(host)
+        )
+
+    def _take(self, host: str, low: bool = False) -> None:
+        self._in_flight += 1
+        self._host_in_flight[host] = self._host_in_flight.get(host, 0) + 1
+        if low:
+            self._low_in_flight += 1
+            self._host_low_in_flight[host] = self._host_low_in_flight.get(host, 0) + 1
+
+    @staticmethod
+    def _decrement(counts: Dict[str, int], host: str) -> None:
+        remaining = counts.get(host, 1) - 1
+        if remaining > 0:
+            counts[host] = remaining
+        else:
+            counts.pop(host, None)
+
+    def _release(self, host: str, low: bool = False) -> None:
+        self._in_flight -= 1
+        self._decrement(self._host_in_flight, host)
+        if low:
+            self._low_in_flight -= 1
+            self._decrement(self._host_low_in_flight, host)
+        self._dispatch()
+
+    def _grant_one(self, queues: "OrderedDict[str, Deque[_Waiter]]") -> bool:
+        """Grant one waiter from *queues*, one owner at a time (round-robin)."""
+        for owner in list(queues):
+            queue = queues[owner]
+            waiter = next((w for w in queue if self._has_capacity(w.host, w.low)), None)
+            if waiter is None:
+                continue
+            queue.remove(waiter)
+            if queue:
+                # Served owner goes to the back so others get the next slot.
+                queues.move_to_end(owner)
+            else:
+                del queues[owner]
+            if waiter.future.done():
+                # Cancelled while queued — skip without consuming a slot.
+                return True
+            self._take(waiter.host, waiter.low)
+            waiter.future.set_result(None)
+            return True
+        return False
+
+    def _dispatch(self) -> None:
+        """Grant free slots: normal waiters first, low priority only with capacity left over."""
+        while (self._queues or self._low_queues) and self._in_flight < self.max_in_flight:
+            if not (self._grant_one(self._queues) or self._grant_one(self._low_queues)):
+                return
+
+    def _discard(self, owner: str, waiter: _Waiter) -> None:
+        queues = self._low_queues if waiter.low else self._queues
+        queue = queues.get(owner)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            return
+        if not queue:
+            del queues[owner]
+
+    async def _acquire(self, host: str, owner: str, low: bool = False) -> None:
+        # Fast path only when nobody is queued, so new arrivals can't jump the line.
+        queued = bool(self._queues) or (low and bool(self._low_queues))
+        if not queued and self._has_capacity(host, low):
+            self._take(host, low)
+            return
+
+        waiter = _Waiter(host, asyncio.get_running_loop().create_future(), low)
+        (self._low_queues if low else self._queues).setdefault(owner, deque()).append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted right before the cancellation landed — give it back.
+                self._release(host, low)
+            else:
+                self._discard(owner, waiter)
+            raise
+
+    async def _politeness_delay(self, host: str) -> None:
+        if self.min_interval <= 0:
+            return
+        now = time.monotonic()
+        start = max(now, self._host_next_start.get(host, 0.0))
+        self._host_next_start[host] = start + self.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    @asynccontextmanager
+    async def slot(self, url: str, owner: Optional[str] = None, low_priority: bool = False) -> AsyncIterator[str]:
+        """
+        Hold one crawl slot for *url* for the duration of the block.
+
+        Args:
+            url: URL being fetched (only its host matters)
+            owner: fairness key; defaults to the current request id
+            low_priority: background work (prefetch) — yields to normal waiters
+
+        Yields:
+            The normalized host key
+        """
+        host = host_key(url)
+        owner = owner or get_request_id() or _DEFAULT_OWNER
+        await self._acquire(host, owner, low_priority)
+        try:
+            await self._politeness_delay(host)
+            yield host
+        finally:
+            self._release(host, low_priority)
+
+
+crawl_scheduler = CrawlScheduler(
+    max_in_flight=settings.CRAWL_MAX_IN_FLIGHT,
+    per_host=settings.CRAWL_PER_HOST_CONCURRENCY,
+    min_interval=settings.CRAWL_HOST_MIN_INTERVAL_MS / 1000.0,
+    host_limits=parse_host_limits(settings.CRAWL_HOST_LIMITS),
+    low_max_in_flight=settings.CRAWL_LOW_PRIORITY_MAX_IN_FLIGHT,
+    low_per_host=settings.CRAWL_LOW_PRIORITY_PER_HOST,
+)
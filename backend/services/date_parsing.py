@@ -0,0 +1,144 @@
+"""
+Fast pubDate parsing for RSS/Atom entries.
+
+dateutil's parser is flexible but slow and it was the hottest call in
+`_process_entry`. Feeds use one date format for all their items, so we:
+  1. try the strategy that last worked for this feed (learned per feed URL),
+  2. then the strict stdlib parsers (RFC 2822 via email.utils, ISO 8601 via
+     datetime.fromisoformat),
+  3. and only then fall back to dateutil.
+Results are memoized, since the same pubDate strings come back on every
+refresh of a feed.
+
+Usage:
+    from services.date_parsing import feed_date_parser
+
+    dt = feed_date_parser.parse("Mon, 16 Mar 2026 23:00:00 GMT+7", feed_key=rss_url)
+    # -> datetime(2026, 3, 16, 23, 0, tzinfo=+07:00) or None if unparseable
+
+Returned datetimes may be naive (no timezone in the string); callers keep
+treating those as UTC, as before.
+"""
+import re
+import threading
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+from dateutil import parser as date_parser
+
+_GMT_OFFSET_RE = re.compile(r"GMT([+-])(\d+)")
+
+
+def _normalize_gmt_offset(pub_str: str) -> str:
+    """
+    Fix dateutil misparse of 'GMT+N' timezone strings.
+
+    dateutil follows POSIX convention where GMT+7 means UTC-7 (west of UTC).
+    But RSS feeds (RFC 2822) intend GMT+7 to mean UTC+7 (east of UTC, i.e. Vietnam).
+
+    This function replaces 'GMT+7' -> '+0700' and 'GMT-5' -> '-0500' so that
+    dateutil parses them with the correct sign.
+    """
+    def fix_gmt(m: re.Match) -> str:
+        sign = m.group(1)
+        hours = int(m.group(2))
+        return f"{sign}{hours:02d}00"
+
+    return _GMT_OFFSET_RE.sub(fix_gmt, pub_str)
+
+
+# Only hand strings that really look like the format to the strict parsers:
+# parsedate_to_datetime in particular accepts some garbage silently.
+_RFC2822_RE = re.compile(r"^\s*(?:[A-Za-z]{3},?\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}\s+\d")
+_ISO_RE = re.compile(r"^\s*\d{4}-\d{2}-\d{2}")
+
+
+def _parse_rfc2822(value: str) -> Optional[datetime]:
+    if not _RFC2822_RE.match(value):
+        return None
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _parse_iso(value: str) -> Optional[datetime]:
+    if not _ISO_RE.match(value):
+        return None
+    try:
+        return datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+
+
+def _parse_dateutil(value: str) -> Optional[datetime]:
+    try:
+        return date_parser.parse(value)
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+
+# Tried in this order when the feed has no learned strategy yet.
+_STRATEGIES: Dict[str, Callable[[str], Optional[datetime]]] = {
+    "rfc2822": _parse_rfc2822,
+    "iso": _parse_iso,
+    "dateutil": _parse_dateutil,
+}
+
+
+class FeedDateParser:
+    """Per-feed format learning + memoized date parsing (thread-safe)."""
+
+    def __init__(self, memo_size: int = 8192):
+        self._learned: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._parse_memo = lru_cache(maxsize=memo_size)(self._parse_uncached)
+
+    def learned_strategy(self, feed_key: str) -> Optional[str]:
+        return self._learned.get(feed_key)
+
+    def parse(self, value: str, feed_key: str = "") -> Optional[datetime]:
+        """
+        Parse a feed date string.
+
+        Args:
+            value: raw pubDate / published / published_time string
+            feed_key: feed URL (or any stable key) used to learn the format
+
+        Returns:
+            datetime (possibly naive) or None if nothing could parse it
+        """
+        if not value:
+            return None
+        return self._parse_memo(value, feed_key)
+
+    def _parse_uncached(self, value: str, feed_key: str) -> Optional[datetime]:
+        if "GMT" in value:
+            value = _normalize_gmt_offset(value)
+        dt, strategy = self._try_strategies(value, self._learned.get(feed_key))
+        if dt is not None and feed_key and self._learned.get(feed_key) != strategy:
+            with self._lock:
+                self._learned[feed_key] = strategy
+        return dt
+
+    @staticmethod
+    def _try_strategies(value: str, first: Optional[str]) -> Tuple[Optional[datetime], str]:
+        if first is not None:
+            dt = _STRATEGIES[first](value)
+            if dt is not None:
+                return dt, first
+        for name, strategy in _STRATEGIES.items():
+            if name == first:
+                continue
+            dt = strategy(value)
+            if dt is not None:
+                return dt, name
+        return None, ""
+
+    def cache_info(self):
+        return self._parse_memo.cache_info()
+
+
+feed_date_parser = FeedDateParser()
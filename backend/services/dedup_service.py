@@ -24,6 +24,9 @@ def _ai_model():
 
 
 class DedupService:
+    # Articles per AI clustering call (prevents Gemini timeouts)
+    MAX_ARTICLES_PER_CATEGORY = 70
+
     def __init__(self):
         self.model_name = settings.GEMINI_MODEL  # unused — _ai_model() used at call time
         
@@ -45,10 +48,7 @@ class DedupService:
         if not articles or len(articles) == 0:
             return articles
             
-        # Step 1: Pre-filter - exact title matches (fast path)
-        articles = self._mark_exact_duplicates(articles)
-        
-        # Step 2: Group by category and time window for efficiency
+        # Step 1: Group by category and time window for efficiency
         grouped_by_category = {}
         for article in articles:
             category = article.get('category', 'KHÁC')
@@ -56,29 +56,110 @@ class DedupService:
                 grouped_by_category[category] = []
             grouped_by_category[category].append(article)
         
-        # Step 3: AI Clustering per category (with limit to prevent timeout)
-        MAX_ARTICLES_PER_CATEGORY = 70  # Limit to prevent Gemini timeout
+        # Step 2: Exact-title pre-filter + AI clustering per category
         all_processed = []
         for category, category_articles in grouped_by_category.items():
-            if len(category_articles) <= 1:
-                # Chỉ 1 bài thì không cần kiểm tra
-                for article in category_articles:
-                    article['group_id'] = article['url']  # Unique group
-                    article['is_master'] = True
-                    article['duplicate_count'] = 0
-                all_processed.extend(category_articles)
-            else:
-                # Limit articles to prevent timeout
-                if len(category_articles) > MAX_ARTICLES_PER_CATEGORY:
-                    print(f"⚠️ Category {category} has {len(category_articles)} articles, limiting to {MAX_ARTICLES_PER_CATEGORY}")
-                    # Take most recent articles
-                    category_articles = category_articles[:MAX_ARTICLES_PER_CATEGORY]
-                
-                processed = await self._ai_cluster_articles(category_articles, api_key)
-                all_processed.extend(processed)
+            all_processed.extend(await self.cluster_category(category, category_articles, api_key))
         
         return all_processed
+
+    async def cluster_category(
+        self,
+        category: str,
+        articles: List[Dict],
+        api_key: str = None
+    ) -> List[Dict]:
+        """
+        Nhóm trùng lặp cho các bài viết của MỘT category.
+
+        Dùng trực tiếp bởi pipeline (services/pipeline.py) để dedup từng
+        category ngay khi các nguồn của nó tải xong.
+
+        Returns:
+            Danh sách bài đã gán group_id/is_master/duplicate_count
+            (tối đa MAX_ARTICLES_PER_CATEGORY bài)
+        """
+        # Pre-filter - exact title matches (fast path)
+        articles = self._mark_exact_duplicates(articles)
+
+        if len(articles) <= 1:
+            # Chỉ 1 bài thì không cần kiểm tra
+            for article in articles:
+                article['group_id'] = article['url']  # Unique group
+                article['is_master'] = True
+                article['duplicate_count'] = 0
+            return articles
+
+        # Limit articles to prevent timeout
+        if len(articles) > self.MAX_ARTICLES_PER_CATEGORY:
+            print(f"⚠️ Category {category} has {len(articles)} articles, limiting to {self.MAX_ARTICLES_PER_CATEGORY}")
+            # Take most recent articles
+            articles = articles[:self.MAX_ARTICLES_PER_CATEGORY]
+
+        return await self._ai_cluster_articles(articles, api_key)
     
+    async def merge_late(
+        self,
+        category: str,
+        masters: List[Dict],
+        late: List[Dict],
+        api_key: str = None
+    ) -> List[Dict]:
+        """
+        Dedup bài đến muộn (sau khi chain của category đã chạy) với các bài
+        master đã chọn của category đó.
+
+        Master giữ nguyên group; bài muộn cùng sự kiện với một master trở
+        thành bài trùng của master đó (duplicate_count của master tăng).
+
+        MAX_ARTICLES_PER_CATEGORY giới hạn riêng phần bài muộn; mọi master
+        đều được đưa vào để so sánh.
+
+        Returns:
+            Các bài muộn đã gán group_id/is_master/duplicate_count
+        """
+        if not late:
+            return late
+        if not masters:
+            return await self.cluster_category(category, late, api_key)
+        if len(late) > self.MAX_ARTICLES_PER_CATEGORY:
+            print(f"⚠️ Category {category}: {len(late)} late articles, dropping {len(late) - self.MAX_ARTICLES_PER_CATEGORY}")
+            late = late[:self.MAX_ARTICLES_PER_CATEGORY]
+        # Copies: clustering must not relabel articles that were already emitted
+        probes = [
+            {"url": m.get("url", ""), "title": m.get("title", ""), "source": m.get("source", ""), "category": category}
+            for m in masters
+        ]
+        combined = self._mark_exact_duplicates(probes + list(late))
+        late = (await self._ai_cluster_articles(combined, api_key))[len(probes):]
+
+        master_of_group: Dict[str, Dict] = {}
+        for probe, master in zip(probes, masters):
+            if probe.get("group_id") is not None:
+                master_of_group.setdefault(probe["group_id"], master)
+        taken = {m.get("group_id") for m in masters}
+        late_only = list(dict.fromkeys(a.get("group_id") for a in late if a.get("group_id") not in master_of_group))
+        # Late-only groups whose id clashes with an existing group get a fresh
+        # suffix (_late, _late2, ...) that is free among masters and this batch
+        renamed: Dict[str, str] = {}
+        for group_id in [g for g in late_only if g in taken]:
+            candidate, n = f"{group_id}_late", 2
+            while candidate in taken or candidate in late_only:
+                candidate, n = f"{group_id}_late{n}", n + 1
+            renamed[group_id] = candidate
+            taken.add(candidate)
+        for article in late:
+            master = master_of_group.get(article.get("group_id"))
+            if master is not None:
+                article["group_id"] = master.get("group_id", "")
+                article["is_master"] = False
+                article["duplicate_count"] = 0
+                article["event_summary"] = master.get("event_summary", "")
+                master["duplicate_count"] = master.get("duplicate_count", 0) + 1
+            elif article.get("group_id") in renamed:
+                article["group_id"] = renamed[article["group_id"]]
+        return late
+
     def _mark_exact_duplicates(self, articles: List[Dict]) -> List[Dict]:
         """Fast pre-filter: mark exact title matches"""
         title_map = {}
@@ -0,0 +1,68 @@
+"""
+JSON serialization for streamed events and large responses.
+
+SSE (/api/rss/fetch_stream), NDJSON (/api/articles/summarize_stream) and
+/api/rss/fetch serialize every event through here, the final one carrying
+all articles of the request. orjson (optional dependency) encodes straight
+to UTF-8 bytes several times faster than json.dumps(ensure_ascii=False) +
+str.encode; without it the stdlib is used, with identical output shape.
+
+settings.JSON_SERIALIZER: "auto" (orjson when importable) | "orjson" | "json".
+ArticleRecords and other non-JSON values go through article_record.json_default.
+
+Usage:
+    from services.fast_json import ORJSONResponse, ndjson_line, sse_event
+
+    yield sse_event({"step": "complete", "articles": records})   # b"data: {...}\\n\\n"
+    return ORJSONResponse({"articles": records})
+"""
+import json
+from typing import Any, Callable
+
+from fastapi.responses import JSONResponse
+
+from config import settings
+from services.article_record import json_default
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, default=json_default).encode("utf-8")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def get_dumps(name: str) -> Callable[[Any], bytes]:
+    """Serializer for a JSON_SERIALIZER value ("orjson" falls back to json when not installed)."""
+    name = (name or "auto").lower()
+    if name in ("auto", "orjson") and ORJSON_AVAILABLE:
+        return _orjson_dumps
+    if name == "orjson":
+        print("⚠️ JSON_SERIALIZER=orjson but orjson is not installed, using json")
+    return _stdlib_dumps
+
+
+dumps: Callable[[Any], bytes] = get_dumps(settings.JSON_SERIALIZER)
+
+
+def sse_event(event: Any) -> bytes:
+    return b"data: " + dumps(event) + b"\n\n"
+
+
+def ndjson_line(event: Any) -> bytes:
+    return dumps(event) + b"\n"
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with the configured serializer (orjson when available)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,320 @@
+"""
+Fast RSS 2.0 / RSS 1.0 / Atom parsing on top of lxml.etree.iterparse.
+
+feedparser is pure Python, builds the whole document in memory and sanitizes
+every field; we only need title / link / published / summary and the image
+hints `_extract_thumbnail` looks at. This module streams <item>/<entry>
+elements and builds feedparser-compatible entries (FeedParserDict, so both
+`entry.get("published")` and `entry.media_content` keep working), clearing
+each element once it has been converted.
+
+Malformed XML (undeclared prefixes, HTML entities like &nbsp;, truncated
+bodies, HTML error pages...) falls back to feedparser, which is lenient.
+
+Usage:
+    from services.feed_parser import feed_parser
+
+    feed = feed_parser.parse(content)
+    for entry in feed.entries: ...
+
+    feed = await feed_parser.parse_async(content)   # from coroutines
+
+Engine is selected by settings.FEED_PARSER_ENGINE ("lxml" | "feedparser").
+
+parse_async hands bodies of at least FEED_PARSE_OFFLOAD_MIN_BYTES to a
+ParseExecutor (FEED_PARSE_EXECUTOR = "thread" | "process" | "off") so that
+50+ feeds arriving together do not stall the event loop (SSE heartbeats);
+smaller bodies are parsed inline, where a pool hop costs more than it saves.
+The process pool receives the raw body and returns (engine, bozo, entries).
+"""
+import asyncio
+import io
+import multiprocessing
+import os
+import re
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+import feedparser
+from feedparser.util import FeedParserDict
+from lxml import etree
+
+from config import settings
+
+ENGINE_LXML = "lxml"
+ENGINE_FEEDPARSER = "feedparser"
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTOR_OFF = "off"
+
+_NS_ATOM = "http://www.w3.org/2005/Atom"
+_NS_RSS10 = "http://purl.org/rss/1.0/"
+_NS_MEDIA = "http://search.yahoo.com/mrss/"
+_NS_CONTENT = "http://purl.org/rss/1.0/modules/content/"
+_NS_DC = "http://purl.org/dc/elements/1.1/"
+
+_RSS10_PREFIX = "{%s}" % _NS_RSS10
+_ATOM_ENTRY = "{%s}entry" % _NS_ATOM
+_ITEM_TAGS = ("item", _RSS10_PREFIX + "item", _ATOM_ENTRY)
+
+_MEDIA_CONTENT = "{%s}content" % _NS_MEDIA
+_MEDIA_THUMBNAIL = "{%s}thumbnail" % _NS_MEDIA
+_MEDIA_GROUP = "{%s}group" % _NS_MEDIA
+_CONTENT_ENCODED = "{%s}encoded" % _NS_CONTENT
+_DC_DATE = "{%s}date" % _NS_DC
+
+_XML_DECL_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+# Some CMSs (Hà Nội Mới) escape the CDATA markers themselves, so after XML
+# decoding the text is literally "<![CDATA[...]]>" — unwrap it.
+_LITERAL_CDATA_RE = re.compile(r"^\s*<!\[CDATA\[(.*)\]\]>\s*$", re.DOTALL)
+
+
+def _to_xml_bytes(content: Union[str, bytes]) -> bytes:
+    """lxml refuses str input that carries an encoding declaration — drop it and feed UTF-8."""
+    if isinstance(content, bytes):
+        return content.lstrip()
+    content = _XML_DECL_RE.sub("", content.lstrip("\ufeff"), count=1)
+    return content.lstrip().encode("utf-8")
+
+
+def _inner_text(elem) -> str:
+    """Element text; child markup (unescaped HTML in <description>) is kept serialized."""
+    text = elem.text or ""
+    if len(elem):
+        text += "".join(etree.tostring(child, encoding="unicode") for child in elem)
+    return text
+
+
+def _summary_text(elem) -> str:
+    text = _inner_text(elem)
+    m = _LITERAL_CDATA_RE.match(text)
+    return m.group(1) if m else text
+
+
+def _rss_entry(item) -> FeedParserDict:
+    entry = FeedParserDict()
+    summary = ""
+    content = ""
+    media_content: List[dict] = []
+    media_thumbnail: List[dict] = []
+    links: List[FeedParserDict] = []
+
+    children = list(item)
+    for child in children:
+        tag = child.tag
+        if not isinstance(tag, str):
+            continue
+        if tag.startswith(_RSS10_PREFIX):
+            tag = tag[len(_RSS10_PREFIX):]
+
+        if tag == "title":
+            entry["title"] = (child.text or "").strip()
+        elif tag == "link":
+            if "link" not in entry:
+                entry["link"] = (child.text or "").strip()
+                links.append(FeedParserDict(rel="alternate", type="text/html", href=entry["link"]))
+        elif tag == "pubDate" or (tag == _DC_DATE and "published" not in entry):
+            entry["published"] = (child.text or "").strip()
+        elif tag == "description":
+            summary = _summary_text(child)
+        elif tag == _CONTENT_ENCODED:
+            content = _inner_text(child)
+        elif tag == _MEDIA_GROUP:
+            children.extend(child)
+        elif tag == "guid":
+            entry["id"] = (child.text or "").strip()
+        elif tag == _MEDIA_CONTENT:
+            if child.get("url"):
+                media_content.append(dict(child.attrib))
+        elif tag == _MEDIA_THUMBNAIL:
+            if child.get("url"):
+                media_thumbnail.append(dict(child.attrib))
+        elif tag == "enclosure":
+            links.append(FeedParserDict(
+                rel="enclosure",
+                href=child.get("url", ""),
+                type=child.get("type", ""),
+                length=child.get("length", ""),
+            ))
+
+    if content:
+        entry["content"] = [FeedParserDict(value=content, type="text/html")]
+    # feedparser falls back to the full content when there is no <description>
+    entry["summary"] = summary or content
+    if media_content:
+        entry["media_content"] = media_content
+    if media_thumbnail:
+        entry["media_thumbnail"] = media_thumbnail
+    # FeedParserDict derives `entry.enclosures` from rel="enclosure" links
+    entry["links"] = links
+    return entry
+
+
+def _atom_entry(node) -> FeedParserDict:
+    entry = FeedParserDict()
+    summary = ""
+    content = ""
+    links: List[FeedParserDict] = []
+
+    for child in node:
+        tag = child.tag
+        if not isinstance(tag, str) or not tag.startswith("{%s}" % _NS_ATOM):
+            continue
+        name = tag[len(_NS_ATOM) + 2:]
+        if name == "title":
+            entry["title"] = _inner_text(child).strip()
+        elif name == "link":
+            link = FeedParserDict(child.attrib)
+            link["rel"] = child.get("rel", "alternate")
+            link["href"] = child.get("href", "").strip()
+            links.append(link)
+            if link["rel"] == "alternate" and "link" not in entry:
+                entry["link"] = link["href"]
+        elif name == "published":
+            entry["published"] = (child.text or "").strip()
+        elif name == "updated":
+            entry["updated"] = (child.text or "").strip()
+        elif name == "id":
+            entry["id"] = (child.text or "").strip()
+        elif name == "summary":
+            summary = _summary_text(child)
+        elif name == "content":
+            content = _inner_text(child)
+
+    if content:
+        entry["content"] = [FeedParserDict(value=content, type="text/html")]
+    entry["summary"] = summary or content
+    entry["links"] = links
+    return entry
+
+
+def _parse_lxml(data: bytes) -> List[FeedParserDict]:
+    entries: List[FeedParserDict] = []
+    for _, elem in etree.iterparse(
+        io.BytesIO(data),
+        events=("end",),
+        tag=_ITEM_TAGS,
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+    ):
+        entries.append(_atom_entry(elem) if elem.tag == _ATOM_ENTRY else _rss_entry(elem))
+        # Free the converted item and its already-processed siblings
+        elem.clear(keep_tail=False)
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+    return entries
+
+
+def _parse_compact(content: Union[str, bytes], engine: str) -> Tuple[str, bool, list]:
+    """Process-pool entry point: parse and return only what the fetcher reads."""
+    feed = FeedParser(engine).parse(content)
+    return feed.get("engine", engine), bool(feed.get("bozo", False)), list(feed.entries)
+
+
+class ParseExecutor:
+    """
+    Pool for parse_async, created on first use.
+    workers=0 sizes it from the CPU count (process pools leave one core to the event loop).
+    """
+
+    def __init__(self, mode: str = EXECUTOR_THREAD, workers: int = 0, min_bytes: int = 16 * 1024):
+        self.mode = (mode or EXECUTOR_OFF).lower()
+        self.workers = workers if workers > 0 else self._auto_workers(self.mode)
+        self.min_bytes = max(0, int(min_bytes))
+        self._pool: Optional[Executor] = None
+        # Counters (used by tests / benchmarks)
+        self.offloaded = 0
+        self.inline = 0
+
+    @staticmethod
+    def _auto_workers(mode: str) -> int:
+        cpus = os.cpu_count() or 1
+        if mode == EXECUTOR_PROCESS:
+            return max(1, min(4, cpus - 1))
+        return max(1, min(4, cpus))
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode in (EXECUTOR_THREAD, EXECUTOR_PROCESS)
+
+    def should_offload(self, size: int) -> bool:
+        offload = self.enabled and size >= self.min_bytes
+        if offload:
+            self.offloaded += 1
+        else:
+            self.inline += 1
+        return offload
+
+    def pool(self) -> Executor:
+        if self._pool is None:
+            if self.mode == EXECUTOR_PROCESS:
+                # spawn: never fork a process that is running an event loop + threads
+                self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="feed-parse")
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+class FeedParser:
+    """Parses feed bodies into feedparser-compatible results."""
+
+    def __init__(self, engine: str = ENGINE_LXML, executor: Optional[ParseExecutor] = None):
+        self.engine = engine.lower()
+        self.executor = executor
+
+    def parse(self, content: Union[str, bytes], engine: Optional[str] = None) -> FeedParserDict:
+        """
+        Parse an RSS/Atom body.
+
+        `engine` overrides the configured engine for this call (per-source
+        setting from the source registry).
+        Returns a FeedParserDict with `entries`, `bozo` and `engine` (the
+        engine that actually produced the entries).
+        """
+        if (engine or self.engine).lower() == ENGINE_LXML and content:
+            try:
+                entries = _parse_lxml(_to_xml_bytes(content))
+                return FeedParserDict(entries=entries, bozo=False, engine=ENGINE_LXML)
+            except (etree.XMLSyntaxError, ValueError):
+                pass
+        feed = feedparser.parse(content)
+        feed["engine"] = ENGINE_FEEDPARSER
+        return feed
+
+    async def parse_async(self, content: Union[str, bytes], engine: Optional[str] = None) -> FeedParserDict:
+        """parse() for coroutines: large bodies go to the executor, small ones are parsed inline."""
+        executor = self.executor
+        if executor is None or not executor.should_offload(len(content or b"")):
+            return self.parse(content, engine)
+        loop = asyncio.get_running_loop()
+        try:
+            if executor.mode == EXECUTOR_PROCESS:
+                used, bozo, entries = await loop.run_in_executor(
+                    executor.pool(), _parse_compact, content, engine or self.engine
+                )
+                return FeedParserDict(entries=entries, bozo=bozo, engine=used)
+            return await loop.run_in_executor(executor.pool(), self.parse, content, engine)
+        except (BrokenExecutor, RuntimeError) as e:
+            # Pool died / shut down — parsing must not fail because of it
+            print(f"⚠️ Feed parse executor unavailable ({type(e).__name__}: {e}), parsing inline")
+            executor.shutdown()
+            return self.parse(content, engine)
+
+
+feed_parser = FeedParser(
+    settings.FEED_PARSER_ENGINE,
+    executor=ParseExecutor(
+        settings.FEED_PARSE_EXECUTOR,
+        workers=settings.FEED_PARSE_WORKERS,
+        min_bytes=settings.FEED_PARSE_OFFLOAD_MIN_BYTES,
+    ),
+)
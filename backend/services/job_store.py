@@ -0,0 +1,278 @@
+"""
+Persistent store for asynchronous jobs (SQLite, stdlib only).
+
+A job is a row in `jobs` (status, progress counters, request payload, final
+result) plus an append-only event log in `job_events`. Each event gets a
+sequence number (`seq`, 0-based per job) so clients can resume streaming
+from any offset after a dropped connection.
+
+Each job records its `owner` (the "host:pid" of the process running it),
+so startup cleanup of a shared JOBS_DB_PATH only touches dead processes' jobs.
+
+Secrets never go in here: callers must strip API keys from the payload.
+
+Usage:
+    from services.job_store import job_store
+
+    job = job_store.create("summarize", {"urls": [...]}, total=3, owner="host:123")
+    seq = job_store.append_event(job["id"], {"type": "progress", ...})
+    job_store.update(job["id"], status="done", result="...")
+    events = job_store.events(job["id"], offset=5)
+
+    # From async code (SQLite I/O runs in a worker thread, off the event loop):
+    seq = await job_store.aappend_event(job["id"], {...})
+    events = await job_store.aevents(job["id"], offset=5)
+
+Like persistent_cache, it never fails the request flow: if the database
+cannot be opened (read-only filesystem on serverless, etc.) it falls back to
+in-process storage.
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from config import settings
+
+_DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".cache", "jobs.sqlite3")
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+FINISHED_STATES = (JOB_DONE, JOB_FAILED)
+
+_JOB_COLUMNS = (
+    "id", "kind", "status", "total", "completed", "payload", "result", "error", "created_at", "updated_at", "owner",
+)
+
+
+class JobStore:
+    """Jobs + per-job event log with an in-memory fallback."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._opened = False
+        self._memory_jobs: Dict[str, Dict[str, Any]] = {}
+        self._memory_events: Dict[str, List[str]] = {}
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._opened:
+            return self._conn
+        self._opened = True
+        try:
+            if self.path != ":memory:":
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=2)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    total INTEGER NOT NULL DEFAULT 0,
+                    completed INTEGER NOT NULL DEFAULT 0,
+                    payload TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    owner TEXT NOT NULL DEFAULT ''
+                )
+                """
+            )
+            # Databases created before owner existed: their jobs have no known owner
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "owner" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT NOT NULL DEFAULT ''")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_events (
+                    job_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    event TEXT NOT NULL,
+                    PRIMARY KEY (job_id, seq)
+                )
+                """
+            )
+            conn.commit()
+            self._conn = conn
+        except Exception as e:
+            print(f"⚠️ Job store unavailable ({self.path}): {e} — using memory only")
+            self._conn = None
+        return self._conn
+
+    @staticmethod
+    def _row_to_job(row) -> Dict[str, Any]:
+        job = dict(zip(_JOB_COLUMNS, row))
+        job["payload"] = json.loads(job["payload"])
+        return job
+
+    def create(self, kind: str, payload: Dict[str, Any], total: int = 0, owner: str = "") -> Dict[str, Any]:
+        now = time.time()
+        job = {
+            "id": uuid.uuid4().hex,
+            "kind": kind,
+            "status": JOB_QUEUED,
+            "total": total,
+            "completed": 0,
+            "payload": payload,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+            "owner": owner,
+        }
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                self._memory_jobs[job["id"]] = dict(job)
+                self._memory_events[job["id"]] = []
+                return job
+            conn.execute(
+                f"INSERT INTO jobs ({', '.join(_JOB_COLUMNS)}) VALUES ({', '.join('?' * len(_JOB_COLUMNS))})",
+                tuple(json.dumps(payload, ensure_ascii=False) if c == "payload" else job[c] for c in _JOB_COLUMNS),
+            )
+            conn.commit()
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                job = self._memory_jobs.get(job_id)
+                return dict(job) if job else None
+            row = conn.execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Update status / completed / result / error (and bump updated_at)."""
+        fields = {k: v for k, v in fields.items() if k in ("status", "total", "completed", "result", "error")}
+        fields["updated_at"] = time.time()
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                if job_id in self._memory_jobs:
+                    self._memory_jobs[job_id].update(fields)
+                return
+            conn.execute(
+                f"UPDATE jobs SET {', '.join(f'{k} = ?' for k in fields)} WHERE id = ?",
+                (*fields.values(), job_id),
+            )
+            conn.commit()
+
+    def append_event(self, job_id: str, event: Dict[str, Any]) -> int:
+        """Append an event; returns its sequence number (also stored as event['seq'])."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                log = self._memory_events.setdefault(job_id, [])
+                seq = len(log)
+                log.append(json.dumps({**event, "seq": seq}, ensure_ascii=False, default=str))
+                return seq
+            seq = conn.execute(
+                "SELECT COALESCE(MAX(seq) + 1, 0) FROM job_events WHERE job_id = ?", (job_id,)
+            ).fetchone()[0]
+            conn.execute(
+                "INSERT INTO job_events (job_id, seq, event) VALUES (?, ?, ?)",
+                (job_id, seq, json.dumps({**event, "seq": seq}, ensure_ascii=False, default=str)),
+            )
+            conn.commit()
+            return seq
+
+    def events(self, job_id: str, offset: int = 0) -> List[str]:
+        """Serialized events with seq >= offset, in order."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return list(self._memory_events.get(job_id, [])[max(0, offset):])
+            rows = conn.execute(
+                "SELECT event FROM job_events WHERE job_id = ? AND seq >= ? ORDER BY seq",
+                (job_id, max(0, offset)),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def event_count(self, job_id: str) -> int:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return len(self._memory_events.get(job_id, []))
+            return conn.execute("SELECT COUNT(*) FROM job_events WHERE job_id = ?", (job_id,)).fetchone()[0]
+
+    def unfinished_owners(self) -> Dict[str, str]:
+        """{job_id: owner} of jobs still queued or running."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return {
+                    jid: job["owner"] for jid, job in self._memory_jobs.items() if job["status"] not in FINISHED_STATES
+                }
+            rows = conn.execute(
+                "SELECT id, owner FROM jobs WHERE status NOT IN (?, ?)", FINISHED_STATES
+            ).fetchall()
+        return dict(rows)
+
+    def purge_older_than(self, max_age_sec: float) -> int:
+        """Delete finished jobs (and their events) last updated more than max_age_sec ago."""
+        cutoff = time.time() - max_age_sec
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                stale = [
+                    jid for jid, job in self._memory_jobs.items()
+                    if job["status"] in FINISHED_STATES and job["updated_at"] < cutoff
+                ]
+                for jid in stale:
+                    self._memory_jobs.pop(jid, None)
+                    self._memory_events.pop(jid, None)
+                return len(stale)
+            stale = [r[0] for r in conn.execute(
+                "SELECT id FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (*FINISHED_STATES, cutoff),
+            ).fetchall()]
+            for jid in stale:
+                conn.execute("DELETE FROM job_events WHERE job_id = ?", (jid,))
+                conn.execute("DELETE FROM jobs WHERE id = ?", (jid,))
+            conn.commit()
+            return len(stale)
+
+    # Async variants: same calls in a worker thread, so job bookkeeping (one
+    # commit per event, tailers polling every second) never blocks the loop.
+
+    async def acreate(self, kind: str, payload: Dict[str, Any], total: int = 0, owner: str = "") -> Dict[str, Any]:
+        return await asyncio.to_thread(self.create, kind, payload, total, owner)
+
+    async def aget(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self.get, job_id)
+
+    async def aupdate(self, job_id: str, **fields: Any) -> None:
+        await asyncio.to_thread(self.update, job_id, **fields)
+
+    async def aappend_event(self, job_id: str, event: Dict[str, Any]) -> int:
+        return await asyncio.to_thread(self.append_event, job_id, event)
+
+    async def aevents(self, job_id: str, offset: int = 0) -> List[str]:
+        return await asyncio.to_thread(self.events, job_id, offset)
+
+    async def aevent_count(self, job_id: str) -> int:
+        return await asyncio.to_thread(self.event_count, job_id)
+
+    async def apurge_older_than(self, max_age_sec: float) -> int:
+        return await asyncio.to_thread(self.purge_older_than, max_age_sec)
+
+    async def aunfinished_owners(self) -> Dict[str, str]:
+        return await asyncio.to_thread(self.unfinished_owners)
+
+
+job_store = JobStore(settings.JOBS_DB_PATH or _DEFAULT_PATH)
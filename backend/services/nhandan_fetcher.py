@@ -8,7 +8,8 @@ from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from config import settings
 from services.secure_fetcher import secure_fetcher
-import feedparser
+from services.crawl_scheduler import crawl_scheduler
+from services.feed_parser import feed_parser
 import json
 from services.fast_gemini import fast_gemini
 from services.openai_client import openai_client
@@ -40,6 +41,8 @@ class NhanDanFetcher:
         self.cached_headlines: List[Dict] = []
         self.last_fetch_time: Optional[datetime] = None
         self.cache_duration = timedelta(hours=1)  # Refresh mỗi 1 giờ
+        # Refresh đang chạy — các request đồng thời cùng chờ 1 lần fetch
+        self._refresh_task: Optional[asyncio.Task] = None
         
     async def setup_background_fetch(self):
         """
@@ -51,8 +54,9 @@ class NhanDanFetcher:
         for category, rss_url in self.rss_urls.items():
             try:
                 # Sử dụng SecureRSSFetcher cho các trang có chống bot
-                rss_content = await secure_fetcher.fetch_rss(rss_url)
-                feed = feedparser.parse(rss_content)
+                async with crawl_scheduler.slot(rss_url):
+                    rss_content = await secure_fetcher.fetch_rss(rss_url)
+                feed = await feed_parser.parse_async(rss_content)
                 
                 for entry in feed.entries[:20]:  # Lấy 20 bài mới nhất mỗi chuyên mục
                     all_articles.append({
@@ -71,11 +75,20 @@ class NhanDanFetcher:
         return all_articles
     
     async def ensure_cache_fresh(self):
-        """Đảm bảo cache còn mới (tự động refresh nếu cần)"""
-        if not self.cached_headlines or not self.last_fetch_time:
-            await self.setup_background_fetch()
-        elif datetime.now() - self.last_fetch_time > self.cache_duration:
-            await self.setup_background_fetch()
+        """Đảm bảo cache còn mới (tự động refresh nếu cần, single-flight)"""
+        stale = (
+            not self.cached_headlines
+            or not self.last_fetch_time
+            or datetime.now() - self.last_fetch_time > self.cache_duration
+        )
+        if not stale:
+            return
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self.setup_background_fetch())
+            self._refresh_task = task
+        # shield: a cancelled caller must not cancel the refresh other callers wait on
+        await asyncio.shield(task)
     
     async def check_official_coverage(
         self, 
@@ -109,7 +122,6 @@ class NhanDanFetcher:
             return articles
         
         # Group articles by category
-        MAX_ARTICLES_PER_CATEGORY = 70  # Limit to prevent timeout
         articles_by_category = {}
         for article in articles:
             category = article.get('category', 'KHÁC')
@@ -119,27 +131,44 @@ class NhanDanFetcher:
         
         print(f"🔍 Checking Nhan Dan coverage for {len(articles)} articles across {len(articles_by_category)} categories")
         
-        # Process each category in parallel (with limit)
-        tasks = []
-        for category, category_articles in articles_by_category.items():
-            if category in self.rss_urls:
-                # Limit articles per category
-                if len(category_articles) > MAX_ARTICLES_PER_CATEGORY:
-                    print(f"⚠️ Category {category} has {len(category_articles)} articles, limiting to {MAX_ARTICLES_PER_CATEGORY} for Nhan Dan check")
-                    category_articles = category_articles[:MAX_ARTICLES_PER_CATEGORY]
-                
-                task = self._check_category_batch(category, category_articles, api_key)
-                tasks.append(task)
-            else:
-                # Mark as not applicable
-                for article in category_articles:
-                    article['official_source_link'] = None
-        
         # Run all category checks in parallel
-        if tasks:
-            await asyncio.gather(*tasks)
+        await asyncio.gather(*[
+            self.verify_category(category, category_articles, api_key)
+            for category, category_articles in articles_by_category.items()
+        ])
         
         return articles
+
+    async def verify_category(
+        self,
+        category: str,
+        articles: List[Dict],
+        api_key: str
+    ) -> List[Dict]:
+        """
+        Kiểm tra Nhân Dân cho các bài của MỘT category (dùng bởi pipeline
+        để xác thực từng category ngay khi dedup của nó xong).
+        Gắn 'official_source_link' vào bài (in place) và trả về chính list đó.
+        """
+        MAX_ARTICLES_PER_CATEGORY = 70  # Limit to prevent timeout
+        if not api_key or category not in self.rss_urls:
+            # No key / category không áp dụng
+            for article in articles:
+                article['official_source_link'] = None
+            return articles
+
+        await self.ensure_cache_fresh()
+        if not self.cached_headlines:
+            for article in articles:
+                article['official_source_link'] = None
+            return articles
+
+        batch = articles
+        if len(batch) > MAX_ARTICLES_PER_CATEGORY:
+            print(f"⚠️ Category {category} has {len(batch)} articles, limiting to {MAX_ARTICLES_PER_CATEGORY} for Nhan Dan check")
+            batch = batch[:MAX_ARTICLES_PER_CATEGORY]
+        await self._check_category_batch(category, batch, api_key)
+        return articles
     
     async def _check_category_batch(
         self,
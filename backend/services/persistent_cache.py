@@ -0,0 +1,219 @@
+"""
+Small persistent key/value cache backed by SQLite (stdlib only).
+
+Used for facts that rarely change once observed (a VOV article's
+published_time, an article's category / report section), so they survive
+restarts and are shared across requests.
+
+Bounded per namespace: rows older than the namespace's max age (by
+created_at, CACHE_MAX_AGE_DAYS / CACHE_NAMESPACE_MAX_AGE_DAYS) are ignored
+and pruned on write, and at most CACHE_MAX_ROWS newest rows are kept.
+
+Usage:
+    from services.persistent_cache import persistent_cache
+
+    value = persistent_cache.get("vov_published_time", url)
+    persistent_cache.set("vov_published_time", url, "2026-03-16T07:00:00+07:00")
+
+    # From async code (SQLite I/O runs in a worker thread, off the event loop):
+    found = await persistent_cache.aget_many("vov_published_time", urls)
+    await persistent_cache.aset_many("vov_published_time", new_dates)
+
+Never raises: if the database cannot be opened (read-only filesystem on
+serverless, etc.) it falls back to an in-process LRU dict with the same bounds.
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from config import settings
+
+_DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".cache", "cache.sqlite3")
+
+
+def parse_namespace_max_age(raw: str) -> Dict[str, float]:
+    """Parse "vov_published_time=30,article_category=90" (days) into {namespace: seconds}."""
+    ages: Dict[str, float] = {}
+    for part in (raw or "").split(","):
+        if "=" not in part:
+            continue
+        namespace, _, value = part.partition("=")
+        try:
+            ages[namespace.strip()] = max(0.0, float(value.strip())) * 86400
+        except ValueError:
+            continue
+    return ages
+
+
+class PersistentCache:
+    """Namespaced string key/value store with an in-memory (LRU) fallback."""
+
+    def __init__(
+        self,
+        path: str,
+        max_age_sec: float = 90 * 86400,
+        namespace_max_age: Optional[Dict[str, float]] = None,
+        max_rows: int = 50000,
+        memory_max_entries: int = 20000,
+    ):
+        self.path = path
+        self.max_age_sec = max_age_sec
+        self.namespace_max_age = dict(namespace_max_age or {})
+        self.max_rows = max(1, int(max_rows))
+        self.memory_max_entries = max(1, int(memory_max_entries))
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # (namespace, key) -> (value, created_at), least recently used first
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._opened = False
+
+    def max_age(self, namespace: str) -> float:
+        return self.namespace_max_age.get(namespace, self.max_age_sec)
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._opened:
+            return self._conn
+        self._opened = True
+        try:
+            if self.path != ":memory:":
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=2)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS kv_cache (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    created_at REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            # Databases created before created_at existed: age rows from their last write
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(kv_cache)")}
+            if "created_at" not in columns:
+                conn.execute("ALTER TABLE kv_cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+                conn.execute("UPDATE kv_cache SET created_at = updated_at")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_kv_cache_created ON kv_cache (namespace, created_at)")
+            conn.commit()
+            self._conn = conn
+        except Exception as e:
+            print(f"⚠️ Persistent cache unavailable ({self.path}): {e} — using memory only")
+            self._conn = None
+        return self._conn
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        return self.get_many(namespace, [key]).get(key)
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, str]:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        cutoff = time.time() - self.max_age(namespace)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return self._memory_get(namespace, keys, cutoff)
+            found: Dict[str, str] = {}
+            try:
+                # SQLite default max variables is 999 — query in chunks.
+                for i in range(0, len(keys), 500):
+                    chunk = keys[i:i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, value FROM kv_cache WHERE namespace = ? AND created_at >= ? "
+                        f"AND key IN ({placeholders})",
+                        (namespace, cutoff, *chunk),
+                    ).fetchall()
+                    found.update(rows)
+            except Exception:
+                return {}
+            return found
+
+    def set(self, namespace: str, key: str, value: str) -> None:
+        self.set_many(namespace, {key: value})
+
+    def set_many(self, namespace: str, items: Dict[str, str]) -> None:
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                self._memory_set(namespace, items, now)
+                return
+            try:
+                # created_at is kept on update: max age counts from first observation
+                conn.executemany(
+                    """
+                    INSERT INTO kv_cache (namespace, key, value, updated_at, created_at) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+                    """,
+                    [(namespace, k, v, now, now) for k, v in items.items()],
+                )
+                self._prune(conn, namespace, now)
+                conn.commit()
+            except Exception:
+                # Never break the crawl flow because of the cache.
+                return
+
+    async def aget_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, str]:
+        """get_many without blocking the event loop."""
+        return await asyncio.to_thread(self.get_many, namespace, list(keys))
+
+    async def aset_many(self, namespace: str, items: Dict[str, str]) -> None:
+        """set_many without blocking the event loop."""
+        if items:
+            await asyncio.to_thread(self.set_many, namespace, dict(items))
+
+    def _prune(self, conn: sqlite3.Connection, namespace: str, now: float) -> None:
+        conn.execute(
+            "DELETE FROM kv_cache WHERE namespace = ? AND created_at < ?",
+            (namespace, now - self.max_age(namespace)),
+        )
+        # Row cap: drop the oldest rows beyond max_rows
+        conn.execute(
+            """
+            DELETE FROM kv_cache WHERE namespace = ? AND key IN (
+                SELECT key FROM kv_cache WHERE namespace = ? ORDER BY created_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (namespace, namespace, self.max_rows),
+        )
+
+    def _memory_get(self, namespace: str, keys, cutoff: float) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        for k in keys:
+            entry = self._memory.get((namespace, k))
+            if entry is None:
+                continue
+            if entry[1] < cutoff:
+                del self._memory[(namespace, k)]
+                continue
+            self._memory.move_to_end((namespace, k))
+            found[k] = entry[0]
+        return found
+
+    def _memory_set(self, namespace: str, items: Dict[str, str], now: float) -> None:
+        for k, v in items.items():
+            previous = self._memory.pop((namespace, k), None)
+            self._memory[(namespace, k)] = (v, previous[1] if previous else now)
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+
+
+persistent_cache = PersistentCache(
+    settings.CACHE_DB_PATH or _DEFAULT_PATH,
+    max_age_sec=settings.CACHE_MAX_AGE_DAYS * 86400,
+    namespace_max_age=parse_namespace_max_age(settings.CACHE_NAMESPACE_MAX_AGE_DAYS),
+    max_rows=settings.CACHE_MAX_ROWS,
+    memory_max_entries=settings.CACHE_MEMORY_MAX_ENTRIES,
+)
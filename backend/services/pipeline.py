@@ -0,0 +1,236 @@
+"""
+Pipelined fetch → dedup → Nhân Dân verification.
+
+Both dedup and verification work per category, so there is no need to wait
+for every source before clustering, nor for every category's clustering
+before verifying. Each category gets its own chain
+(dedup_service.cluster_category → nhandan_fetcher.verify_category) that starts
+as soon as all sources expected to produce that category have finished.
+Wall time approaches the slowest single chain instead of the sum of the
+slowest fetch + slowest dedup + slowest verification.
+
+The category a source feeds is known up front from its URL
+(RSSFetcher._extract_category_from_url), which is also how articles get
+their category. Articles in an unexpected category are processed after the
+last source finishes; if that category's chain already started, they are
+deduped against its chosen masters (dedup_service.merge_late) once that
+chain is done, so duplicates across slow and fast sources are still caught.
+
+Articles are prefetched (services/article_prefetcher.py) as soon as their
+source finishes, so summarization later starts with content local. When a
+category is deduped, prefetches of its duplicates are cancelled and their
+budget refunded, and masters not prefetched yet (budget spent on earlier
+sources) are started then.
+
+Usage:
+    async for event in news_pipeline.run(urls, "16/03/2026", "6h00 đến 8h00", api_key):
+        if event.kind == "source_done": ...     # raw articles of one source
+        elif event.kind == "category_done": ... # deduped + verified category
+        elif event.kind == "fetch_done": ...    # all sources finished
+
+    articles = await news_pipeline.collect(urls, date, time_range, api_key)
+"""
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+from config import settings
+from services.dedup_service import dedup_service
+from services.article_prefetcher import article_prefetcher
+from services.nhandan_fetcher import nhandan_fetcher
+from services.rss_fetcher import rss_fetcher
+
+SOURCE_DONE = "source_done"
+CATEGORY_DONE = "category_done"
+FETCH_DONE = "fetch_done"
+
+
+@dataclass
+class PipelineEvent:
+    kind: str
+    source: str = ""
+    category: str = ""
+    articles: List[Dict] = field(default_factory=list)
+    error: Optional[BaseException] = None
+
+
+class NewsPipeline:
+    def __init__(self, fetcher=rss_fetcher, deduper=dedup_service, verifier=nhandan_fetcher, prefetcher=None):
+        self.fetcher = fetcher
+        self.deduper = deduper
+        self.verifier = verifier
+        # Optional background article prefetch (None = disabled)
+        self.prefetcher = prefetcher
+
+    async def run(
+        self,
+        rss_urls: List[str],
+        target_date: str,
+        time_range: str,
+        api_key: Optional[str],
+        dedup: bool = True,
+        verify: bool = True,
+    ) -> AsyncIterator[PipelineEvent]:
+        """
+        Run the pipeline and yield events as they happen.
+
+        Raises ValueError (invalid date/time range) like fetch_and_filter.
+        """
+        urls = list(dict.fromkeys(rss_urls))
+        expected = {u: self.fetcher._extract_category_from_url(u) for u in urls}
+        pending = Counter(expected.values())
+        # category -> source_url -> articles (flattened in rss_urls order so
+        # dedup masters / the per-category cap don't depend on completion order)
+        buckets: Dict[str, Dict[str, List[Dict]]] = {}
+        launched: set = set()
+        queue: asyncio.Queue = asyncio.Queue()
+        chains: List[asyncio.Task] = []
+        # Last chain per category: late batches wait for it and merge into its masters
+        last_chain: Dict[str, asyncio.Task] = {}
+        active = 0
+
+        def flatten(by_source: Dict[str, List[Dict]]) -> List[Dict]:
+            return [a for u in urls for a in by_source.get(u, [])]
+
+        def launch(category: str, articles: List[Dict]) -> None:
+            nonlocal active
+            active += 1
+            chain = asyncio.ensure_future(
+                self._run_chain(queue, category, articles, api_key, dedup, verify, last_chain.get(category))
+            )
+            last_chain[category] = chain
+            chains.append(chain)
+
+        async def produce() -> None:
+            error = None
+            try:
+                async for source_url, articles in self.fetcher.fetch_and_filter_iter(urls, target_date, time_range):
+                    await queue.put(PipelineEvent(SOURCE_DONE, source=source_url, articles=list(articles)))
+                    late: Dict[str, List[Dict]] = {}
+                    for article in articles:
+                        category = article.get("category", "KHÁC")
+                        if category in launched:
+                            late.setdefault(category, []).append(article)
+                        else:
+                            buckets.setdefault(category, {}).setdefault(source_url, []).append(article)
+                    for category, late_articles in late.items():
+                        # Category already in flight — merged into its masters after it finishes
+                        print(f"   ↪️ pipeline: {len(late_articles)} late {category} articles from {source_url}")
+                        launch(category, late_articles)
+                    pending[expected[source_url]] -= 1
+                    for category in list(buckets):
+                        if pending.get(category) == 0 and category in expected.values():
+                            launched.add(category)
+                            launch(category, flatten(buckets.pop(category)))
+                # Categories no source URL maps to are processed once everything is in
+                for category in list(buckets):
+                    launched.add(category)
+                    launch(category, flatten(buckets.pop(category)))
+            except Exception as e:
+                error = e
+            await queue.put(PipelineEvent(FETCH_DONE, error=error))
+
+        # Warm the Nhân Dân headline cache while sources are still loading
+        prewarm = (
+            asyncio.ensure_future(self.verifier.ensure_cache_fresh())
+            if verify and api_key else None
+        )
+        producer = asyncio.ensure_future(produce())
+        prefetch_budget = settings.ARTICLE_PREFETCH_MAX_PER_RUN if self.prefetcher else 0
+        fetch_done = False
+        try:
+            while not fetch_done or active:
+                event = await queue.get()
+                if event.kind == FETCH_DONE:
+                    fetch_done = True
+                    if event.error is not None:
+                        raise event.error
+                elif event.kind == SOURCE_DONE:
+                    if prefetch_budget > 0:
+                        prefetch_budget -= self.prefetcher.prefetch(
+                            [a.get("url", "") for a in event.articles], limit=prefetch_budget
+                        )
+                elif event.kind == CATEGORY_DONE:
+                    active -= 1
+                    if self.prefetcher:
+                        if dedup:
+                            # Duplicates' budget goes back to the run
+                            prefetch_budget += self.prefetcher.cancel(
+                                a.get("url", "") for a in event.articles if not a.get("is_master", True)
+                            )
+                        if prefetch_budget > 0:
+                            # Masters the budget did not reach at SOURCE_DONE (pending / cached ones are skipped)
+                            prefetch_budget -= self.prefetcher.prefetch(
+                                [a.get("url", "") for a in event.articles if a.get("is_master", True)],
+                                limit=prefetch_budget,
+                            )
+                yield event
+        finally:
+            for task in [producer, *chains] + ([prewarm] if prewarm else []):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(producer, *chains, *([prewarm] if prewarm else []), return_exceptions=True)
+
+    async def _run_chain(
+        self,
+        queue: asyncio.Queue,
+        category: str,
+        articles: List[Dict],
+        api_key: Optional[str],
+        dedup: bool,
+        verify: bool,
+        previous: Optional[asyncio.Task] = None,
+    ) -> List[Dict]:
+        """
+        Dedup + verify one batch of a category. With `previous` (the category's
+        earlier chain) the batch is late: it is deduped against the masters that
+        chain chose. Returns every article of the category processed so far.
+        """
+        earlier: List[Dict] = []
+        try:
+            if previous is not None:
+                earlier = await previous
+            if dedup:
+                if previous is None:
+                    articles = await self.deduper.cluster_category(category, articles, api_key)
+                else:
+                    masters = [a for a in earlier if a.get("is_master", True)]
+                    articles = await self.deduper.merge_late(category, masters, articles, api_key)
+            if verify:
+                articles = await self.verifier.verify_category(category, articles, api_key)
+        except Exception as e:
+            print(f"❌ pipeline chain {category}: {type(e).__name__}: {e}")
+        finally:
+            await queue.put(PipelineEvent(CATEGORY_DONE, category=category, articles=articles))
+        return earlier + articles
+
+    async def collect(
+        self,
+        rss_urls: List[str],
+        target_date: str,
+        time_range: str,
+        api_key: Optional[str],
+        dedup: bool = True,
+        verify: bool = True,
+    ) -> List[Dict]:
+        """Run the pipeline to completion; categories ordered by first source in rss_urls."""
+        by_category: Dict[str, List[Dict]] = {}
+        async for event in self.run(rss_urls, target_date, time_range, api_key, dedup=dedup, verify=verify):
+            if event.kind == CATEGORY_DONE:
+                by_category.setdefault(event.category, []).extend(event.articles)
+        return order_by_sources(rss_urls, by_category, self.fetcher)
+
+
+def order_by_sources(rss_urls: List[str], by_category: Dict[str, List[Dict]], fetcher=rss_fetcher) -> List[Dict]:
+    order = list(dict.fromkeys(fetcher._extract_category_from_url(u) for u in rss_urls))
+    order += [c for c in by_category if c not in order]
+    result: List[Dict] = []
+    for category in order:
+        result.extend(by_category.get(category, []))
+    return result
+
+
+news_pipeline = NewsPipeline(
+    prefetcher=article_prefetcher if settings.ARTICLE_PREFETCH_ENABLED else None,
+)
@@ -91,6 +91,11 @@ async def ensure_tables() -> None:
     )
 
 
+def db_logging_active() -> bool:
+    """True once the pool is up — lets callers skip scheduling no-op log tasks."""
+    return asyncpg is not None and _pool is not None
+
+
 async def log_request_to_db(
     *,
     request_id: str,
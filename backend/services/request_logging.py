@@ -0,0 +1,138 @@
+"""
+Request id + access logging as a pure ASGI middleware.
+
+Replaces the former @app.middleware("http") (BaseHTTPMiddleware), which ran
+every request through an extra task and re-wrapped the response body
+stream — overhead on each request and an extra hop for every SSE / NDJSON
+chunk. Here only http.response.start is touched (X-Request-ID is added);
+body messages are passed to the server unchanged.
+
+Per request:
+  - request id from X-Request-ID (or a new uuid4 hex), set in request_context
+    for the whole request, including streamed bodies;
+  - latency = time to response start (as before: the old middleware logged
+    when call_next returned, i.e. when headers were ready);
+  - one app_logger INFO line, plus a request_logs row when DB logging is on;
+  - unhandled exceptions before the response starts are logged (ERROR, with
+    traceback) and recorded as 500, then re-raised.
+
+Usage:
+    app.add_middleware(RequestLoggingMiddleware)   # last → outermost
+"""
+import asyncio
+import time
+import uuid
+from typing import Optional
+
+from services.app_logger import logger
+from services.request_context import request_id_var
+from services.request_db_logger import db_logging_active, log_request_to_db
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers", ()):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _client_ip(scope) -> Optional[str]:
+    # Prefer proxy-provided IP if present.
+    xff = _header(scope, b"x-forwarded-for")
+    if xff:
+        return xff.split(",")[0].strip()[:128]
+    client = scope.get("client")
+    if client and client[0]:
+        return client[0][:128]
+    return None
+
+
+class RequestLoggingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _header(scope, b"x-request-id") or uuid.uuid4().hex
+        encoded_id = request_id.encode("latin-1")
+        start = time.perf_counter()
+        status_code: Optional[int] = None
+
+        async def send_with_request_id(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Ensure correlation id is visible to the client (replaces any app-set value).
+                headers = [(k, v) for k, v in message.get("headers", ()) if k != b"x-request-id"]
+                headers.append((b"x-request-id", encoded_id))
+                message = {**message, "headers": headers}
+                self._log(scope, request_id, status_code, start, None)
+            await send(message)
+
+        # Set request id in ContextVar for correlation across async steps.
+        ctx_token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except Exception as exc:
+            if status_code is None:
+                self._log(scope, request_id, 500, start, exc)
+            raise
+        finally:
+            request_id_var.reset(ctx_token)
+
+    @staticmethod
+    def _log(scope, request_id: str, status_code: int, start: float, exc: Optional[Exception]) -> None:
+        latency_ms = int((time.perf_counter() - start) * 1000)
+        method = scope.get("method", "")
+        path = scope.get("path", "")
+        client_ip = _client_ip(scope)
+        if exc is None:
+            # Log request summary at INFO level (does not read body — safe for streaming).
+            logger.info(
+                "%s %s %s %dms",
+                method,
+                path,
+                status_code,
+                latency_ms,
+                extra={
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
+                    "latency_ms": latency_ms,
+                    "client_ip": client_ip,
+                    "request_id": request_id,
+                },
+            )
+        else:
+            # Log error with traceback + correlation fields.
+            logger.error(
+                "Unhandled exception: %s %s — %s",
+                method,
+                path,
+                exc,
+                exc_info=exc,
+                extra={
+                    "method": method,
+                    "path": path,
+                    "latency_ms": latency_ms,
+                    "client_ip": client_ip,
+                    "request_id": request_id,
+                },
+            )
+
+        if db_logging_active():
+            asyncio.create_task(
+                log_request_to_db(
+                    request_id=request_id,
+                    method=method,
+                    path=path,
+                    client_ip=client_ip,
+                    user_agent=_header(scope, b"user-agent") or "",
+                    status_code=status_code,
+                    latency_ms=latency_ms,
+                    error_message=str(exc)[:1000] if exc is not None else None,
+                )
+            )
@@ -0,0 +1,246 @@
+"""
+Request-level result cache + singleflight for /api/rss/fetch(_stream).
+
+Editors often send the same (rss_urls, date, time_range) within minutes;
+each request used to run fetch → dedup → verification (with LLM calls)
+from scratch. Here every distinct normalized request is one *flight*:
+
+  - the first request starts the computation as a background task (it keeps
+    running even if that client disconnects), and the flight records every
+    SSE event it emits, already serialized;
+  - concurrent identical requests join the flight and tail its event log;
+  - once finished successfully, the flight stays cached for a TTL (short for
+    today's date — new articles keep arriving — long for past dates), and
+    later requests replay the recorded events instantly.
+
+Failed flights (an 'error' event) are never cached. Results paid for with
+one API key are never served to another (the key's hash is part of the
+cache key), and finished flights are evicted LRU once their recorded
+events exceed FETCH_CACHE_MAX_BYTES.
+
+Each flight also gets a random *result set id*: the final 'complete' event
+carries it as "result_set" (and the fetch routes send X-Result-Set), so
+clients can page through the cached articles with GET /api/articles while
+the flight stays fresh. The id is an unguessable token mapped to the cache
+key server-side — the key itself (derivable from the request + API key
+hash) is never handed out.
+
+Usage:
+    key = fetch_cache_key(urls, date, time_range, provider, api_key, dedup, verify)
+    flight, status = fetch_result_cache.get_or_start(key, fetch_cache_ttl(date), make_events)
+    async for line in flight.tail():   # b"data: {...}\n\n" lines
+        ...
+    await flight.wait()                # flight.result = final articles
+    fetch_result_cache.result_set(flight.set_id)  # same articles later, None once expired
+"""
+import asyncio
+import hashlib
+import json
+import re
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from config import settings
+from services.fast_json import sse_event
+
+VN_TZ = ZoneInfo("Asia/Ho_Chi_Minh")
+
+CACHE_MISS = "MISS"
+CACHE_HIT = "HIT"
+CACHE_JOIN = "JOIN"
+
+
+def _sse(event: Dict) -> bytes:
+    return sse_event(event)
+
+
+def fetch_cache_key(
+    rss_urls: List[str],
+    date: str,
+    time_range: str,
+    provider: str,
+    api_key: Optional[str],
+    dedup: bool,
+    verify: bool,
+) -> str:
+    """
+    Normalized request key: URL set order/duplicates and whitespace don't matter.
+    Scoped to the API key (a rate-limited key's degraded result, with dedup /
+    verification skipped, must not be served to requests with another key).
+    """
+    payload = {
+        "urls": sorted({u.strip() for u in rss_urls}),
+        "date": date.strip(),
+        "time_range": re.sub(r"\s+", " ", time_range.strip()),
+        "provider": provider,
+        # Hash only — never store the key itself
+        "api_key": hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else "",
+        "dedup": dedup,
+        "verify": verify,
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def fetch_cache_ttl(date: str, now: Optional[datetime] = None) -> float:
+    """TTL in seconds: short for today (or future), long for past dates, 0 if unparseable."""
+    try:
+        target = datetime.strptime(date.strip(), "%d/%m/%Y").date()
+    except ValueError:
+        return 0
+    today = (now or datetime.now(VN_TZ)).astimezone(VN_TZ).date()
+    if target < today:
+        return settings.FETCH_CACHE_TTL_PAST_SEC
+    return settings.FETCH_CACHE_TTL_TODAY_SEC
+
+
+class Flight:
+    """One computation's recorded SSE event log (append-only)."""
+
+    def __init__(self, key: str = ""):
+        self.key = key
+        # Random, handed to clients for GET /api/articles (never the key)
+        self.set_id = secrets.token_urlsafe(16) if key else ""
+        self.lines: List[bytes] = []
+        self.size = 0  # bytes recorded in lines
+        self.result: Optional[List[Dict]] = None
+        self.error: Optional[str] = None
+        self.done = False
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Event()
+
+    def publish(self, event: Dict) -> None:
+        if self.set_id and event.get("step") == "complete":
+            event = {**event, "result_set": self.set_id}
+        try:
+            line = _sse(event)
+        except Exception as json_err:
+            print(f"JSON serialization error: {json_err}")
+            event = {'step': 'error', 'status': 'error', 'message': f'Lỗi serialize: {str(json_err)}'}
+            line = _sse(event)
+        if event.get("step") == "complete":
+            self.result = event.get("articles", [])
+        elif event.get("step") == "error":
+            self.error = event.get("message", "error")
+        self.lines.append(line)
+        self.size += len(line)
+        self._notify()
+
+    def finish(self) -> None:
+        self.done = True
+        self.finished_at = time.monotonic()
+        self._notify()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def tail(self, offset: int = 0) -> AsyncIterator[bytes]:
+        """Yield recorded lines from offset, then live ones until the flight finishes."""
+        while True:
+            changed = self._changed
+            while offset < len(self.lines):
+                yield self.lines[offset]
+                offset += 1
+            if self.done:
+                return
+            await changed.wait()
+
+    async def wait(self) -> None:
+        async for _ in self.tail(len(self.lines)):
+            pass
+
+
+class FetchResultCache:
+    def __init__(self, max_entries: int = 64, max_bytes: int = 128 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._flights: "OrderedDict[str, Tuple[Flight, float]]" = OrderedDict()
+        # result set id -> cache key
+        self._sets: Dict[str, str] = {}
+
+    def _drop(self, key: str) -> None:
+        flight, _ = self._flights.pop(key)
+        self._sets.pop(flight.set_id, None)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in list(self._flights):
+            flight, ttl = self._flights[key]
+            if flight.done and (flight.error is not None or flight.result is None or now - flight.finished_at > ttl):
+                self._drop(key)
+        # LRU bound — only finished flights are dropped, in-flight ones must stay joinable
+        for key in list(self._flights):
+            if len(self._flights) <= self.max_entries:
+                break
+            if self._flights[key][0].done:
+                self._drop(key)
+        # Byte bound — a full-day result is MBs of recorded events plus its records
+        total = sum(flight.size for flight, _ in self._flights.values())
+        for key in list(self._flights):
+            if total <= self.max_bytes:
+                break
+            flight = self._flights[key][0]
+            if flight.done:
+                total -= flight.size
+                self._drop(key)
+
+    def get_or_start(
+        self,
+        key: str,
+        ttl: float,
+        events: Callable[[], AsyncIterator[Dict]],
+    ) -> Tuple[Flight, str]:
+        """
+        Return (flight, status) where status is MISS (started here), JOIN
+        (computation in progress) or HIT (finished and still fresh).
+        """
+        self._evict()
+        entry = self._flights.get(key)
+        if entry is not None:
+            self._flights.move_to_end(key)
+            flight = entry[0]
+            return flight, (CACHE_HIT if flight.done else CACHE_JOIN)
+
+        flight = Flight(key)
+
+        async def run() -> None:
+            try:
+                async for event in events():
+                    flight.publish(event)
+            except Exception as e:
+                flight.publish({'step': 'error', 'status': 'error', 'message': str(e)})
+            finally:
+                flight.finish()
+
+        flight.task = asyncio.ensure_future(run())
+        if settings.FETCH_CACHE_ENABLED and ttl > 0:
+            self._flights[key] = (flight, ttl)
+        else:
+            # Not cacheable (disabled / invalid date) — still joinable while running
+            self._flights[key] = (flight, 0)
+        if flight.set_id:
+            self._sets[flight.set_id] = key
+        return flight, CACHE_MISS
+
+    def result_set(self, set_id: str) -> Optional[List[Dict]]:
+        """Articles of the finished, successful and still fresh flight with this result set id (None otherwise)."""
+        entry = self._flights.get(self._sets.get(set_id, ""))
+        if entry is None:
+            return None
+        flight, ttl = entry
+        if not set_id or flight.set_id != set_id:
+            return None
+        if not flight.done or flight.error is not None or flight.result is None:
+            return None
+        if time.monotonic() - flight.finished_at > ttl:
+            return None
+        return flight.result
+
+
+fetch_result_cache = FetchResultCache(settings.FETCH_CACHE_MAX_ENTRIES, settings.FETCH_CACHE_MAX_BYTES)
@@ -0,0 +1,125 @@
+"""
+Retry policy with jittered exponential backoff + per-run retry accounting.
+
+Replaces the fixed pauses the summarizer used to take (0.5 s before every
+article, 0.5 s between batches, 2/4 s between fetch retries, 1-32 s between
+AI retries). Now nothing waits unless an attempt actually failed, and then
+the wait is "full jitter" exponential so parallel articles don't retry in
+lock-step. Request pacing itself is left to the global limiter
+(services/crawl_scheduler.py: per-host cap + politeness interval).
+
+Callers hold their concurrency slot per attempt only, so an article waiting
+to retry does not occupy a summarizer slot.
+
+Usage:
+    from services.retry_policy import FETCH_RETRY, RetryStats, run_with_stats
+
+    async def fetch(url):
+        for attempt in range(FETCH_RETRY.attempts):
+            if attempt:
+                await FETCH_RETRY.sleep(attempt)   # recorded on the current RetryStats
+            async with semaphore:
+                ...
+
+    stats = RetryStats()
+    await asyncio.gather(*(run_with_stats(stats, fetch(u)) for u in urls))
+    stats.as_dict()   # {"retries", "backoff_sec", "fixed_sleep_sec", "saved_sec"}
+"""
+import asyncio
+import random
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class RetryStats:
+    """Retries/backoff of one summarization run, compared with the old fixed pauses."""
+
+    def __init__(self):
+        self.retries = 0
+        self.backoff_sec = 0.0
+        # What the removed fixed sleeps would have cost for the same run
+        self.fixed_sleep_sec = 0.0
+
+    def record_skipped(self, seconds: float) -> None:
+        """A fixed pause that no longer happens (e.g. the per-article 0.5 s)."""
+        self.fixed_sleep_sec += seconds
+
+    def record_retry(self, waited: float, fixed: float) -> None:
+        self.retries += 1
+        self.backoff_sec += waited
+        self.fixed_sleep_sec += fixed
+
+    @property
+    def saved_sec(self) -> float:
+        return max(0.0, self.fixed_sleep_sec - self.backoff_sec)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "retries": self.retries,
+            "backoff_sec": round(self.backoff_sec, 2),
+            "fixed_sleep_sec": round(self.fixed_sleep_sec, 2),
+            "saved_sec": round(self.saved_sec, 2),
+        }
+
+
+_retry_stats_var: ContextVar[Optional[RetryStats]] = ContextVar("retry_stats_var", default=None)
+
+
+def use_retry_stats(stats: RetryStats) -> Token:
+    """Make *stats* the accumulator for this context (inherited by tasks spawned from it)."""
+    return _retry_stats_var.set(stats)
+
+
+def current_retry_stats() -> Optional[RetryStats]:
+    return _retry_stats_var.get()
+
+
+async def run_with_stats(stats: RetryStats, awaitable: Awaitable[T]) -> T:
+    """Await *awaitable* with *stats* as the current RetryStats (scoped to this call)."""
+    token = use_retry_stats(stats)
+    try:
+        return await awaitable
+    finally:
+        _retry_stats_var.reset(token)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    attempts: total tries (first try included)
+    base_delay / multiplier / max_delay: exponential ceiling of retry n = base * multiplier**(n-1)
+    jitter: fraction of the ceiling that is randomized (1.0 = full jitter)
+    legacy_delay: the fixed pause this policy replaced — only used for the saved-seconds metric
+    """
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    multiplier: float = 2.0
+    max_delay: float = 8.0
+    jitter: float = 1.0
+    legacy_delay: Callable[[int], float] = lambda retry: 0.0
+
+    def delay(self, retry: int, rng: Callable[[], float] = random.random) -> float:
+        """Backoff before retry number *retry* (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** max(0, retry - 1))
+        return ceiling * (1.0 - self.jitter + self.jitter * rng())
+
+    async def sleep(self, retry: int) -> float:
+        """Wait before retry number *retry*; recorded on the current RetryStats."""
+        waited = self.delay(retry)
+        await asyncio.sleep(waited)
+        stats = current_retry_stats()
+        if stats is not None:
+            stats.record_retry(waited, self.legacy_delay(retry))
+        return waited
+
+
+# Article page fetch: empty/blocked page or network error (was 2 s, 4 s)
+FETCH_RETRY = RetryPolicy(attempts=3, base_delay=0.5, max_delay=4.0, legacy_delay=lambda retry: 2.0 * retry)
+# AI 429 / resource exhausted (was min(32, 3 s * n))
+AI_RATE_LIMIT_RETRY = RetryPolicy(base_delay=2.0, max_delay=32.0, legacy_delay=lambda retry: min(32.0, 3.0 * retry))
+# AI 5xx / timeout (was 2 s + n)
+AI_TRANSIENT_RETRY = RetryPolicy(base_delay=1.0, max_delay=8.0, legacy_delay=lambda retry: 1.0 + retry)
@@ -1,32 +1,94 @@
 import asyncio
-import feedparser
 import html
 import httpx
-from typing import List, Dict, Optional
-from datetime import datetime, time
-from dateutil import parser as date_parser
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+from datetime import datetime, time, timedelta, timezone
 import re
 from zoneinfo import ZoneInfo
+from config import settings
 from services.secure_fetcher import secure_fetcher
+from services.feed_parser import feed_parser
+from services.date_parsing import feed_date_parser
+from services.crawl_scheduler import crawl_scheduler
+from services.persistent_cache import persistent_cache
+from services.stream_fetch import PatternStop, stream_text
+from services.article_record import ArticleRecord, clean_description
+from services.source_registry import (
+    NEWSPAPERS,
+    STRATEGY_HANOIMOI_HTML,
+    STRATEGY_HANOIMOI_RSS,
+    STRATEGY_HTTP,
+    STRATEGY_SECURE,
+    STRATEGY_VOV_HTML,
+    source_index,
+)
 
 VN_TZ = ZoneInfo("Asia/Ho_Chi_Minh")
 
-def _normalize_gmt_offset(pub_str: str) -> str:
+# VOV detail pages: only the <head> is needed for article:published_time
+_VOV_PUBLISHED_TIME_RES = (
+    re.compile(r'<meta[^>]+property=["\']article:published_time["\'][^>]+content=["\']([^"\']+)["\']'),
+    # Reversed attribute order
+    re.compile(r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+property=["\']article:published_time["\']'),
+)
+_HEAD_END_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+_VOV_HEAD_MAX_BYTES = 128 * 1024
+_VOV_PUBLISHED_CACHE_NS = "vov_published_time"
+
+# Hà Nội Mới RSS double-escapes CDATA (`&lt;![CDATA[...]]&gt;`) so feedparser returns
+# an empty description/image (the lxml engine in feed_parser unwraps it, but the
+# feedparser fallback does not). One precompiled token scan over the raw XML pulls
+# link + escaped CDATA per <item>; only the CDATA payload is unescaped afterwards.
+_HNM_TOKEN_RE = re.compile(
+    r"<item>|</item>|<link>([^<]+)</link>|&lt;!\[CDATA\[(.*?)\]\]&gt;",
+    re.DOTALL,
+)
+_IMG_SRC_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']')
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _extract_hanoimoi_extras(content: str) -> Dict[str, Dict[str, str]]:
     """
-    Fix dateutil misparse of 'GMT+N' timezone strings.
-
-    dateutil follows POSIX convention where GMT+7 means UTC-7 (west of UTC).
-    But RSS feeds (RFC 2822) intend GMT+7 to mean UTC+7 (east of UTC, i.e. Vietnam).
-
-    This function replaces 'GMT+7' -> '+0700' and 'GMT-5' -> '-0500' so that
-    dateutil parses them with the correct sign.
+    Map item link -> {'thumbnail', 'description'} from a hanoimoi RSS body
+    in a single pass (first <link> and first CDATA block of each <item>).
     """
-    def fix_gmt(m: re.Match) -> str:
-        sign = m.group(1)
-        hours = int(m.group(2))
-        return f"{sign}{hours:02d}00"
+    extras: Dict[str, Dict[str, str]] = {}
+    in_item = False
+    link: Optional[str] = None
+    cdata: Optional[str] = None
+    for m in _HNM_TOKEN_RE.finditer(content):
+        token = m.group(0)
+        if token == "<item>":
+            in_item, link, cdata = True, None, None
+        elif token == "</item>":
+            if in_item and link and cdata is not None:
+                inner = html.unescape(cdata)
+                img_m = _IMG_SRC_RE.search(inner)
+                extras[link] = {
+                    "thumbnail": img_m.group(1) if img_m else "",
+                    "description": " ".join(_TAG_RE.sub(" ", inner).split()),
+                }
+            in_item = False
+        elif not in_item:
+            continue
+        elif m.group(1) is not None:
+            if link is None:
+                link = m.group(1).strip()
+        elif cdata is None:
+            cdata = m.group(2)
+    return extras
+
+
+def _apply_hanoimoi_extras(article: Dict, extras: Dict[str, Dict[str, str]]) -> None:
+    """Patch thumbnail (always) and description (only if RSS gave none) in place."""
+    extra = extras.get(article["url"])
+    if not extra:
+        return
+    if extra["thumbnail"]:
+        article["thumbnail"] = extra["thumbnail"]
+    if extra["description"] and not article["description"]:
+        article["description"] = extra["description"]
 
-    return re.sub(r"GMT([+-])(\d+)", fix_gmt, pub_str)
 
 class RSSFetcher:
     """
@@ -35,42 +97,25 @@ class RSSFetcher:
     Uses Python datetime for accurate filtering instead of AI
     """
     
-    # Map RSS feed URLs to newspaper display names
-    NEWSPAPER_SOURCES = {
-        "laodong.vn": "LAO ĐỘNG",
-        "dantri.com.vn": "DÂN TRÍ",
-        "vtv.vn": "VTV NEWS",
-        "hanoimoi.vn": "HÀ NỘI MỚI",
-        "sggp.org.vn": "SGGP",
-        "vietnamplus.vn": "VIETNAMPLUS",
-        "tienphong.vn": "TIỀN PHONG",
-        "vnexpress.net": "VNS EXPRESS",
-        "tuoitre.vn": "TUỔI TRẺ",
-        "cafef.vn": "CAFEF",
-        "vov.vn": "VOV",
-        "baotintuc.vn": "BÁO TIN TỨC",
-        "thanhnien.vn": "THANH NIÊN",
+    # Map RSS feed URLs to newspaper display names (declared in services/source_registry.py)
+    NEWSPAPER_SOURCES = {paper.domain: paper.name for paper in NEWSPAPERS}
+
+    # Dispatch order + log line per fetch strategy (strategy comes from the source registry)
+    STRATEGY_LOG = {
+        # Legacy path — hanoimoi now has RSS at /rss/<category>
+        STRATEGY_HANOIMOI_HTML: "🗞️ Scraping Hà Nội Mới HTML for {n} category pages",
+        # hanoimoi RSS — use CF proxy to bypass datacenter IP block
+        STRATEGY_HANOIMOI_RSS: "📰 Fetching Hà Nội Mới RSS ({n} feeds)",
+        # scrape HTML directly (no RSS available)
+        STRATEGY_VOV_HTML: "📻 Scraping VOV HTML for {n} category pages",
+        STRATEGY_SECURE: "🛡️ Using Secure Fetcher for {n} URLs (anti-bot protection)",
+        STRATEGY_HTTP: "⚡ Using HTTP for {n} URLs (concurrent, no anti-bot)",
     }
 
     @staticmethod
     def _clean_description(raw_description: str) -> str:
-        """
-        Chuẩn hóa mô tả lấy từ RSS:
-        - Bỏ HTML tags
-        - Chuẩn hóa whitespace
-        - Tránh trường hợp dấu ba chấm bị lặp (....)
-        """
-        if not raw_description:
-            return ""
-
-        text = re.sub(r"<[^>]+>", " ", raw_description)
-        text = html.unescape(text)
-        text = re.sub(r"\s+", " ", text).strip()
-
-        # Chuẩn hóa phần kết thúc nếu RSS đã cắt ngắn
-        text = re.sub(r"\.{4,}$", "…", text)
-        text = re.sub(r"…{2,}$", "…", text)
-        return text
+        """Chuẩn hóa mô tả lấy từ RSS (services/article_record.py:clean_description)."""
+        return clean_description(raw_description)
     
     async def fetch_and_filter(
         self,
@@ -87,7 +132,30 @@ class RSSFetcher:
             time_range: Time range like "6h00 đến 8h00"
             
         Returns:
-            List of filtered articles with metadata
+            List of filtered articles with metadata (grouped in rss_urls order)
+        """
+        by_source: Dict[str, List[Dict]] = {}
+        async for source_url, articles in self.fetch_and_filter_iter(rss_urls, target_date, time_range):
+            by_source[source_url] = articles
+
+        all_articles = []
+        for url in dict.fromkeys(rss_urls):
+            all_articles.extend(by_source.get(url, []))
+        return all_articles
+
+    async def fetch_and_filter_iter(
+        self,
+        rss_urls: List[str],
+        target_date: str,
+        time_range: str
+    ) -> AsyncIterator[Tuple[str, List[Dict]]]:
+        """
+        Progressive version of fetch_and_filter.
+
+        Every source URL is fetched as its own task; yields (source_url, articles)
+        as soon as that source finishes, so fast feeds are not held back by
+        Cloudflare-protected ones. Each URL is yielded exactly once (possibly
+        with an empty list). Raises ValueError on invalid date/time range.
         """
         # Parse target date
         try:
@@ -98,264 +166,210 @@ class RSSFetcher:
         
         # Parse time range
         start_time, end_time = self._parse_time_range(time_range)
-        
-        all_articles = []
-        
-        # Separate URLs by fetch strategy
-        hanoimoi_html_urls = []  # scrape HTML directly (legacy — only used if non-/rss/ URL is passed)
-        hanoimoi_rss_urls = []   # hanoimoi RSS — use CF proxy to bypass datacenter IP block
-        vov_html_urls = []       # scrape HTML directly (no RSS available)
-        secure_urls = []
-        normal_urls = []
-
-        for url in rss_urls:
-            if 'hanoimoi.vn' in url.lower() and '/rss/' not in url.lower():
-                hanoimoi_html_urls.append(url)
-            elif 'hanoimoi.vn' in url.lower() and '/rss/' in url.lower():
-                hanoimoi_rss_urls.append(url)
-            elif 'vov.vn' in url.lower() and '/rss/' not in url.lower():
-                vov_html_urls.append(url)
-            elif 'laodong.vn' in url.lower():
-                secure_urls.append(url)
-            else:
-                normal_urls.append(url)
-
-        # Scrape Hà Nội Mới HTML (legacy path — hanoimoi now has RSS at /rss/<category>)
-        if hanoimoi_html_urls:
-            print(f"🗞️ Scraping Hà Nội Mới HTML for {len(hanoimoi_html_urls)} category pages")
-            hnm_articles = await self._scrape_hanoimoi_html(
-                hanoimoi_html_urls, target_dt, start_time, end_time
-            )
-            all_articles.extend(hnm_articles)
-
-        # Fetch Hà Nội Mới RSS (Cloudflare Managed Challenge — FlareSolverr → CF Worker → residential → secure_fetcher)
-        if hanoimoi_rss_urls:
-            import os as _os2, urllib.parse as _uparse2
-            flaresolverr_url = _os2.environ.get("FLARESOLVERR_URL", "").rstrip("/")
-            cf_proxy = _os2.environ.get("CF_PROXY_URL", "").rstrip("/")
-            webshare_proxy = _os2.environ.get("WEBSHARE_PROXY_URL", "").strip()
-            if flaresolverr_url:
-                print(f"🔥 Fetching Hà Nội Mới RSS via FlareSolverr ({len(hanoimoi_rss_urls)} feeds)")
-            elif cf_proxy:
-                print(f"🔀 Fetching Hà Nội Mới RSS via CF Worker proxy ({len(hanoimoi_rss_urls)} feeds)")
-            elif webshare_proxy:
-                print(f"🔀 Fetching Hà Nội Mới RSS via residential proxy ({len(hanoimoi_rss_urls)} feeds)")
-            else:
-                print(f"📰 Fetching Hà Nội Mới RSS via secure_fetcher fallback ({len(hanoimoi_rss_urls)} feeds)")
-
-            _hnm_headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/rss+xml, application/xml, text/xml, */*",
-                "Accept-Language": "vi-VN,vi;q=0.9,en;q=0.8",
-            }
+        window = (target_dt, start_time, end_time)
 
-            async def _fetch_hnm_rss(rss_url: str) -> tuple:
-                # Layer 1: FlareSolverr — giải CF Managed Challenge bằng Chrome thật
-                if flaresolverr_url:
-                    try:
-                        async with httpx.AsyncClient(timeout=60) as c:
-                            resp = await c.post(
-                                f"{flaresolverr_url}/v1",
-                                json={"cmd": "request.get", "url": rss_url, "maxTimeout": 45000},
-                            )
-                            if resp.status_code == 200:
-                                solution = resp.json().get("solution", {})
-                                content = solution.get("response", "")
-                                # Chrome browser wraps XML in HTML viewer — extract raw XML
-                                import html as _html_mod
-                                for marker in ["<?xml", "<rss", "<feed"]:
-                                    idx = content.find(marker)
-                                    if idx >= 0:
-                                        content = content[idx:]
-                                        if "&lt;" in content:
-                                            content = _html_mod.unescape(content)
-                                        break
-                                stripped = content.strip()
-                                if stripped.startswith("<?xml") or stripped.startswith("<rss") or stripped.startswith("<feed"):
-                                    print(f"   ✅ FlareSolverr: hanoimoi RSS OK {rss_url}")
-                                    return rss_url, content
-                                print(f"   ⚠️ FlareSolverr non-XML for {rss_url}, trying next layer")
-                            else:
-                                print(f"   ⚠️ FlareSolverr HTTP {resp.status_code} for {rss_url}, trying next layer")
-                    except Exception as e:
-                        print(f"   ❌ FlareSolverr error {rss_url}: {e}, trying next layer")
-                # Layer 2: CF Worker proxy
-                if cf_proxy:
-                    try:
-                        proxied = f"{cf_proxy}/?url={_uparse2.quote(rss_url, safe='')}"
-                        async with httpx.AsyncClient(timeout=20, follow_redirects=True, headers=_hnm_headers) as c:
-                            resp = await c.get(proxied)
-                            content = resp.text
-                            stripped = content.strip()
-                            if stripped.startswith("<?xml") or stripped.startswith("<rss"):
-                                print(f"   ✅ CF Worker: hanoimoi RSS OK {rss_url}")
-                                return rss_url, content
-                            print(f"   ⚠️ CF Worker non-XML for {rss_url} (status {resp.status_code}), trying next layer")
-                    except Exception as e:
-                        print(f"   ❌ CF Worker error {rss_url}: {e}, trying next layer")
-                # Layer 3: Residential proxy
-                if webshare_proxy:
-                    try:
-                        async with httpx.AsyncClient(
-                            timeout=20, follow_redirects=True, headers=_hnm_headers,
-                            proxy=webshare_proxy
-                        ) as c:
-                            resp = await c.get(rss_url)
-                            content = resp.text
-                            stripped = content.strip()
-                            if stripped.startswith("<?xml") or stripped.startswith("<rss"):
-                                return rss_url, content
-                            print(f"   ⚠️ hanoimoi RSS non-XML via proxy for {rss_url} (status {resp.status_code})")
-                    except Exception as e:
-                        print(f"   ❌ hanoimoi RSS proxy error {rss_url}: {e}")
-                # Layer 4+: secure_fetcher (curl_cffi → rss2json → ScrapingAnt → Playwright)
-                content = await secure_fetcher.fetch_rss(rss_url)
-                return rss_url, content
-
-            hnm_rss_results = await asyncio.gather(*[_fetch_hnm_rss(u) for u in hanoimoi_rss_urls])
-
-            for rss_url, content in hnm_rss_results:
-                if not content:
-                    print(f"   ❌ hanoimoi RSS {rss_url}: No content")
-                    continue
-                feed = feedparser.parse(content)
-                print(f"   ✅ hanoimoi RSS {rss_url}: {len(feed.entries)} entries")
+        # Separate URLs by fetch strategy (one dict lookup per URL)
+        by_strategy: Dict[str, List[str]] = {strategy: [] for strategy in self.STRATEGY_LOG}
+        for url in dict.fromkeys(rss_urls):
+            by_strategy.setdefault(source_index.record_for(url).strategy, []).append(url)
 
-                # Extract thumbnail + description from double-escaped CDATA
-                hanoimoi_extras: dict = {}
-                for item_xml in re.findall(r'<item>(.*?)</item>', content, re.DOTALL):
-                    link_m = re.search(r'<link>([^<]+)</link>', item_xml)
-                    if not link_m:
-                        continue
-                    item_url = link_m.group(1).strip()
-                    cdata_m = re.search(r'&lt;!\[CDATA\[(.*?)\]\]&gt;', item_xml, re.DOTALL)
-                    if cdata_m:
-                        inner = html.unescape(cdata_m.group(1))
-                        img_m = re.search(r'<img[^>]+src=["\']([^"\']+)["\']', inner)
-                        text = re.sub(r'<[^>]+>', ' ', inner).strip()
-                        text = re.sub(r'\s+', ' ', text)
-                        hanoimoi_extras[item_url] = {
-                            'thumbnail': img_m.group(1) if img_m else '',
-                            'description': text,
-                        }
-
-                for entry in feed.entries:
-                    article = self._process_entry(entry, target_dt, start_time, end_time, rss_url)
-                    if article:
-                        extras = hanoimoi_extras.get(article['url'], {})
-                        if extras.get('thumbnail'):
-                            article['thumbnail'] = extras['thumbnail']
-                        if extras.get('description') and not article['description']:
-                            article['description'] = extras['description']
-                        all_articles.append(article)
-
-        # Scrape VOV HTML (no RSS available)
-        if vov_html_urls:
-            print(f"📻 Scraping VOV HTML for {len(vov_html_urls)} category pages")
-            vov_articles = await self._scrape_vov_html(
-                vov_html_urls, target_dt, start_time, end_time
-            )
-            all_articles.extend(vov_articles)
-        
-        # Fetch Secure URLs (Lao Dong with anti-bot protection)
-        if secure_urls:
-            print(f"🛡️ Using Secure Fetcher for {len(secure_urls)} URLs (anti-bot protection)")
+        for strategy, urls in by_strategy.items():
+            if urls and strategy in self.STRATEGY_LOG:
+                print(self.STRATEGY_LOG[strategy].format(n=len(urls)))
+
+        # Headers to bypass basic anti-bot
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'application/rss+xml, application/xml, text/xml, */*',
+            'Accept-Language': 'vi-VN,vi;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        }
+
+        async def _run(url: str, coro) -> Tuple[str, List[Dict]]:
             try:
-                secure_contents = await secure_fetcher.fetch_multiple_rss(secure_urls)
-                
-                for rss_url, content in secure_contents.items():
-                    if content:
-                        feed = feedparser.parse(content)
-                        print(f"   ✅ {rss_url}: {len(feed.entries)} entries")
-
-                        # Hà Nội Mới: double-escaped CDATA → feedparser trả về empty description/image
-                        # Giải pháp: extract trực tiếp từ raw XML bằng regex
-                        hanoimoi_extras: dict = {}
-                        if 'hanoimoi' in rss_url:
-                            # Extract từng <item> block và lấy link, img src, description text
-                            for item_xml in re.findall(r'<item>(.*?)</item>', content, re.DOTALL):
-                                link_m = re.search(r'<link>([^<]+)</link>', item_xml)
-                                if not link_m:
-                                    continue
-                                item_url = link_m.group(1).strip()
-                                # Unescape CDATA content để extract
-                                cdata_m = re.search(r'&lt;!\[CDATA\[(.*?)\]\]&gt;', item_xml, re.DOTALL)
-                                if cdata_m:
-                                    inner = html.unescape(cdata_m.group(1))
-                                    img_m = re.search(r'<img[^>]+src=["\']([^"\']+)["\']', inner)
-                                    text = re.sub(r'<[^>]+>', ' ', inner).strip()
-                                    text = re.sub(r'\s+', ' ', text)
-                                    hanoimoi_extras[item_url] = {
-                                        'thumbnail': img_m.group(1) if img_m else '',
-                                        'description': text,
-                                    }
-
-                        # Process each entry
-                        for entry in feed.entries:
-                            article = self._process_entry(
-                                entry,
-                                target_dt,
-                                start_time,
-                                end_time,
-                                rss_url
-                            )
-                            if article:
-                                # Patch Hà Nội Mới extras nếu có
-                                if 'hanoimoi' in rss_url:
-                                    extras = hanoimoi_extras.get(article['url'], {})
-                                    if extras.get('thumbnail'):
-                                        article['thumbnail'] = extras['thumbnail']
-                                    if extras.get('description') and not article['description']:
-                                        article['description'] = extras['description']
-                                all_articles.append(article)
-                    else:
-                        print(f"   ❌ {rss_url}: No content fetched")
+                return url, await coro
             except Exception as e:
-                print(f"❌ Secure Fetcher error: {str(e)}")
-        
-        # Fetch normal URLs with httpx — concurrent với asyncio.gather
-        if normal_urls:
-            print(f"⚡ Using HTTP for {len(normal_urls)} URLs (concurrent, no anti-bot)")
-
-            # Headers to bypass basic anti-bot
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'application/rss+xml, application/xml, text/xml, */*',
-                'Accept-Language': 'vi-VN,vi;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
+                print(f"   ❌ {url}: {type(e).__name__}: {e}")
+                return url, []
+
+        # Normal feeds share one httpx client (concurrent, bounded by crawl_scheduler)
+        async with httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            headers=headers
+        ) as client:
+            handlers = {
+                STRATEGY_HANOIMOI_HTML: lambda u: self._scrape_hanoimoi_html([u], *window),
+                STRATEGY_HANOIMOI_RSS: lambda u: self._fetch_hanoimoi_rss_articles(u, *window),
+                STRATEGY_VOV_HTML: lambda u: self._scrape_vov_html([u], *window),
+                STRATEGY_SECURE: lambda u: self._fetch_secure_rss_articles(u, *window),
+                STRATEGY_HTTP: lambda u: self._fetch_rss_articles(client, u, *window),
             }
+            tasks = [
+                asyncio.ensure_future(_run(u, handlers.get(strategy, handlers[STRATEGY_HTTP])(u)))
+                for strategy, urls in by_strategy.items()
+                for u in urls
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                # Consumer went away (client disconnected) — don't leave fetches running
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_rss_articles(
+        self,
+        client: httpx.AsyncClient,
+        rss_url: str,
+        target_dt: datetime,
+        start_time: time,
+        end_time: time,
+    ) -> List[Dict]:
+        """Plain RSS feed over the shared httpx client, streamed and capped at FEED_MAX_BYTES."""
+        max_bytes = settings.FEED_MAX_BYTES or None
+        async with crawl_scheduler.slot(rss_url):
+            result = await stream_text(client, rss_url, max_bytes=max_bytes)
+        if not 200 <= result.status_code < 300:
+            print(f"   ❌ {rss_url}: HTTP {result.status_code}")
+            return []
+        if result.truncated:
+            print(f"   ⚠️ {rss_url}: feed truncated at FEED_MAX_BYTES ({max_bytes} bytes)")
+        feed = await feed_parser.parse_async(result.text, engine=source_index.record_for(rss_url).parser)
+        print(f"   ✅ {rss_url}: {len(feed.entries)} entries")
+        return self._filter_entries(feed.entries, target_dt, start_time, end_time, rss_url)
+
+    async def _fetch_secure_rss_articles(
+        self,
+        rss_url: str,
+        target_dt: datetime,
+        start_time: time,
+        end_time: time,
+    ) -> List[Dict]:
+        """Anti-bot protected feed (Lao Động) via secure_fetcher."""
+        contents = await secure_fetcher.fetch_multiple_rss([rss_url])
+        content = contents.get(rss_url)
+        if not content:
+            print(f"   ❌ {rss_url}: No content fetched")
+            return []
+        feed = await feed_parser.parse_async(content, engine=source_index.record_for(rss_url).parser)
+        print(f"   ✅ {rss_url}: {len(feed.entries)} entries")
+
+        # Hà Nội Mới: double-escaped CDATA → feedparser trả về empty description/image
+        # Giải pháp: extract trực tiếp từ raw XML (single-pass, precompiled)
+        hanoimoi_extras = _extract_hanoimoi_extras(content) if 'hanoimoi' in rss_url else {}
+
+        # Process each entry (stops early once past the window)
+        articles = self._filter_entries(feed.entries, target_dt, start_time, end_time, rss_url)
+        if hanoimoi_extras:
+            # Patch Hà Nội Mới extras nếu có
+            for article in articles:
+                _apply_hanoimoi_extras(article, hanoimoi_extras)
+        return articles
 
-            async def _fetch_one(client: httpx.AsyncClient, rss_url: str) -> List[Dict]:
-                try:
-                    response = await client.get(rss_url)
-                    feed = feedparser.parse(response.text)
-                    print(f"   ✅ {rss_url}: {len(feed.entries)} entries")
-                    articles = []
-                    for entry in feed.entries:
-                        article = self._process_entry(entry, target_dt, start_time, end_time, rss_url)
-                        if article:
-                            articles.append(article)
-                    return articles
-                except Exception as e:
-                    print(f"   ❌ {rss_url}: {str(e)}")
-                    return []
+    async def _fetch_hanoimoi_rss_articles(
+        self,
+        rss_url: str,
+        target_dt: datetime,
+        start_time: time,
+        end_time: time,
+    ) -> List[Dict]:
+        async with crawl_scheduler.slot(rss_url):
+            content = await self._fetch_hanoimoi_rss(rss_url)
+        if not content:
+            print(f"   ❌ hanoimoi RSS {rss_url}: No content")
+            return []
+        feed = await feed_parser.parse_async(content, engine=source_index.record_for(rss_url).parser)
+        print(f"   ✅ hanoimoi RSS {rss_url}: {len(feed.entries)} entries")
+
+        # Extract thumbnail + description from double-escaped CDATA
+        hanoimoi_extras = _extract_hanoimoi_extras(content)
+
+        articles = self._filter_entries(feed.entries, target_dt, start_time, end_time, rss_url)
+        for article in articles:
+            _apply_hanoimoi_extras(article, hanoimoi_extras)
+        return articles
+
+    async def _fetch_hanoimoi_rss(self, rss_url: str) -> str:
+        """
+        Hà Nội Mới RSS (Cloudflare Managed Challenge):
+        FlareSolverr → CF Worker → residential proxy → secure_fetcher.
+        """
+        import os as _os2, urllib.parse as _uparse2
+        flaresolverr_url = _os2.environ.get("FLARESOLVERR_URL", "").rstrip("/")
+        cf_proxy = _os2.environ.get("CF_PROXY_URL", "").rstrip("/")
+        webshare_proxy = _os2.environ.get("WEBSHARE_PROXY_URL", "").strip()
+
+        _hnm_headers = {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Accept": "application/rss+xml, application/xml, text/xml, */*",
+            "Accept-Language": "vi-VN,vi;q=0.9,en;q=0.8",
+        }
+
+        # Layer 1: FlareSolverr — giải CF Managed Challenge bằng Chrome thật
+        if flaresolverr_url:
+            try:
+                async with httpx.AsyncClient(timeout=60) as c:
+                    resp = await c.post(
+                        f"{flaresolverr_url}/v1",
+                        json={"cmd": "request.get", "url": rss_url, "maxTimeout": 45000},
+                    )
+                    if resp.status_code == 200:
+                        solution = resp.json().get("solution", {})
+                        content = solution.get("response", "")
+                        # Chrome browser wraps XML in HTML viewer — extract raw XML
+                        import html as _html_mod
+                        for marker in ["<?xml", "<rss", "<feed"]:
+                            idx = content.find(marker)
+                            if idx >= 0:
+                                content = content[idx:]
+                                if "&lt;" in content:
+                                    content = _html_mod.unescape(content)
+                                break
+                        stripped = content.strip()
+                        if stripped.startswith("<?xml") or stripped.startswith("<rss") or stripped.startswith("<feed"):
+                            print(f"   ✅ FlareSolverr: hanoimoi RSS OK {rss_url}")
+                            return content
+                        print(f"   ⚠️ FlareSolverr non-XML for {rss_url}, trying next layer")
+                    else:
+                        print(f"   ⚠️ FlareSolverr HTTP {resp.status_code} for {rss_url}, trying next layer")
+            except Exception as e:
+                print(f"   ❌ FlareSolverr error {rss_url}: {e}, trying next layer")
+        # Layer 2: CF Worker proxy
+        if cf_proxy:
+            try:
+                proxied = f"{cf_proxy}/?url={_uparse2.quote(rss_url, safe='')}"
+                async with httpx.AsyncClient(timeout=20, follow_redirects=True, headers=_hnm_headers) as c:
+                    resp = await c.get(proxied)
+                    content = resp.text
+                    stripped = content.strip()
+                    if stripped.startswith("<?xml") or stripped.startswith("<rss"):
+                        print(f"   ✅ CF Worker: hanoimoi RSS OK {rss_url}")
+                        return content
+                    print(f"   ⚠️ CF Worker non-XML for {rss_url} (status {resp.status_code}), trying next layer")
+            except Exception as e:
+                print(f"   ❌ CF Worker error {rss_url}: {e}, trying next layer")
+        # Layer 3: Residential proxy
+        if webshare_proxy:
+            try:
+                async with httpx.AsyncClient(
+                    timeout=20, follow_redirects=True, headers=_hnm_headers,
+                    proxy=webshare_proxy
+                ) as c:
+                    resp = await c.get(rss_url)
+                    content = resp.text
+                    stripped = content.strip()
+                    if stripped.startswith("<?xml") or stripped.startswith("<rss"):
+                        return content
+                    print(f"   ⚠️ hanoimoi RSS non-XML via proxy for {rss_url} (status {resp.status_code})")
+            except Exception as e:
+                print(f"   ❌ hanoimoi RSS proxy error {rss_url}: {e}")
+        # Layer 4+: secure_fetcher (curl_cffi → rss2json → ScrapingAnt → Playwright)
+        return await secure_fetcher.fetch_rss(rss_url)
 
-            async with httpx.AsyncClient(
-                timeout=30.0,
-                follow_redirects=True,
-                headers=headers
-            ) as client:
-                tasks = []
-                for url in normal_urls:
-                    tasks.append(_fetch_one(client, url))
-                results = await asyncio.gather(*tasks)
-                for article_list in results:
-                    all_articles.extend(article_list)
-        
-        return all_articles
-    
     def _parse_time_range(self, time_range: str) -> tuple:
         """
         Parse Vietnamese time range string to time objects
@@ -424,7 +438,8 @@ class RSSFetcher:
             slug = url.rstrip("/").split("/")[-1]
             category = VOV_CATEGORY_MAP.get(slug, slug.upper().replace("-", " "))
             try:
-                resp = await client.get(_proxy(url))
+                async with crawl_scheduler.slot(url):
+                    resp = await client.get(_proxy(url))
                 if resp.status_code != 200:
                     print(f"   ⚠️ VOV {url}: status {resp.status_code}")
                     return []
@@ -465,25 +480,27 @@ class RSSFetcher:
                 print(f"❌ VOV listing error {url}: {type(e).__name__}: {e}")
                 return []
 
-        async def fetch_article_date(client: httpx.AsyncClient, article_url: str, semaphore: _asyncio.Semaphore) -> str:
-            """Fetch article detail page, return ISO 8601 published_time or empty string."""
-            async with semaphore:
+        async def fetch_article_date(client: httpx.AsyncClient, article_url: str) -> str:
+            """Stream article detail page until published_time (or </head>) is seen.
+
+            Returns ISO 8601 published_time or empty string.
+            """
+            async with crawl_scheduler.slot(article_url):
                 try:
-                    resp = await client.get(_proxy(article_url))
-                    if resp.status_code != 200:
-                        return ""
-                    # Extract article:published_time meta tag
-                    m = re.search(
-                        r'<meta[^>]+property=["\']article:published_time["\'][^>]+content=["\']([^"\']+)["\']',
-                        resp.text,
+                    stop = PatternStop([*_VOV_PUBLISHED_TIME_RES, _HEAD_END_RE])
+                    result = await stream_text(
+                        client, _proxy(article_url), stop=stop, max_bytes=_VOV_HEAD_MAX_BYTES
                     )
-                    if not m:
-                        # Try reversed attribute order
-                        m = re.search(
-                            r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+property=["\']article:published_time["\']',
-                            resp.text,
-                        )
-                    return m.group(1) if m else ""
+                    if result.status_code != 200:
+                        return ""
+                    if stop.match is not None and stop.match.re is not _HEAD_END_RE:
+                        return stop.match.group(1)
+                    # Stopped on </head> / byte cap — the meta tag may sit just before it
+                    for pattern in _VOV_PUBLISHED_TIME_RES:
+                        m = pattern.search(result.text)
+                        if m:
+                            return m.group(1)
+                    return ""
                 except Exception:
                     return ""
 
@@ -507,11 +524,21 @@ class RSSFetcher:
             if not all_cards:
                 return []
 
-            # Step 2: fetch article detail pages concurrently (max 8 at a time to avoid rate-limit)
-            semaphore = _asyncio.Semaphore(8)
-            date_strings = await _asyncio.gather(*[
-                fetch_article_date(client, card["url"], semaphore) for card in all_cards
+            # Step 2: published_time — persistent cache first (a VOV article's
+            # publish time never changes), then stream only the <head> of misses.
+            # (per-host cap for vov.vn comes from crawl_scheduler / CRAWL_HOST_LIMITS)
+            card_urls = [card["url"] for card in all_cards]
+            cached_dates = await persistent_cache.aget_many(_VOV_PUBLISHED_CACHE_NS, card_urls)
+            missing_urls = list(dict.fromkeys(u for u in card_urls if u not in cached_dates))
+            if cached_dates:
+                print(f"   VOV published_time cache: {len(cached_dates)} hit, {len(missing_urls)} miss")
+            fetched_dates = await _asyncio.gather(*[
+                fetch_article_date(client, u) for u in missing_urls
             ])
+            new_dates = {u: d for u, d in zip(missing_urls, fetched_dates) if d}
+            await persistent_cache.aset_many(_VOV_PUBLISHED_CACHE_NS, new_dates)
+            cached_dates.update(new_dates)
+            date_strings = [cached_dates.get(u, "") for u in card_urls]
 
         # Step 3: filter by date + time range
         articles = []
@@ -519,30 +546,17 @@ class RSSFetcher:
             if not date_str:
                 continue
             try:
-                pub_dt = date_parser.parse(date_str)
-                if pub_dt.tzinfo:
-                    pub_dt = pub_dt.astimezone(VN_TZ)
-                else:
-                    from datetime import timezone as _tz
-                    pub_dt = pub_dt.replace(tzinfo=_tz.utc).astimezone(VN_TZ)
+                pub_dt = self._entry_pub_date({"published": date_str}, "vov.vn")
             except Exception:
                 continue
-
-            if pub_dt.date() != target_dt.date():
+            if pub_dt is None or not self._in_time_window(pub_dt, target_dt, start_time, end_time):
                 continue
-            pub_time = pub_dt.time().replace(tzinfo=None)
-            if end_time >= start_time:
-                if not (start_time <= pub_time <= end_time):
-                    continue
-            else:
-                if not (pub_time >= start_time or pub_time <= end_time):
-                    continue
 
-            articles.append({
-                **card,
-                "published_at": pub_dt.strftime("%H:%M %d/%m/%Y"),
-                "description": "",
-            })
+            articles.append(ArticleRecord(
+                card["url"], card["title"], card["category"],
+                pub_dt.strftime("%H:%M %d/%m/%Y"), card["source"], card["thumbnail"],
+                description="",
+            ))
 
         print(f"   ✅ VOV total: {len(articles)} bài trong khung giờ")
         return articles
@@ -674,36 +688,86 @@ class RSSFetcher:
                         pub_dt = pub_dt.replace(tzinfo=VN_TZ)
                     except ValueError:
                         continue
-                    if pub_dt.date() != target_dt.date():
+                    if not self._in_time_window(pub_dt, target_dt, start_time, end_time):
                         continue
-                    pub_time = pub_dt.time().replace(tzinfo=None)
-                    if end_time >= start_time:
-                        if not (start_time <= pub_time <= end_time):
-                            continue
-                    else:
-                        if not (pub_time >= start_time or pub_time <= end_time):
-                            continue
-                    result.append({
-                        "url": link_m.group(1),
-                        "title": html.unescape(title_m.group(1).strip()),
-                        "category": category,
-                        "published_at": pub_dt.strftime("%H:%M %d/%m/%Y"),
-                        "description": "",
-                        "source": "HÀ NỘI MỚI",
-                        "thumbnail": img_m.group(1) if img_m else "",
-                    })
+                    result.append(ArticleRecord(
+                        link_m.group(1),
+                        html.unescape(title_m.group(1).strip()),
+                        category,
+                        pub_dt.strftime("%H:%M %d/%m/%Y"),
+                        "HÀ NỘI MỚI",
+                        img_m.group(1) if img_m else "",
+                        description="",
+                    ))
                 print(f"   ✅ hanoimoi {url}: {len(result)} bài")
                 return result
             except Exception as e:
                 print(f"❌ hanoimoi scrape error {url}: {e}")
                 return []
 
+        async def fetch_one_scheduled(url):
+            async with crawl_scheduler.slot(url):
+                return await fetch_one(url)
+
         import asyncio as _asyncio
-        results = await _asyncio.gather(*[fetch_one(u) for u in urls])
+        results = await _asyncio.gather(*[fetch_one_scheduled(u) for u in urls])
         for r in results:
             articles.extend(r)
         return articles
 
+    @staticmethod
+    def _in_time_window(pub_date: datetime, target_date: datetime, start_time: time, end_time: time) -> bool:
+        """True if pub_date (VN time) falls on target_date inside [start_time, end_time]."""
+        if pub_date.date() != target_date.date():
+            return False
+        # Handle both normal ranges (6h-8h) and cross-midnight ranges (21h-23h59, 0h-6h)
+        pub_time = pub_date.time().replace(tzinfo=None)
+        if end_time >= start_time:
+            return start_time <= pub_time <= end_time
+        # Cross-midnight range (end < start, e.g., 21h00 to 6h00) - NOT USED currently
+        # but kept for future flexibility
+        return pub_time >= start_time or pub_time <= end_time
+
+    @staticmethod
+    def _window_start(target_date: datetime, start_time: time, end_time: time) -> datetime:
+        """Earliest VN datetime that can match the window (00:00 for cross-midnight ranges)."""
+        first = start_time if end_time >= start_time else time(0, 0)
+        return datetime.combine(target_date.date(), first, tzinfo=VN_TZ)
+
+    def _entry_pub_date(self, entry: Dict, rss_url: str) -> Optional[datetime]:
+        """Parse entry's published date into Vietnam time (None if missing/unparseable)."""
+        pub_date_str = entry.get("published", "")
+        if not pub_date_str:
+            return None
+
+        # Fast path (format learned per feed, memoized) → dateutil fallback.
+        # 'GMT+N' is normalized there: RSS feeds (RFC 2822) mean UTC+7, not POSIX UTC-7.
+        pub_date = feed_date_parser.parse(pub_date_str, feed_key=rss_url)
+        if pub_date is None:
+            return None
+
+        # Convert to Vietnam timezone (UTC+7) for correct date/time comparison
+        if pub_date.tzinfo is not None:
+            return pub_date.astimezone(VN_TZ)
+        # Assume UTC if no timezone info
+        return pub_date.replace(tzinfo=timezone.utc).astimezone(VN_TZ)
+
+    def _build_article(self, entry: Dict, pub_date: datetime, rss_url: str) -> ArticleRecord:
+        """Build the article record — only called for entries inside the window."""
+        # Source + category precomputed per feed URL in the source registry
+        feed = source_index.record_for(rss_url)
+        return ArticleRecord(
+            entry.get("link", ""),
+            html.unescape(entry.get("title", "")),
+            # Category is extracted directly from RSS URL path
+            feed.category,
+            pub_date.strftime("%H:%M %d/%m/%Y"),
+            feed.source,
+            self._extract_thumbnail(entry),
+            # Cleaned on first read
+            raw_description=entry.get("description", "") or entry.get("summary", ""),
+        )
+
     def _process_entry(
         self,
         entry: Dict,
@@ -717,86 +781,64 @@ class RSSFetcher:
         Category is extracted directly from RSS URL path
         """
         try:
-            # Parse publication date
-            pub_date_str = entry.get("published", "")
-            if not pub_date_str:
+            pub_date = self._entry_pub_date(entry, rss_url)
+            if pub_date is None or not self._in_time_window(pub_date, target_date, start_time, end_time):
                 return None
-            
-            # Normalize 'GMT+N' timezone strings before parsing.
-            # dateutil interprets GMT+7 as UTC-7 (POSIX convention), but RSS feeds
-            # (RFC 2822) mean UTC+7. _normalize_gmt_offset flips the sign so dateutil
-            # produces the correct offset.
-            pub_date_str = _normalize_gmt_offset(pub_date_str)
-
-            # Parse the date string (handles various formats)
-            pub_date = date_parser.parse(pub_date_str)
-
-            # Convert to Vietnam timezone (UTC+7) for correct date/time comparison
-            if pub_date.tzinfo is not None:
-                pub_date = pub_date.astimezone(VN_TZ)
-            else:
-                # Assume UTC if no timezone info
-                from datetime import timezone
-                pub_date = pub_date.replace(tzinfo=timezone.utc).astimezone(VN_TZ)
-
-            # Check if date matches
-            if pub_date.date() != target_date.date():
-                return None
-
-            # Check if time is within range
-            # Handle both normal ranges (6h-8h) and cross-midnight ranges (21h-23h59, 0h-6h)
-            pub_time = pub_date.time().replace(tzinfo=None)
-            
-            # Normal time range (start < end, e.g., 6h00 to 8h00)
-            if end_time >= start_time:
-                if not (start_time <= pub_time <= end_time):
-                    return None
-            # Cross-midnight range (end < start, e.g., 21h00 to 6h00) - NOT USED currently
-            # but kept for future flexibility
-            else:
-                if not (pub_time >= start_time or pub_time <= end_time):
-                    return None
-            
-            # Extract newspaper source from RSS URL
-            source = self._extract_source(rss_url)
-            
-            # Extract category from RSS URL
-            category = self._extract_category_from_url(rss_url)
-            
-            # Extract thumbnail from RSS entry
-            thumbnail = self._extract_thumbnail(entry)
-            
-            # Extract article data
-            raw_description = entry.get("description", "") or entry.get("summary", "")
-            return {
-                "url": entry.get("link", ""),
-                "title": html.unescape(entry.get("title", "")),
-                "category": category,
-                "published_at": pub_date.astimezone(VN_TZ).strftime("%H:%M %d/%m/%Y"),
-                "description": self._clean_description(raw_description),
-                "source": source,
-                "thumbnail": thumbnail,
-            }
-            
+            return self._build_article(entry, pub_date, rss_url)
         except Exception as e:
             print(f"Error processing entry: {str(e)}")
             return None
-    
+
+    def _filter_entries(
+        self,
+        entries: List[Dict],
+        target_date: datetime,
+        start_time: time,
+        end_time: time,
+        rss_url: str,
+    ) -> List[Dict]:
+        """
+        Filter a feed's entries by date/time window.
+
+        Only the date is parsed up front; description/thumbnail are built for
+        entries inside the window. Feeds are reverse-chronological, so once
+        FEED_EARLY_STOP_AFTER consecutive entries are older than the window
+        start minus FEED_EARLY_STOP_MARGIN_MIN, the rest of the feed is skipped.
+        Early stop only arms after one entry newer than that cutoff was seen,
+        so a feed with old pinned items on top is still scanned fully.
+        """
+        stop_after = settings.FEED_EARLY_STOP_AFTER
+        cutoff = self._window_start(target_date, start_time, end_time) - timedelta(
+            minutes=settings.FEED_EARLY_STOP_MARGIN_MIN
+        )
+        articles = []
+        seen_recent = False
+        old_streak = 0
+        for index, entry in enumerate(entries):
+            try:
+                pub_date = self._entry_pub_date(entry, rss_url)
+                if pub_date is None:
+                    continue
+                if pub_date < cutoff:
+                    old_streak += 1
+                    if stop_after and seen_recent and old_streak >= stop_after:
+                        print(f"   ⏹️ {rss_url}: stopped after {index + 1}/{len(entries)} entries (older than window)")
+                        break
+                    continue
+                seen_recent = True
+                old_streak = 0
+                if self._in_time_window(pub_date, target_date, start_time, end_time):
+                    articles.append(self._build_article(entry, pub_date, rss_url))
+            except Exception as e:
+                print(f"Error processing entry: {str(e)}")
+        return articles
+
     def _extract_source(self, rss_url: str) -> str:
         """
         Extract newspaper source name from RSS URL
         """
-        for domain, source_name in self.NEWSPAPER_SOURCES.items():
-            if domain in rss_url:
-                return source_name
-        # Fallback: extract domain from URL
-        try:
-            from urllib.parse import urlparse
-            domain = urlparse(rss_url).netloc
-            return domain.replace("www.", "").upper()
-        except:
-            return "UNKNOWN"
-    
+        return source_index.record_for(rss_url).source
+
     def _extract_category_from_url(self, rss_url: str) -> str:
         """
         Extract category from RSS URL path
@@ -805,32 +847,7 @@ class RSSFetcher:
         - https://laodong.vn/rss/kinh-doanh.rss -> KINH TẾ
         - https://vov.vn/xa-hoi -> XÃ HỘI
         """
-        url_lower = rss_url.lower()
-
-        # vov.vn HTML category pages: path is the category slug
-        VOV_HTML_CATEGORY_MAP = {
-            "xa-hoi": "XÃ HỘI",
-            "the-gioi": "THẾ GIỚI",
-            "kinh-te": "KINH TẾ",
-            "phap-luat": "PHÁP LUẬT",
-        }
-        if "vov.vn" in url_lower and "/rss/" not in url_lower:
-            slug = url_lower.rstrip("/").split("/")[-1]
-            if slug in VOV_HTML_CATEGORY_MAP:
-                return VOV_HTML_CATEGORY_MAP[slug]
-
-        # Category mapping from URL keywords
-        if any(keyword in url_lower for keyword in ['phap-luat', 'phapluat', 'phap_luat']):
-            return "PHÁP LUẬT"
-        elif any(keyword in url_lower for keyword in ['kinh-te', 'kinhte', 'kinh-doanh', 'kinhdoanh', 'kinh_te']):
-            return "KINH TẾ"
-        elif any(keyword in url_lower for keyword in ['xa-hoi', 'xahoi', 'doi-song', 'doisong', 'xa_hoi', 'thoi-su', 'thoisu']):
-            return "XÃ HỘI"
-        elif any(keyword in url_lower for keyword in ['the-gioi', 'thegioi', 'the_gioi', 'quoc-te', 'quocte']):
-            return "THẾ GIỚI"
-        else:
-            # Default to XÃ HỘI if cannot determine
-            return "XÃ HỘI"
+        return source_index.record_for(rss_url).category
     
     
     def _extract_thumbnail(self, entry: Dict) -> str:
@@ -1,67 +1,32 @@
 from typing import List
-from config import settings
+from services.source_registry import SourceIndex, source_index
 
 class RSSMatcher:
     """
     Matches newspaper names to RSS feed URLs
     Replaces the first ai_llm node in the JSON workflow
+
+    Names are resolved through the startup-built SourceIndex
+    (services/source_registry.py): diacritic-folded aliases, abbreviations
+    and typo-tolerant matching, then domain → feed list lookups.
     """
-    
+
+    def __init__(self, index: SourceIndex = source_index):
+        self.index = index
+
     def match_feeds(self, newspaper_names: str) -> List[str]:
         """
         Match newspaper names to RSS feed URLs from the database
-        
+
         Args:
             newspaper_names: Comma-separated string of newspaper names
-            
+
         Returns:
             List of matching RSS feed URLs
         """
-        # Parse newspaper names
-        newspapers = [name.strip().lower() for name in newspaper_names.split(",")]
-        
-        # Domain mapping for Vietnamese newspapers
-        domain_mapping = {
-            "lao động": "laodong.vn",
-            "laodong": "laodong.vn",
-            "dân trí": "dantri.com.vn",
-            "dantri": "dantri.com.vn",
-            "vtv": "vtv.vn",
-            "hà nội mới": "hanoimoi.vn",
-            "hanoimoi": "hanoimoi.vn",
-            "sài gòn giải phóng": "sggp.org.vn",
-            "sggp": "sggp.org.vn",
-            "vietnamplus": "vietnamplus.vn",
-            "vietnam plus": "vietnamplus.vn",
-            "tiền phong": "tienphong.vn",
-            "tienphong": "tienphong.vn",
-            "báo vov": "vov.vn",
-            "vov": "vov.vn",
-            "báo tin tức": "baotintuc.vn",
-            "tin tức": "baotintuc.vn",
-            "baotintuc": "baotintuc.vn",
-            "báo tuổi trẻ": "tuoitre.vn",
-            "tuổi trẻ": "tuoitre.vn",
-            "tuoitre": "tuoitre.vn",
-            "thanh niên": "thanhnien.vn",
-            "thanhnien": "thanhnien.vn",
-            "báo thanh niên": "thanhnien.vn",
-        }
-        
-        # Find matching domains
-        matching_domains = []
-        for newspaper in newspapers:
-            if newspaper in domain_mapping:
-                matching_domains.append(domain_mapping[newspaper])
-        
-        # Filter RSS feeds that contain any of the matching domains
-        matched_feeds = []
-        for feed_url in settings.RSS_DATABASE:
-            for domain in matching_domains:
-                if domain in feed_url:
-                    matched_feeds.append(feed_url)
-                    break
-        
-        return matched_feeds
+        domains = {self.index.resolve(name) for name in newspaper_names.split(",")}
+        domains.discard(None)
+        # Feeds keep their RSS_DATABASE order, whatever order the names came in
+        return self.index.feeds_in_order(domains)
 
 rss_matcher = RSSMatcher()
@@ -4,9 +4,13 @@ Replaces the heavy Playwright implementation.
 Falls back to httpx if curl_cffi is not available (Render/Vercel compatibility).
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 import asyncio
+import re
 import httpx
+from config import settings
+from services.crawl_scheduler import crawl_scheduler
+from services.stream_fetch import StreamedText, read_capped, stream_text
 
 # Try to import curl_cffi, fallback to httpx if not available
 try:
@@ -32,6 +36,78 @@ class SecureRSSFetcher:
             'Upgrade-Insecure-Requests': '1',
         }
         
+    async def _curl_read(self, session, url: str, timeout: int, max_bytes: Optional[int], stop) -> StreamedText:
+        """One streamed GET: decode incrementally, stop at *max_bytes* or when *stop* fires."""
+        response = await session.get(url, timeout=timeout, allow_redirects=True, stream=True)
+        try:
+            result = await read_capped(response.aiter_content(), response.charset_encoding, stop, max_bytes)
+        finally:
+            # Closes the transfer without downloading the rest of the body
+            await response.aclose()
+        return result
+
+    async def _curl_fetch_text(
+        self,
+        url: str,
+        timeout: int,
+        max_bytes: Optional[int] = None,
+        stop_factory: Optional[Callable[[], Optional[Callable[[str], bool]]]] = None,
+    ) -> StreamedText:
+        """curl_cffi GET (Chrome impersonation) with the Lao Dong cookie-challenge retry."""
+        make_stop = stop_factory or (lambda: None)
+        async with AsyncSession(impersonate=self.impersonate, headers=self.headers) as session:
+            result = await self._curl_read(session, url, timeout, max_bytes, make_stop())
+            text = result.text
+
+            # Check for cookie challenge (Lao Dong specific)
+            # Response usually contains: document.cookie="KEY=VALUE"+...
+            if "document.cookie" in text and "window.location.reload" in text:
+                # Extract cookie key and value
+                # Look for pattern: document.cookie="KEY=VALUE"
+                # Simple regex to catch the first assignment
+                match = re.search(r'document\.cookie="([^"]+)"', text)
+                if match:
+                    cookie_str = match.group(1)
+                    if "=" in cookie_str:
+                        key, value = cookie_str.split("=", 1)
+                        # Add cookie to session
+                        session.cookies.set(key, value)
+
+                        print(f"🔄 Detected cookie challenge for {url}. Retrying with cookie: {key}={value[:10]}...")
+                        # Retry request (fresh stop state)
+                        result = await self._curl_read(session, url, timeout, max_bytes, make_stop())
+            return result
+
+    async def fetch_page(
+        self,
+        url: str,
+        timeout: int = 25,
+        max_bytes: Optional[int] = None,
+        stop_factory: Optional[Callable[[], Optional[Callable[[str], bool]]]] = None,
+    ) -> str:
+        """
+        Fetch an HTML page (article) with curl_cffi, streamed and byte-capped.
+
+        Unlike fetch_rss there is no RSS check and no proxy/Playwright chain —
+        callers fall back to their own httpx fetch when this returns "".
+
+        Args:
+            url: page URL
+            timeout: Timeout in seconds
+            max_bytes: stop reading after this many raw bytes (None = unlimited)
+            stop_factory: returns a fresh stream_fetch stop callback per request
+
+        Returns:
+            Decoded (possibly truncated) HTML, "" on failure
+        """
+        if not CURL_CFFI_AVAILABLE:
+            return ""
+        try:
+            return (await self._curl_fetch_text(url, timeout, max_bytes, stop_factory)).text
+        except Exception as e:
+            print(f"⚠️ curl_cffi error for {url}: {str(e)}")
+            return ""
+
     async def fetch_rss(self, url: str, timeout: int = 30) -> str:
         """
         Fetch RSS feed content using curl_cffi (with httpx fallback)
@@ -43,41 +119,23 @@ class SecureRSSFetcher:
         Returns:
             RSS feed content as string
         """
+        max_bytes = settings.FEED_MAX_BYTES or None
         # Use curl_cffi if available, otherwise fallback to httpx
         if CURL_CFFI_AVAILABLE:
             try:
-                async with AsyncSession(impersonate=self.impersonate, headers=self.headers) as session:
-                    response = await session.get(url, timeout=timeout, allow_redirects=True)
-
-                    # Check for cookie challenge (Lao Dong specific)
-                    # Response usually contains: document.cookie="KEY=VALUE"+...
-                    if "document.cookie" in response.text and "window.location.reload" in response.text:
-                        import re
-                        # Extract cookie key and value
-                        # Look for pattern: document.cookie="KEY=VALUE"
-                        # Simple regex to catch the first assignment
-                        match = re.search(r'document\.cookie="([^"]+)"', response.text)
-                        if match:
-                            cookie_str = match.group(1)
-                            if "=" in cookie_str:
-                                key, value = cookie_str.split("=", 1)
-                                # Clean up value (sometimes has extra chars if not parsed perfectly, but usually clean)
-                                # Add cookie to session
-                                session.cookies.set(key, value)
-
-                                print(f"🔄 Detected cookie challenge for {url}. Retrying with cookie: {key}={value[:10]}...")
-                                # Retry request
-                                response = await session.get(url, timeout=timeout)
-
-                    content = response.text
-                    if content and len(content.strip()) > 100:
-                        # Verify it's actually RSS/XML, not a Cloudflare challenge or error page
-                        stripped = content.strip()
-                        if stripped.startswith('<?xml') or stripped.startswith('<rss') or stripped.startswith('<feed'):
-                            return content
-                        print(f"⚠️ curl_cffi got non-RSS response for {url} (likely Cloudflare block), trying httpx fallback")
-                    else:
-                        print(f"⚠️ curl_cffi returned empty/short response for {url}, trying httpx fallback")
+                result = await self._curl_fetch_text(url, timeout, max_bytes)
+                content = result.text
+                if result.truncated:
+                    # Parsed anyway: feed_parser recovers the complete items of a cut-off feed
+                    print(f"⚠️ {url}: feed truncated at FEED_MAX_BYTES ({max_bytes} bytes)")
+                if content and len(content.strip()) > 100:
+                    # Verify it's actually RSS/XML, not a Cloudflare challenge or error page
+                    stripped = content.strip()
+                    if stripped.startswith('<?xml') or stripped.startswith('<rss') or stripped.startswith('<feed'):
+                        return content
+                    print(f"⚠️ curl_cffi got non-RSS response for {url} (likely Cloudflare block), trying httpx fallback")
+                else:
+                    print(f"⚠️ curl_cffi returned empty/short response for {url}, trying httpx fallback")
             except Exception as e:
                 print(f"⚠️ curl_cffi error for {url}: {str(e)}, trying httpx fallback")
 
@@ -88,8 +146,10 @@ class SecureRSSFetcher:
                 follow_redirects=True,
                 headers=self.headers
             ) as client:
-                response = await client.get(url)
-                content = response.text
+                result = await stream_text(client, url, max_bytes=max_bytes)
+                if result.truncated:
+                    print(f"⚠️ {url}: feed truncated at FEED_MAX_BYTES ({max_bytes} bytes)")
+                content = result.text
                 stripped = content.strip()
                 if stripped.startswith('<?xml') or stripped.startswith('<rss') or stripped.startswith('<feed'):
                     return content
@@ -256,9 +316,10 @@ class SecureRSSFetcher:
         """
         results = {}
         
-        # Helper function for concurrent execution
+        # Helper function for concurrent execution (bounded by crawl_scheduler)
         async def fetch_single(url):
-            content = await self.fetch_rss(url)
+            async with crawl_scheduler.slot(url):
+                content = await self.fetch_rss(url)
             return url, content
             
         # Create tasks
@@ -0,0 +1,332 @@
+"""
+Registry of the newspapers we crawl + a routing index built once at import.
+
+Each newspaper is declared once in NEWSPAPERS (domain, display name,
+aliases, fetch strategy, host limit, parser engine, proxy need) — adding a
+newspaper is a new entry there plus its feeds in settings.RSS_DATABASE.
+SourceIndex precomputes:
+  - normalized alias → domain: diacritics folded, lowercase, spaces and the
+    "báo" prefix dropped, so "Lao  Động", "lao dong", "laodong" and "LD" are
+    all one dict lookup;
+  - domain → feed URLs of settings.RSS_DATABASE (in database order);
+  - fuzzy fallback for typos: trigram candidates verified by edit distance;
+  - feed URL → FeedRecord (source name, category, strategy, ...) so the
+    fetcher does a dict lookup instead of substring scans per entry.
+
+Fetch strategies (consumed by RSSFetcher.fetch_and_filter_iter):
+    http            plain RSS over the shared httpx client
+    secure          anti-bot protected RSS via secure_fetcher (curl_cffi)
+    hanoimoi_rss    Hà Nội Mới RSS through FlareSolverr / CF proxy
+    hanoimoi_html   Hà Nội Mới category pages, scraped (legacy)
+    vov_html        VOV category pages, scraped (no RSS)
+A newspaper's `strategy` applies to its /rss/ URLs; `page_strategy` (when
+set) to its other URLs (HTML category pages).
+
+Usage:
+    from services.source_registry import source_index
+
+    source_index.resolve("Lao  Động")          # "laodong.vn"
+    source_index.feeds_for("laodong.vn")       # [feed urls]
+    source_index.strategy_for(url)             # "secure"
+    source_index.record_for(url).category      # "KINH TẾ"
+"""
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from config import settings
+from services.crawl_scheduler import crawl_scheduler, host_key
+
+STRATEGY_HTTP = "http"
+STRATEGY_SECURE = "secure"
+STRATEGY_HANOIMOI_RSS = "hanoimoi_rss"
+STRATEGY_HANOIMOI_HTML = "hanoimoi_html"
+STRATEGY_VOV_HTML = "vov_html"
+
+# Strategies that scrape HTML pages instead of parsing a feed
+HTML_STRATEGIES = frozenset({STRATEGY_HANOIMOI_HTML, STRATEGY_VOV_HTML})
+PARSER_HTML = "html"
+
+DEFAULT_CATEGORY = "XÃ HỘI"
+# URL keyword → category, first match wins (checked on the lowercased URL)
+_CATEGORY_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("PHÁP LUẬT", ("phap-luat", "phapluat", "phap_luat")),
+    ("KINH TẾ", ("kinh-te", "kinhte", "kinh-doanh", "kinhdoanh", "kinh_te")),
+    ("XÃ HỘI", ("xa-hoi", "xahoi", "doi-song", "doisong", "xa_hoi", "thoi-su", "thoisu")),
+    ("THẾ GIỚI", ("the-gioi", "thegioi", "the_gioi", "quoc-te", "quocte")),
+)
+
+
+@dataclass(frozen=True)
+class Newspaper:
+    domain: str
+    name: str
+    aliases: Tuple[str, ...] = ()
+    strategy: str = STRATEGY_HTTP
+    # Strategy for non-/rss/ URLs (category pages); None = same as strategy
+    page_strategy: Optional[str] = None
+    # Last path segment of a category page → category
+    page_categories: Tuple[Tuple[str, str], ...] = ()
+    # Concurrent requests on this host (None = CRAWL_PER_HOST_CONCURRENCY);
+    # CRAWL_HOST_LIMITS overrides it
+    host_limit: Optional[int] = None
+    # Feed parser engine (None = FEED_PARSER_ENGINE)
+    parser: Optional[str] = None
+    # Blocks datacenter IPs / sits behind a Cloudflare challenge
+    needs_proxy: bool = False
+
+
+@dataclass(frozen=True)
+class FeedRecord:
+    url: str
+    domain: Optional[str]
+    source: str
+    category: str
+    strategy: str
+    host_limit: Optional[int]
+    parser: str
+    needs_proxy: bool
+
+
+_VOV_PAGES = (("xa-hoi", "XÃ HỘI"), ("the-gioi", "THẾ GIỚI"), ("kinh-te", "KINH TẾ"), ("phap-luat", "PHÁP LUẬT"))
+
+NEWSPAPERS: Tuple[Newspaper, ...] = (
+    Newspaper("laodong.vn", "LAO ĐỘNG", ("lao động", "báo lao động", "ld"), STRATEGY_SECURE),
+    Newspaper("dantri.com.vn", "DÂN TRÍ", ("dân trí", "báo dân trí")),
+    Newspaper("vtv.vn", "VTV NEWS", ("vtv", "vtv news")),
+    Newspaper(
+        "hanoimoi.vn", "HÀ NỘI MỚI", ("hà nội mới", "hnm"), STRATEGY_HANOIMOI_RSS,
+        page_strategy=STRATEGY_HANOIMOI_HTML, needs_proxy=True,
+    ),
+    Newspaper("sggp.org.vn", "SGGP", ("sài gòn giải phóng", "sggp")),
+    Newspaper("vietnamplus.vn", "VIETNAMPLUS", ("vietnamplus", "vietnam plus", "vnplus")),
+    Newspaper("tienphong.vn", "TIỀN PHONG", ("tiền phong",)),
+    Newspaper("vnexpress.net", "VNS EXPRESS", ("vnexpress", "vn express", "vne")),
+    Newspaper("tuoitre.vn", "TUỔI TRẺ", ("tuổi trẻ",)),
+    Newspaper("cafef.vn", "CAFEF", ("cafef", "cafe f")),
+    Newspaper(
+        "vov.vn", "VOV", ("vov", "đài tiếng nói việt nam"),
+        page_strategy=STRATEGY_VOV_HTML, page_categories=_VOV_PAGES, host_limit=8, needs_proxy=True,
+    ),
+    Newspaper("baotintuc.vn", "BÁO TIN TỨC", ("tin tức", "báo tin tức")),
+    Newspaper("thanhnien.vn", "THANH NIÊN", ("thanh niên",)),
+    Newspaper("nhandan.vn", "NHÂN DÂN", ("nhân dân", "báo nhân dân")),
+)
+
+_SPACE_RE = re.compile(r"[\s\-_.]+")
+
+
+def fold(text: str) -> str:
+    """Lowercase, strip Vietnamese diacritics (đ → d), collapse whitespace."""
+    text = unicodedata.normalize("NFD", (text or "").lower().replace("đ", "d"))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(_SPACE_RE.sub(" ", text).split())
+
+
+def alias_key(text: str) -> str:
+    """Index key of an alias: folded, without the "bao" prefix and without spaces."""
+    folded = fold(text)
+    if folded.startswith("bao ") and len(folded) > 4:
+        folded = folded[4:]
+    return folded.replace(" ", "")
+
+
+def _initials(text: str) -> str:
+    words = fold(text).split()
+    if words and words[0] == "bao":
+        words = words[1:]
+    return "".join(w[0] for w in words) if len(words) > 1 else ""
+
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, giving up (returns limit + 1) once it exceeds *limit*."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _is_feed_url(url: str) -> bool:
+    return "/rss/" in url.lower()
+
+
+def category_for_url(url: str, paper: Optional[Newspaper] = None) -> str:
+    """Category implied by a feed/page URL (DEFAULT_CATEGORY when nothing matches)."""
+    url_lower = url.lower()
+    if paper is not None and paper.page_categories and not _is_feed_url(url_lower):
+        slug = url_lower.rstrip("/").split("/")[-1]
+        for page_slug, category in paper.page_categories:
+            if slug == page_slug:
+                return category
+    for category, keywords in _CATEGORY_KEYWORDS:
+        if any(keyword in url_lower for keyword in keywords):
+            return category
+    return DEFAULT_CATEGORY
+
+
+def _fallback_source(url: str) -> str:
+    try:
+        return urlparse(url).netloc.replace("www.", "").upper()
+    except ValueError:
+        return "UNKNOWN"
+
+
+class SourceIndex:
+    def __init__(
+        self,
+        newspapers: Iterable[Newspaper],
+        feed_urls: Sequence[str] = (),
+        default_parser: str = "lxml",
+    ):
+        self.default_parser = default_parser
+        self._by_domain: Dict[str, Newspaper] = {}
+        self._aliases: Dict[str, str] = {}
+        self._feeds: Dict[str, List[str]] = defaultdict(list)
+        self._trigram_index: Dict[str, set] = defaultdict(set)
+        self._fuzzy_cache: Dict[str, Optional[str]] = {}
+        # Feed URLs of the database are precomputed; other URLs (article links,
+        # ad-hoc feeds) are memoized in a bounded side table
+        self._records: Dict[str, FeedRecord] = {}
+        self._extra_records: Dict[str, FeedRecord] = {}
+
+        initials: Dict[str, set] = defaultdict(set)
+        for paper in newspapers:
+            self._by_domain[paper.domain] = paper
+            names = (paper.name, paper.domain, paper.domain.split(".")[0], *paper.aliases)
+            for alias in names:
+                key = alias_key(alias)
+                if key:
+                    self._aliases[key] = paper.domain
+            for alias in (paper.name, *paper.aliases):
+                abbreviation = _initials(alias)
+                if abbreviation:
+                    initials[abbreviation].add(paper.domain)
+        # Generated initials ("tt" = Tuổi Trẻ / Tin Tức) only when unambiguous
+        for abbreviation, domains in initials.items():
+            if len(domains) == 1 and abbreviation not in self._aliases:
+                self._aliases[abbreviation] = next(iter(domains))
+        for key in self._aliases:
+            for gram in _trigrams(key):
+                self._trigram_index[gram].add(key)
+
+        self._feed_position: Dict[str, int] = {}
+        for position, url in enumerate(feed_urls):
+            domain = self.domain_for_url(url)
+            if domain:
+                self._feeds[domain].append(url)
+                self._feed_position.setdefault(url, position)
+            self._records[url] = self._build_record(url)
+
+    # ------------------------------------------------------------------
+    # Name → domain
+    # ------------------------------------------------------------------
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Domain for a newspaper name / alias / abbreviation; None when nothing is close enough."""
+        key = alias_key(name)
+        if not key:
+            return None
+        domain = self._aliases.get(key)
+        if domain is not None:
+            return domain
+        if key not in self._fuzzy_cache:
+            if len(self._fuzzy_cache) >= 1024:
+                self._fuzzy_cache.clear()
+            self._fuzzy_cache[key] = self._fuzzy(key)
+        return self._fuzzy_cache[key]
+
+    def _fuzzy(self, key: str) -> Optional[str]:
+        if len(key) < 4:
+            # Short keys are abbreviations — too ambiguous to guess
+            return None
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in _trigrams(key):
+            for candidate in self._trigram_index.get(gram, ()):
+                shared[candidate] += 1
+        limit = 1 if len(key) <= 6 else 2
+        best: Optional[Tuple[int, int, str]] = None
+        for candidate, count in sorted(shared.items(), key=lambda x: -x[1])[:8]:
+            distance = _edit_distance(key, candidate, limit)
+            if distance <= limit and (best is None or (distance, -count) < best[:2]):
+                best = (distance, -count, candidate)
+        return self._aliases[best[2]] if best else None
+
+    # ------------------------------------------------------------------
+    # URL → newspaper / feeds / strategy
+    # ------------------------------------------------------------------
+
+    def domain_for_url(self, url: str) -> Optional[str]:
+        host = host_key(url)
+        while host:
+            if host in self._by_domain:
+                return host
+            # m.dantri.com.vn → dantri.com.vn
+            _, _, host = host.partition(".")
+        return None
+
+    def newspaper_for_url(self, url: str) -> Optional[Newspaper]:
+        domain = self.domain_for_url(url)
+        return self._by_domain.get(domain) if domain else None
+
+    def feeds_for(self, domain: str) -> List[str]:
+        return list(self._feeds.get(domain, ()))
+
+    def feeds_in_order(self, domains: Iterable[str]) -> List[str]:
+        """Feeds of several domains, merged back into feed-database order."""
+        feeds = [url for domain in set(domains) for url in self._feeds.get(domain, ())]
+        return sorted(feeds, key=self._feed_position.__getitem__)
+
+    def _build_record(self, url: str) -> FeedRecord:
+        paper = self.newspaper_for_url(url)
+        if paper is None:
+            return FeedRecord(
+                url, None, _fallback_source(url), category_for_url(url),
+                STRATEGY_HTTP, None, self.default_parser, False,
+            )
+        strategy = paper.strategy
+        if paper.page_strategy and not _is_feed_url(url):
+            strategy = paper.page_strategy
+        parser = PARSER_HTML if strategy in HTML_STRATEGIES else (paper.parser or self.default_parser)
+        return FeedRecord(
+            url, paper.domain, paper.name, category_for_url(url, paper),
+            strategy, paper.host_limit, parser, paper.needs_proxy,
+        )
+
+    def record_for(self, url: str) -> FeedRecord:
+        """Precomputed record of a feed URL (built and memoized for URLs outside the database)."""
+        record = self._records.get(url) or self._extra_records.get(url)
+        if record is None:
+            if len(self._extra_records) >= 4096:
+                self._extra_records.clear()
+            record = self._extra_records[url] = self._build_record(url)
+        return record
+
+    def strategy_for(self, url: str) -> str:
+        """Fetch strategy for a feed/page URL (STRATEGY_HTTP for unknown hosts)."""
+        return self.record_for(url).strategy
+
+    def host_limits(self) -> Dict[str, int]:
+        """Declared per-newspaper concurrency limits."""
+        return {domain: paper.host_limit for domain, paper in self._by_domain.items() if paper.host_limit}
+
+
+source_index = SourceIndex(NEWSPAPERS, settings.RSS_DATABASE, default_parser=settings.FEED_PARSER_ENGINE)
+
+# Declared limits feed the crawl scheduler; CRAWL_HOST_LIMITS entries win
+for _domain, _limit in source_index.host_limits().items():
+    crawl_scheduler.host_limits.setdefault(_domain, _limit)
@@ -0,0 +1,155 @@
+"""
+Streaming HTTP helpers — read a response incrementally and stop early.
+
+Used when we only need a prefix of a page (e.g. the <head> of a VOV article
+for `article:published_time`), so we don't download 200+ KB bodies, and to
+bound per-article memory (byte cap + stop once the article body is closed).
+
+Usage:
+    stop = PatternStop([re.compile(r"</head>", re.I)])
+    result = await stream_text(client, url, stop=stop, max_bytes=128 * 1024)
+    if stop.match: ...
+
+    # any async byte iterator (e.g. curl_cffi's response.aiter_content())
+    result = await read_capped(chunks, charset, stop=stop, max_bytes=1 << 20)
+"""
+import codecs
+import re
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, List, Optional, Pattern
+
+import httpx
+
+# <meta charset="x">, <meta http-equiv content="...; charset=x">, <?xml encoding="x"?>
+_CHARSET_SNIFF_RE = re.compile(rb"""(?:charset|encoding)\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)""", re.I)
+_SNIFF_BYTES = 2048
+
+
+@dataclass
+class StreamedText:
+    status_code: int
+    text: str
+    bytes_read: int
+    stopped_early: bool
+    # True when max_bytes cut the body (stopped_early also covers a stop callback)
+    truncated: bool = False
+
+
+class PatternStop:
+    """
+    Stop callback for stream_text: fires when any pattern matches.
+
+    Keeps a small tail of the previous chunk so matches spanning chunk
+    boundaries are still found, without rescanning the whole buffer.
+    The first pattern that matched is stored in `.match`.
+    """
+
+    def __init__(self, patterns: List[Pattern], overlap: int = 1024):
+        self.patterns = patterns
+        self.overlap = overlap
+        self.match: Optional[re.Match] = None
+        self._tail = ""
+
+    def __call__(self, chunk: str) -> bool:
+        window = self._tail + chunk
+        for pattern in self.patterns:
+            m = pattern.search(window)
+            if m:
+                self.match = m
+                return True
+        self._tail = window[-self.overlap:]
+        return False
+
+
+class IncrementalDecoder:
+    """
+    Incremental bytes → str decoding.
+
+    Uses the charset from the Content-Type header when there is one;
+    otherwise sniffs the first bytes for a <meta charset> / XML encoding
+    declaration, defaulting to UTF-8. Undecodable bytes are replaced.
+    """
+
+    def __init__(self, charset: Optional[str] = None):
+        self.charset = charset
+        self._decoder = None
+        self._pending = b""
+
+    def _make(self, encoding: str):
+        try:
+            return codecs.getincrementaldecoder(encoding)(errors="replace")
+        except LookupError:
+            return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def decode(self, raw: bytes, final: bool = False) -> str:
+        if self._decoder is None:
+            if self.charset:
+                self._decoder = self._make(self.charset)
+            else:
+                self._pending += raw
+                if len(self._pending) < _SNIFF_BYTES and not final:
+                    return ""
+                m = _CHARSET_SNIFF_RE.search(self._pending[:_SNIFF_BYTES])
+                self.charset = m.group(1).decode("ascii") if m else "utf-8"
+                self._decoder = self._make(self.charset)
+                raw, self._pending = self._pending, b""
+        return self._decoder.decode(raw, final)
+
+
+async def read_capped(
+    chunks: AsyncIterator[bytes],
+    charset: Optional[str] = None,
+    stop: Optional[Callable[[str], bool]] = None,
+    max_bytes: Optional[int] = None,
+) -> StreamedText:
+    """
+    Decode an async stream of byte chunks, honouring a byte cap and a stop callback.
+    status_code of the result is 0 — the caller knows it.
+    """
+    decoder = IncrementalDecoder(charset)
+    parts: List[str] = []
+    bytes_read = 0
+    stopped_early = truncated = False
+    async for raw in chunks:
+        if max_bytes is not None and bytes_read + len(raw) > max_bytes:
+            raw = raw[: max_bytes - bytes_read]
+            stopped_early = truncated = True
+        bytes_read += len(raw)
+        chunk = decoder.decode(raw)
+        if chunk:
+            parts.append(chunk)
+            if stop is not None and stop(chunk):
+                stopped_early = True
+        if stopped_early:
+            break
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        parts.append(tail)
+    return StreamedText(
+        status_code=0, text="".join(parts), bytes_read=bytes_read, stopped_early=stopped_early, truncated=truncated
+    )
+
+
+async def stream_text(
+    client: httpx.AsyncClient,
+    url: str,
+    stop: Optional[Callable[[str], bool]] = None,
+    max_bytes: Optional[int] = None,
+) -> StreamedText:
+    """
+    GET *url* and decode the body incrementally.
+
+    Args:
+        client: shared httpx client
+        url: URL to fetch
+        stop: called with each newly decoded chunk; returning True ends the read
+        max_bytes: hard cap on raw bytes read (None = unlimited)
+
+    Returns:
+        StreamedText with the decoded prefix that was read
+    """
+    async with client.stream("GET", url) as response:
+        result = await read_capped(response.aiter_bytes(), response.charset_encoding, stop, max_bytes)
+        result.status_code = response.status_code
+        # Leaving the context manager closes the connection without draining the rest.
+        return result
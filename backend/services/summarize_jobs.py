@@ -0,0 +1,202 @@
+"""
+Asynchronous summarization jobs.
+
+/api/articles/summarize(_stream) keeps one HTTP connection open for the
+whole multi-minute run; if it drops, all finished work is lost. Jobs
+decouple the work from the connection:
+
+  - POST creates a job (persisted in services/job_store.py) and queues it;
+  - a fixed pool of JOB_WORKERS workers runs queued jobs, summarizing
+    articles through summarizer.summarize_article (article concurrency is
+    still bounded by the summarizer's semaphore and AI limiter, shared by
+    all jobs);
+  - every finished article and progress step is appended to the job's
+    event log, so clients can poll the job or (re)attach to its stream
+    from any offset.
+
+API keys are only kept in memory for the lifetime of the run — never
+persisted. Jobs still queued/running when the process restarts cannot be
+resumed (no key) and are marked failed at startup (fail_interrupted). With
+a shared JOBS_DB_PATH, only jobs whose owner process is gone are failed:
+this process's earlier incarnation, or a dead pid on the same host. Jobs
+owned by other hosts are left alone — their processes cannot be probed.
+
+Store calls go through job_store's async variants (worker thread), so the
+per-event commits and tailers' polling stay off the event loop.
+
+Usage:
+    job = await summarize_jobs.submit(urls, articles_metadata, api_key)
+    async for line in summarize_jobs.tail(job["id"], offset=0):
+        ...  # JSON event strings, each with its "seq"
+"""
+import asyncio
+import os
+import socket
+from typing import AsyncIterator, Dict, List, Optional
+
+from config import settings
+from services.job_store import FINISHED_STATES, JOB_DONE, JOB_FAILED, JOB_QUEUED, JOB_RUNNING, job_store
+from services.retry_policy import RetryStats, run_with_stats
+from services.summarizer import summarizer
+
+JOB_KIND_SUMMARIZE = "summarize"
+
+
+def process_owner() -> str:
+    """"host:pid" of the current process (read per call: workers may fork after import)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_gone(owner: str) -> bool:
+    """True when *owner* certainly no longer runs its jobs (see fail_interrupted)."""
+    host, _, pid = owner.rpartition(":")
+    if not owner or owner == process_owner():
+        # Unknown owner (pre-owner database) or our own previous incarnation
+        return True
+    if host != socket.gethostname():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except (ValueError, OSError):
+        return False
+    return False
+
+
+class SummarizeJobManager:
+    def __init__(self, store=job_store, summarizer_=summarizer, workers: int = 2, poll_interval: float = 1.0):
+        self.store = store
+        self.summarizer = summarizer_
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        # In-memory only: job_id -> API key for the duration of the run
+        self._api_keys: Dict[str, Optional[str]] = {}
+        self._changed: Dict[str, asyncio.Event] = {}
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker_tasks = []
+        self._worker_tasks = [t for t in self._worker_tasks if not t.done()]
+        while len(self._worker_tasks) < self.workers:
+            self._worker_tasks.append(asyncio.ensure_future(self._worker()))
+        return self._queue
+
+    def _notify(self, job_id: str) -> None:
+        changed = self._changed.pop(job_id, None)
+        if changed is not None:
+            changed.set()
+
+    async def _publish(self, job_id: str, event: Dict) -> None:
+        await self.store.aappend_event(job_id, event)
+        self._notify(job_id)
+
+    async def submit(self, urls: List[str], articles_metadata: Optional[dict], api_key: Optional[str]) -> Dict:
+        """Create + queue a job; returns the stored job (without any secret)."""
+        payload = {"urls": list(urls), "articles_metadata": articles_metadata or {}}
+        job = await self.store.acreate(JOB_KIND_SUMMARIZE, payload, total=len(urls), owner=process_owner())
+        if settings.JOB_RETENTION_SEC > 0:
+            await self.store.apurge_older_than(settings.JOB_RETENTION_SEC)
+        if not urls:
+            await self._fail(job["id"], "No articles selected")
+            return await self.store.aget(job["id"])
+        self._api_keys[job["id"]] = api_key
+        self._ensure_workers().put_nowait(job["id"])
+        return job
+
+    async def _fail(self, job_id: str, message: str) -> None:
+        # Event before status: tailers stop once they see a finished status
+        await self._publish(job_id, {"type": "error", "message": message})
+        await self.store.aupdate(job_id, status=JOB_FAILED, error=message)
+
+    async def fail_interrupted(self) -> int:
+        """Mark jobs left queued/running by a process that is gone as failed."""
+        count = 0
+        for job_id, owner in (await self.store.aunfinished_owners()).items():
+            if job_id not in self._api_keys and _owner_gone(owner):
+                await self._fail(job_id, "Job bị gián đoạn do server khởi động lại — vui lòng gửi lại")
+                count += 1
+        return count
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run_job(job_id)
+            except Exception as e:
+                print(f"❌ Job {job_id} failed: {type(e).__name__}: {e}")
+                await self._fail(job_id, str(e))
+            finally:
+                self._api_keys.pop(job_id, None)
+                self._queue.task_done()
+
+    async def _run_job(self, job_id: str) -> None:
+        job = await self.store.aget(job_id)
+        if job is None or job["status"] != JOB_QUEUED:
+            return
+        api_key = self._api_keys.get(job_id)
+        urls: List[str] = job["payload"]["urls"]
+        articles_metadata: dict = job["payload"]["articles_metadata"]
+        total = len(urls)
+        await self.store.aupdate(job_id, status=JOB_RUNNING)
+        await self._publish(job_id, {"type": "progress", "completed": 0, "total": total, "current_article": "Bắt đầu xử lý...", "status": "processing"})
+
+        metadata = [self.summarizer._resolve_metadata(url, articles_metadata) for url in urls]
+
+        stats = RetryStats()
+
+        # At most batch_size articles in flight (summarize_articles_generator runs batch_size at
+        # a time too): summarize_article's timeout starts when its coroutine is created, so it is
+        # only created inside the gate
+        gate = asyncio.Semaphore(self.summarizer.batch_size)
+
+        async def one(index: int):
+            async with gate:
+                return index, await run_with_stats(stats, self.summarizer.summarize_article(urls[index], metadata[index], api_key))
+
+        results: List[Optional[dict]] = [None] * total
+        completed = 0
+        for next_done in asyncio.as_completed([one(i) for i in range(total)]):
+            index, result = await next_done
+            results[index] = result
+            completed += 1
+            # Partial result first, then progress — a reconnecting client loses nothing
+            await self._publish(job_id, {"type": "article", "index": index, "url": urls[index], "result": result})
+            await self.store.aupdate(job_id, completed=completed)
+            title = metadata[index].get("title") or urls[index]
+            await self._publish(job_id, {"type": "progress", "completed": completed, "total": total, "current_article": f"Đã xong: {title}", "status": "processing"})
+
+        summary = self.summarizer.format_summary(results)
+        await self._publish(job_id, {"type": "complete", "summary": summary, "metrics": stats.as_dict()})
+        await self.store.aupdate(job_id, status=JOB_DONE, result=summary)
+
+    async def tail(self, job_id: str, offset: int = 0) -> AsyncIterator[str]:
+        """
+        Yield serialized events from offset, following the job until it finishes.
+        Jobs run by another process are followed by polling the store.
+        """
+        while True:
+            changed = self._changed.setdefault(job_id, asyncio.Event())
+            for line in await self.store.aevents(job_id, offset):
+                yield line
+                offset += 1
+            job = await self.store.aget(job_id)
+            if job is None or job["status"] in FINISHED_STATES:
+                # Events are written before the final status: drain what is left
+                self._changed.pop(job_id, None)
+                for line in await self.store.aevents(job_id, offset):
+                    yield line
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+summarize_jobs = SummarizeJobManager(workers=settings.JOB_WORKERS)
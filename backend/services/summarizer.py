@@ -12,6 +12,20 @@ except ImportError:
 import httpx
 from config import settings
 from services.secure_fetcher import secure_fetcher
+from services.crawl_scheduler import crawl_scheduler
+from services.ai_limiter import AILimiter
+from services.article_cache import article_cache
+from services.article_extractors import article_extractors
+from services.stream_fetch import stream_text
+from services.retry_policy import (
+    AI_RATE_LIMIT_RETRY,
+    AI_TRANSIENT_RETRY,
+    FETCH_RETRY,
+    RetryPolicy,
+    RetryStats,
+    current_retry_stats,
+    run_with_stats,
+)
 from services.rss_fetcher import rss_fetcher
 from services.gemini_client import gemini_client
 from prompts import SINGLE_ARTICLE_SUMMARIZE_PROMPT, SINGLE_ARTICLE_URL_SUMMARIZE_PROMPT
@@ -27,6 +41,9 @@ class Summarizer:
         max_concurrency = max(1, int(getattr(settings, "SUMMARIZER_MAX_CONCURRENCY", 4)))
         configured_batch_size = max(1, int(getattr(settings, "SUMMARIZER_BATCH_SIZE", 4)))
         self.semaphore = asyncio.Semaphore(max_concurrency)
+        # LLM calls go through the same limiter type as the categorizers; sized
+        # separately because summaries spend the caller's API key
+        self.ai_limiter = AILimiter(max_concurrency)
         self.batch_size = min(max_concurrency, configured_batch_size)
 
     _MIN_CHARS_TO_SUMMARIZE = 80
@@ -165,32 +182,39 @@ class Summarizer:
             return False
         return bool(re.search(r'^- .{20,}', summary, re.MULTILINE))
 
-    async def _fetch_article_html(self, url: str, timeout: int = 25) -> str:
+    async def _fetch_article_html(self, url: str, timeout: int = 25, low_priority: bool = False) -> str:
         """
         Fetch nội dung HTML bài báo bằng nhiều cơ chế.
         Dùng curl_cffi trước, sau đó fallback httpx.
+        Cả hai đọc dạng stream: tối đa ARTICLE_MAX_BYTES và dừng sớm khi thẻ
+        chứa thân bài (theo article_extractors) đã đóng.
+        Cả hai lớp dùng chung một slot của crawl_scheduler (per-host + global cap).
+        low_priority=True cho prefetch nền (nhường slot cho request tương tác).
         """
-        # 1) Secure fetcher / curl_cffi (tốt cho site anti-bot)
-        try:
-            html = await secure_fetcher.fetch_rss(url, timeout=timeout)
-            if html and len(html.strip()) > 200 and not self._looks_like_block_page(html):
-                return html
-        except Exception:
-            pass
-
-        # 2) Fallback httpx
-        try:
-            async with httpx.AsyncClient(
-                timeout=timeout,
-                follow_redirects=True,
-                headers=self._HTTP_HEADERS,
-            ) as client:
-                resp = await client.get(url)
-                html = resp.text or ""
+        max_bytes = settings.ARTICLE_MAX_BYTES or None
+        body_stop = lambda: article_extractors.body_stop(url)
+        async with crawl_scheduler.slot(url, low_priority=low_priority):
+            # 1) Secure fetcher / curl_cffi (tốt cho site anti-bot), stream + byte cap
+            try:
+                html = await secure_fetcher.fetch_page(url, timeout=timeout, max_bytes=max_bytes, stop_factory=body_stop)
                 if html and len(html.strip()) > 200 and not self._looks_like_block_page(html):
                     return html
-        except Exception:
-            pass
+            except Exception:
+                pass
+
+            # 2) Fallback httpx (cũng stream, dừng khi đóng thẻ body bài)
+            try:
+                async with httpx.AsyncClient(
+                    timeout=timeout,
+                    follow_redirects=True,
+                    headers=self._HTTP_HEADERS,
+                ) as client:
+                    result = await stream_text(client, url, stop=body_stop(), max_bytes=max_bytes)
+                    html = result.text or ""
+                    if html and len(html.strip()) > 200 and not self._looks_like_block_page(html):
+                        return html
+            except Exception:
+                pass
 
         return ""
 
@@ -227,6 +251,115 @@ class Summarizer:
             f"- {excerpt}\n"
         )
 
+    @staticmethod
+    def _resolve_metadata(url: str, articles_metadata: Optional[dict]) -> dict:
+        """Metadata of one URL from the request; category falls back to the URL path."""
+        articles_metadata = articles_metadata or {}
+        clean_url = url.strip().rstrip('/')
+        metadata = articles_metadata.get(clean_url, {})
+        if not metadata:
+            metadata = articles_metadata.get(url, {})
+        metadata = dict(metadata)
+
+        # Fallback logic
+        if not metadata or not metadata.get('category'):
+            inferred_category = rss_fetcher._extract_category_from_url(url)
+            if not metadata:
+                metadata = {"source": None, "title": None, "description": ""}
+            metadata["category"] = inferred_category
+        return metadata
+
+    async def summarize_article(self, url: str, metadata: dict, api_key: str = None, timeout: float = 120) -> dict:
+        """
+        Summarize one article (single-article API, used by the job workers).
+
+        Never raises. Returns {"category": str, "text": str} on success
+        (AI summary or fallback excerpt) or {"error": str}.
+        """
+        try:
+            # Hard timeout so one slow article can't block its batch / worker
+            result = await asyncio.wait_for(self._process_single_article(url, metadata, api_key), timeout=timeout)
+        except (asyncio.TimeoutError, Exception):
+            return {"error": f"Timeout xử lý bài: {metadata.get('title') or url}"}
+        if result is None:
+            return {"error": "Không nhận được kết quả từ AI"}
+        return result
+
+    @staticmethod
+    def format_summary(results: List[Optional[dict]]) -> str:
+        """Combine per-article results into the final Markdown digest (sorted by category)."""
+        categorized_results = {
+            "KINH TẾ": [],
+            "TÀI CHÍNH": [],
+            "XÃ HỘI": [],
+            "PHÁP LUẬT": [],
+            "THẾ GIỚI": [],
+            "KHÁC": []
+        }
+        
+        failed_articles = []
+        
+        for res in results:
+            if res is None:
+                failed_articles.append({"error": "Không nhận được kết quả từ AI"})
+                continue
+            if "error" in res or "text" not in res:
+                 # Check if it was a fallback text result (which is a dict with category/text)
+                 if isinstance(res, dict) and "text" in res and "category" in res:
+                     # It's a valid result (fallback or normal)
+                     cat = res.get("category", "KHÁC").upper()
+                     if cat not in categorized_results: cat = "KHÁC"
+                     categorized_results[cat].append(res["text"])
+                 else:
+                     # It is a failure
+                     failed_articles.append(res)
+            else:
+                 cat = res.get("category", "KHÁC").upper()
+                 if cat not in categorized_results: cat = "KHÁC"
+                 categorized_results[cat].append(res["text"])
+
+        # Format Markdown
+        final_summary = f"# TIN TỨC TỔNG HỢP ({datetime.now().strftime('%d/%m/%Y')})\n\n"
+        
+        priority_order = ["KINH TẾ", "TÀI CHÍNH", "XÃ HỘI", "PHÁP LUẬT", "THẾ GIỚI", "KHÁC"]
+        
+        for cat in priority_order:
+            articles_list = categorized_results.get(cat, [])
+            if articles_list:
+                final_summary += f"## {cat} ({len(articles_list)} bài)\n\n"
+                for idx, article_text in enumerate(articles_list, 1):
+                    final_summary += f"{article_text}\n\n"
+                final_summary += "---\n\n"
+
+        
+        if failed_articles:
+             final_summary += f"### ⚠️ Không thể tóm tắt ({len(failed_articles)} bài)\n"
+             # ... error details ...
+        return final_summary
+
+    @staticmethod
+    def log_retry_metrics(stats: RetryStats) -> None:
+        m = stats.as_dict()
+        print(
+            f"⏱️ Tóm tắt: {m['retries']} lần retry, backoff {m['backoff_sec']}s, "
+            f"tiết kiệm {m['saved_sec']}s so với sleep cố định ({m['fixed_sleep_sec']}s)"
+        )
+
+    async def summarize_articles(
+        self,
+        urls: List[str],
+        api_key: str = None,
+        articles_metadata: dict = None
+    ) -> str:
+        """Non-streaming variant: run the generator and return the final summary."""
+        summary = ""
+        async for update in self.summarize_articles_generator(urls, api_key, articles_metadata):
+            if update.get("type") == "error":
+                raise ValueError(update.get("message", "Summarization failed"))
+            if update.get("type") == "complete":
+                summary = update.get("summary", "")
+        return summary
+
     async def summarize_articles_generator(
         self, 
         urls: List[str], 
@@ -244,34 +377,17 @@ class Summarizer:
         if not articles_metadata:
             articles_metadata = {}
 
-        tasks = []
         total = len(urls)
         completed = 0
-        
-        # We need to process tasks and yield as they complete
-        # Create a list of coroutines
-        for url in urls:
-            clean_url = url.strip().rstrip('/')
-            metadata = articles_metadata.get(clean_url, {})
-            if not metadata:
-                metadata = articles_metadata.get(url, {})
-            
-            # Fallback logic
-            if not metadata or not metadata.get('category'):
-                inferred_category = rss_fetcher._extract_category_from_url(url)
-                if not metadata:
-                    metadata = {"source": None, "title": None, "description": ""}
-                metadata["category"] = inferred_category
-
-            tasks.append(self._process_single_article(url, metadata, api_key))
             
         # Process in controlled batches to avoid RAM spikes on server.
         BATCH_SIZE = self.batch_size
         all_results = []
+        stats = RetryStats()
         
-        for i in range(0, len(tasks), BATCH_SIZE):
-            batch_tasks = tasks[i:i + BATCH_SIZE]
+        for i in range(0, len(urls), BATCH_SIZE):
             batch_urls = urls[i:i + BATCH_SIZE]
+            batch_meta = [self._resolve_metadata(url, articles_metadata) for url in batch_urls]
             
             # Current batch progress update
             for url in batch_urls:
@@ -286,18 +402,10 @@ class Summarizer:
                      "status": "processing"
                  }
             
-            # Wrap each task with a hard timeout so one slow article can't block the batch
-            timed_tasks = [asyncio.wait_for(t, timeout=120) for t in batch_tasks]
-            raw_results = await asyncio.gather(*timed_tasks, return_exceptions=True)
-            batch_results = []
-            for idx, r in enumerate(raw_results):
-                if isinstance(r, (asyncio.TimeoutError, Exception)):
-                    url_f = batch_urls[idx] if idx < len(batch_urls) else ""
-                    meta_f = articles_metadata.get(url_f.strip().rstrip('/')) or articles_metadata.get(url_f) or {}
-                    title_f = meta_f.get('title', url_f)
-                    batch_results.append({"error": f"Timeout xử lý bài: {title_f}"})
-                else:
-                    batch_results.append(r)
+            batch_results = await asyncio.gather(*[
+                run_with_stats(stats, self.summarize_article(url, meta, api_key))
+                for url, meta in zip(batch_urls, batch_meta)
+            ])
             all_results.extend(batch_results)
             completed += len(batch_results)
             
@@ -310,151 +418,119 @@ class Summarizer:
                 "status": "processing"
             }
             
-            if i + BATCH_SIZE < len(tasks):
-                await asyncio.sleep(0.5)
-                
-        # ... (rest of processing logic identical to summarize_articles) ...
-        # Copied logic for combining results
-        
-        results = all_results
-        
-        # Sort results by category
-        # ... (reuse logic) ...
-        # For brevity, calling internal helper or duplicating logic? 
-        # Duplicating logic is safer to avoid breaking existing method
-        
-        categorized_results = {
-            "KINH TẾ": [],
-            "TÀI CHÍNH": [],
-            "XÃ HỘI": [],
-            "PHÁP LUẬT": [],
-            "THẾ GIỚI": [],
-            "KHÁC": []
-        }
-        
-        failed_articles = []
-        
-        for res in results:
-            if res is None:
-                failed_articles.append({"error": "Không nhận được kết quả từ AI"})
-                continue
-            if "error" in res or "text" not in res:
-                 # Check if it was a fallback text result (which is a dict with category/text)
-                 if isinstance(res, dict) and "text" in res and "category" in res:
-                     # It's a valid result (fallback or normal)
-                     cat = res.get("category", "KHÁC").upper()
-                     if cat not in categorized_results: cat = "KHÁC"
-                     categorized_results[cat].append(res["text"])
-                 else:
-                     # It is a failure
-                     failed_articles.append(res)
-            else:
-                 cat = res.get("category", "KHÁC").upper()
-                 if cat not in categorized_results: cat = "KHÁC"
-                 categorized_results[cat].append(res["text"])
-
-        # Format Markdown
-        final_summary = f"# TIN TỨC TỔNG HỢP ({datetime.now().strftime('%d/%m/%Y')})\n\n"
-        
-        priority_order = ["KINH TẾ", "TÀI CHÍNH", "XÃ HỘI", "PHÁP LUẬT", "THẾ GIỚI", "KHÁC"]
-        
-        for cat in priority_order:
-            articles_list = categorized_results.get(cat, [])
-            if articles_list:
-                final_summary += f"## {cat} ({len(articles_list)} bài)\n\n"
-                for idx, article_text in enumerate(articles_list, 1):
-                    final_summary += f"{article_text}\n\n"
-                final_summary += "---\n\n"
+            if i + BATCH_SIZE < len(urls):
+                # No pause between batches any more (was a fixed 0.5 s)
+                stats.record_skipped(0.5)
 
-        
-        if failed_articles:
-             final_summary += f"### ⚠️ Không thể tóm tắt ({len(failed_articles)} bài)\n"
-             # ... error details ...
-        
+        self.log_retry_metrics(stats)
         yield {
             "type": "complete", 
-            "summary": final_summary
+            "summary": self.format_summary(all_results),
+            "metrics": stats.as_dict(),
         }
 
+    @staticmethod
+    def _ai_retry_policy(error: str) -> Optional[RetryPolicy]:
+        """Backoff for a failed AI call; None = retry right away with a shorter body."""
+        el = error.lower()
+        if "429" in error or "resource exhausted" in el:
+            return AI_RATE_LIMIT_RETRY
+        if any(x in error for x in ("503", "502", "500", "504")) or "timeout" in el:
+            return AI_TRANSIENT_RETRY
+        return None
+
     async def _process_single_article(self, url: str, metadata: dict, api_key: str) -> dict:
         """
         Fetch and summarize a single article with concurrency control.
+        The semaphore (page fetch) / AI limiter slot is held per attempt; retry
+        backoff waits outside it so a failing article doesn't block a slot.
         Returns dict: {"category": str, "text": str} or None
         """
-        async with self.semaphore:
-
-
-            try:
-                # Prepare metadata first for fallback
-                source = metadata.get('source', 'Nguồn Khác')
-                category = metadata.get('category', 'TIN TỨC') 
-                title = metadata.get('title', 'Tiêu đề bài viết')
-                rss_plain = self._strip_html(metadata.get("description") or "")
-                event_plain = (metadata.get("event_summary") or "").strip()
-
-                def get_fallback_summary(note: str = "") -> str:
-                    # Always include a "- " bullet so output is consistent with AI summaries.
-                    # Use RSS description excerpt if available, otherwise a short note.
-                    excerpt = " ".join((rss_plain or "").split())
-                    if len(excerpt) > 400:
-                        cut = excerpt[:401]
-                        excerpt = cut.rsplit(" ", 1)[0] + "…"
-                    if excerpt:
-                        bullet = f"- {excerpt}"
-                    else:
-                        extra = note or "Không tải được nội dung đầy đủ. Mở liên kết để đọc toàn bài."
-                        bullet = f"- {extra}"
-                    return (
-                        f"### [{title}]({url})\n"
-                        f"**Nguồn:** {source}\n\n"
-                        f"{bullet}"
-                    )
-
-                await asyncio.sleep(0.5)
-                last_ai_error: Optional[str] = None
-
-                # Bước 1: Fetch trang + gửi nội dung cho AI
-                print(f"   🔄 Fetch thủ công: {url[:50]}")
-                content: Optional[str] = None
-                best_merged = ""
+        stats = current_retry_stats()
+        if stats is not None:
+            # The old fixed 0.5 s pause before every article
+            stats.record_skipped(0.5)
 
-                for attempt in range(3):
+        try:
+            # Prepare metadata first for fallback
+            source = metadata.get('source', 'Nguồn Khác')
+            category = metadata.get('category', 'TIN TỨC') 
+            title = metadata.get('title', 'Tiêu đề bài viết')
+            rss_plain = self._strip_html(metadata.get("description") or "")
+            event_plain = (metadata.get("event_summary") or "").strip()
+
+            def get_fallback_summary(note: str = "") -> str:
+                # Always include a "- " bullet so output is consistent with AI summaries.
+                # Use RSS description excerpt if available, otherwise a short note.
+                excerpt = " ".join((rss_plain or "").split())
+                if len(excerpt) > 400:
+                    cut = excerpt[:401]
+                    excerpt = cut.rsplit(" ", 1)[0] + "…"
+                if excerpt:
+                    bullet = f"- {excerpt}"
+                else:
+                    extra = note or "Không tải được nội dung đầy đủ. Mở liên kết để đọc toàn bài."
+                    bullet = f"- {extra}"
+                return (
+                    f"### [{title}]({url})\n"
+                    f"**Nguồn:** {source}\n\n"
+                    f"{bullet}"
+                )
+
+            last_ai_error: Optional[str] = None
+
+            # Bước 1: Fetch trang + gửi nội dung cho AI
+            print(f"   🔄 Fetch thủ công: {url[:50]}")
+            content: Optional[str] = None
+            best_merged = ""
+
+            # Nội dung đã prefetch trong lúc dedup (services/article_prefetcher.py)
+            cached_extracted = article_cache.get(url)
+            if cached_extracted:
+                merged = self._merge_page_and_feed(cached_extracted, rss_plain, event_plain)
+                best_merged = merged
+                if len(merged.strip()) >= self._MIN_CHARS_TO_SUMMARIZE:
+                    print(f"   ⚡ Dùng nội dung prefetch: {url[:50]}")
+                    content = merged
+
+            for attempt in range(0 if content else FETCH_RETRY.attempts):
+                if attempt:
+                    # Backoff chỉ sau lần thất bại thật; nhịp request do crawl_scheduler lo
+                    await FETCH_RETRY.sleep(attempt)
+                async with self.semaphore:
                     try:
                         raw_html = await self._fetch_article_html(url)
                         if not raw_html or len(raw_html.strip()) < 80:
-                            if attempt < 2:
-                                await asyncio.sleep(2 * (attempt + 1))
                             continue
-                        page_extracted = self._extract_content(raw_html, limit=15000)
+                        page_extracted = self._extract_content(raw_html, limit=15000, url=url)
+                        article_cache.set(url, page_extracted)
                         merged = self._merge_page_and_feed(page_extracted, rss_plain, event_plain)
                         if len(merged) > len(best_merged):
                             best_merged = merged
                         if len(merged.strip()) >= self._MIN_CHARS_TO_SUMMARIZE:
                             content = merged
                             break
-                        if attempt < 2:
-                            await asyncio.sleep(2 * (attempt + 1))
                     except Exception as e:
                         print(f"   ❌ Fetch error attempt {attempt+1}: {e}")
-                        await asyncio.sleep(2 * (attempt + 1))
-
-                if not content and best_merged:
-                    content = best_merged
-
-                # Nếu fetch thất bại, dùng title + RSS description làm content
-                if not content or len(content.strip()) < self._MIN_CHARS_TO_SUMMARIZE:
-                    fallback_content = f"{title}\n\n{rss_plain}".strip()
-                    if fallback_content:
-                        content = fallback_content
-                        print(f"   ℹ️ Dùng title+RSS làm content ({len(content)} ký tự): {url[:50]}")
-                    else:
-                        return {"category": category.upper(), "text": get_fallback_summary()}
-
-                # Gọi Gemini với nội dung đã fetch
-                body_limits = (28000, 16000, 9000, 4500, 2000)
-                for ai_attempt, max_body in enumerate(body_limits):
-                    try:
-                        prompt = self._build_summarize_prompt(title, content, source, category, url, max_body)
+
+            if not content and best_merged:
+                content = best_merged
+
+            # Nếu fetch thất bại, dùng title + RSS description làm content
+            if not content or len(content.strip()) < self._MIN_CHARS_TO_SUMMARIZE:
+                fallback_content = f"{title}\n\n{rss_plain}".strip()
+                if fallback_content:
+                    content = fallback_content
+                    print(f"   ℹ️ Dùng title+RSS làm content ({len(content)} ký tự): {url[:50]}")
+                else:
+                    return {"category": category.upper(), "text": get_fallback_summary()}
+
+            # Gọi Gemini với nội dung đã fetch
+            body_limits = (28000, 16000, 9000, 4500, 2000)
+            for ai_attempt, max_body in enumerate(body_limits):
+                try:
+                    prompt = self._build_summarize_prompt(title, content, source, category, url, max_body)
+                    async with self.ai_limiter.slot():
                         summary = await gemini_client.async_generate_content(
                             prompt=prompt,
                             model_name=settings.GEMINI_MODEL,
@@ -462,28 +538,25 @@ class Summarizer:
                             max_tokens=2048,
                             api_key=api_key,
                         )
-                        if summary and len(summary.strip()) > 150 and Summarizer._has_bullet_content(summary):
-                            print(f"   ✅ Summarized via fetch fallback: {url[:50]}")
-                            return {"category": category.upper(), "text": summary.strip()}
-                        last_ai_error = "Phản hồi thiếu bullet tóm tắt"
-                    except Exception as e:
-                        last_ai_error = str(e)
-                        el = last_ai_error.lower()
-                        if "429" in last_ai_error or "resource exhausted" in el:
-                            await asyncio.sleep(min(32, (ai_attempt + 1) * 3))
-                            continue
-                        if any(x in last_ai_error for x in ("503", "502", "500", "504")) or "timeout" in el:
-                            await asyncio.sleep(2 + ai_attempt)
-                            continue
-                        if ai_attempt < len(body_limits) - 1:
-                            await asyncio.sleep(1)
-                            continue
-
-                # Thử 1 lần cuối với RSS description ngắn — luôn yêu cầu AI tóm tắt, không hiện excerpt thô
-                short_content = f"{title}\n\n{rss_plain}".strip() if rss_plain else title
-                if short_content:
-                    try:
-                        prompt = self._build_summarize_prompt(title, short_content, source, category, url, 4000)
+                    if summary and len(summary.strip()) > 150 and Summarizer._has_bullet_content(summary):
+                        print(f"   ✅ Summarized via fetch fallback: {url[:50]}")
+                        return {"category": category.upper(), "text": summary.strip()}
+                    last_ai_error = "Phản hồi thiếu bullet tóm tắt"
+                except Exception as e:
+                    last_ai_error = str(e)
+                    policy = self._ai_retry_policy(last_ai_error)
+                    if policy is not None:
+                        await policy.sleep(ai_attempt + 1)
+                    elif stats is not None and ai_attempt < len(body_limits) - 1:
+                        # Other errors retry at once with a shorter body (was a fixed 1 s)
+                        stats.record_skipped(1.0)
+
+            # Thử 1 lần cuối với RSS description ngắn — luôn yêu cầu AI tóm tắt, không hiện excerpt thô
+            short_content = f"{title}\n\n{rss_plain}".strip() if rss_plain else title
+            if short_content:
+                try:
+                    prompt = self._build_summarize_prompt(title, short_content, source, category, url, 4000)
+                    async with self.ai_limiter.slot():
                         summary = await gemini_client.async_generate_content(
                             prompt=prompt,
                             model_name=settings.GEMINI_MODEL,
@@ -491,26 +564,33 @@ class Summarizer:
                             max_tokens=1024,
                             api_key=api_key,
                         )
-                        if summary and len(summary.strip()) > 100 and Summarizer._has_bullet_content(summary):
-                            print(f"   ✅ Summarized via RSS fallback: {url[:50]}")
-                            return {"category": category.upper(), "text": summary.strip()}
-                    except Exception:
-                        pass
-                return {"category": category.upper(), "text": get_fallback_summary("API tóm tắt AI không phản hồi hoặc bị chặn.")}
-
-            except Exception as e:
-                print(f"❌ Error processing {url}: {str(e)}")
-                return {"error": f"Lỗi xử lý: {str(e)}"}
-
-    def _extract_content(self, html: str, limit: int = 8000) -> str:
+                    if summary and len(summary.strip()) > 100 and Summarizer._has_bullet_content(summary):
+                        print(f"   ✅ Summarized via RSS fallback: {url[:50]}")
+                        return {"category": category.upper(), "text": summary.strip()}
+                except Exception:
+                    pass
+            return {"category": category.upper(), "text": get_fallback_summary("API tóm tắt AI không phản hồi hoặc bị chặn.")}
+
+        except Exception as e:
+            print(f"❌ Error processing {url}: {str(e)}")
+            return {"error": f"Lỗi xử lý: {str(e)}"}
+
+    def _extract_content(self, html: str, limit: int = 8000, url: str = "") -> str:
         """
         Trích nội dung chính từ HTML.
+        Per-site: rule lxml/XPath theo domain (services/article_extractors.py) khi biết url.
         Layer 0: trafilatura (F1: 0.945) — nếu >= 200 chars, dùng ngay.
         Layer 1: JSON-LD articleBody.
         Layer 2: BS4 CSS selectors (20 selectors).
         Layer 3: Meta tags.
         """
         try:
+            # Per-site extractor — known domains, much faster than the generic chain
+            if url:
+                site_text = article_extractors.extract(url, html)
+                if site_text:
+                    return site_text[:limit]
+
             # Layer 0: trafilatura — highest precision content extraction
             if _TRAFILATURA_AVAILABLE and html:
                 try:
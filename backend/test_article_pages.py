@@ -0,0 +1,84 @@
+"""
+Unit tests for services.article_pages (cursor pagination, filters and field
+projection over a fetched article set).
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_article_pages.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+
+from services.article_pages import (
+    ArticleQuery,
+    ArticleQueryError,
+    decode_cursor,
+    encode_cursor,
+    page_articles,
+)
+from services.article_record import ARTICLE_FIELDS, ArticleRecord
+
+
+def _articles(count=10):
+    articles = []
+    for i in range(count):
+        record = ArticleRecord(
+            f"https://x.vn/{i}.html", f"Bài {i}", "KINH TẾ" if i % 2 else "XÃ HỘI",
+            "07:00 16/03/2026", "VOV" if i < 5 else "DÂN TRÍ", description="Mô tả",
+        )
+        if i % 3:
+            record["is_master"] = False
+        articles.append(record)
+    return articles
+
+
+def _walk(articles, query, limit):
+    pages, cursor = [], None
+    while True:
+        page, cursor = page_articles(articles, query, cursor=cursor, limit=limit)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+def test_pages_cover_the_set_in_order():
+    articles = _articles()
+    pages = _walk(articles, ArticleQuery.parse(fields="url"), limit=4)
+    assert [len(p) for p in pages] == [4, 4, 2]
+    assert [a["url"] for p in pages for a in p] == [a.url for a in articles]
+
+
+def test_projection_and_defaults():
+    page, _ = page_articles(_articles(1), ArticleQuery.parse(fields="title, is_master,title,group_id"))
+    assert page == [{"title": "Bài 0", "is_master": True, "group_id": ""}]
+
+    full, _ = page_articles([{"url": "u", "title": "t"}], ArticleQuery.parse())
+    assert tuple(full[0]) == ARTICLE_FIELDS and full[0]["duplicate_count"] == 0
+
+    with pytest.raises(ArticleQueryError, match="Unknown fields: body"):
+        ArticleQuery.parse(fields="title,body")
+
+
+def test_filters_scan_from_cursor():
+    articles = _articles()
+    query = ArticleQuery.parse(fields="url", source="dân trí, VOV", category="kinh tế", is_master=False)
+    pages = _walk(articles, query, limit=2)
+    urls = [a["url"] for p in pages for a in p]
+    assert urls == [a.url for a in articles if a.category == "KINH TẾ" and a.get("is_master") is False]
+    assert ArticleQuery.parse(source="VOV").matches(articles[0])
+    assert not ArticleQuery.parse(source="VOV").matches(articles[9])
+
+
+def test_cursor_roundtrip_and_validation():
+    assert decode_cursor(encode_cursor(120)) == 120
+    assert decode_cursor(None) == 0
+    for bad in ("%%%", "bm90LWEtbnVtYmVy", encode_cursor(-1)):
+        with pytest.raises(ArticleQueryError):
+            decode_cursor(bad)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,220 @@
+"""
+Unit tests for batched ArticleCategorizer.categorize_articles_batch and the
+deterministic Categorizer (/api/articles/categorize).
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_categorizer.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+import re
+
+import pytest
+
+import services.article_categorizer as categorizer_module
+from services.article_categorizer import CATEGORY_CACHE_NS, ArticleCategorizer
+from services.categorizer import Categorizer
+from services.ai_limiter import AILimiter
+from services.crawl_scheduler import crawl_scheduler
+from services.category_classifier import CategoryClassifier
+from services.persistent_cache import PersistentCache
+
+CODES = ["KT", "TC", "XH", "PL"]
+# No local model: every uncached article goes to the (fake) LLM
+NO_MODEL = CategoryClassifier(model_path=os.devnull + ".missing")
+
+
+def _articles(n):
+    return [
+        {"title": f"Bài {i}", "description": f"<p>Mô tả {i}</p>", "url": f"https://vnexpress.net/bai-{i}.html"}
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    calls = []
+
+    async def generate(prompt, **kwargs):
+        calls.append(prompt)
+        # Room for thinking tokens, not just the JSON reply
+        assert kwargs["max_tokens"] >= 4096
+        await asyncio.sleep(0.01)
+        if "DANH SÁCH BÀI VIẾT" not in prompt:
+            return "XÃ HỘI"
+        # Answer "Bài i" with CODES[i % 4]; skip "Bài 5" to exercise the single-call fallback
+        numbered = re.findall(r"^(\d+) \| Bài (\d+)", prompt, re.M)
+        answer = {n: CODES[int(i) % 4] for n, i in numbered if i != "5"}
+        return "```json\n" + str(answer).replace("'", '"') + "\n```"
+
+    monkeypatch.setattr(categorizer_module.gemini_client, "async_generate_content", generate)
+    return calls
+
+
+def test_batches_concurrently_and_caches_per_url(fake_llm):
+    limiter = AILimiter(2)
+    categorizer = ArticleCategorizer(cache=PersistentCache(":memory:"), batch_size=4, classifier=NO_MODEL, limiter=limiter)
+    articles = _articles(10)
+    peak, crawl_peak = [], []
+
+    async def run():
+        async def watch():
+            while True:
+                peak.append(limiter.in_flight)
+                crawl_peak.append(crawl_scheduler.in_flight)
+                await asyncio.sleep(0.001)
+        watcher = asyncio.ensure_future(watch())
+        try:
+            return await categorizer.categorize_articles_batch(articles)
+        finally:
+            watcher.cancel()
+
+    result = asyncio.run(run())
+    # LLM calls are capped by the AI limiter and never take crawl slots
+    assert max(peak) == 2 and limiter.in_flight == 0
+    assert max(crawl_peak) == 0
+
+    assert result is articles
+    assert [a["category"] for a in result[:5]] == ["KINH TẾ", "TÀI CHÍNH", "XÃ HỘI", "PHÁP LUẬT", "KINH TẾ"]
+    # 3 batch calls (4+4+2) + 1 single call for the item the model skipped
+    assert len(fake_llm) == 4
+    assert "Mô tả 0" in fake_llm[0] and "<p>" not in fake_llm[0]
+
+    cached = categorizer.cache.get_many(CATEGORY_CACHE_NS, [a["url"] for a in articles])
+    assert len(cached) == 9 and articles[5]["url"] not in cached
+
+    # Re-categorization only asks about the uncached article
+    fake_llm.clear()
+    again = asyncio.run(categorizer.categorize_articles_batch(_articles(10)))
+    assert [a["category"] for a in again] == [a["category"] for a in result]
+    assert len(fake_llm) == 2 and "Bài 5" in fake_llm[0]
+
+
+def test_empty_batch_reply_falls_back_concurrently(monkeypatch):
+    active, peak = [0], [0]
+
+    async def generate(prompt, **kwargs):
+        if "DANH SÁCH BÀI VIẾT" in prompt:
+            return ""  # e.g. the whole budget went to thinking
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        return "PHÁP LUẬT"
+
+    monkeypatch.setattr(categorizer_module.gemini_client, "async_generate_content", generate)
+    categorizer = ArticleCategorizer(cache=PersistentCache(":memory:"), batch_size=6, classifier=NO_MODEL,
+                                     limiter=AILimiter(3))
+    result = asyncio.run(categorizer.categorize_articles_batch(_articles(6)))
+    assert [a["category"] for a in result] == ["PHÁP LUẬT"] * 6
+    assert peak[0] == 3
+
+
+def test_categorizers_share_the_ai_limiter():
+    from services.ai_limiter import ai_limiter
+    assert ArticleCategorizer().limiter is ai_limiter and Categorizer().limiter is ai_limiter
+
+
+def test_parse_batch_response_tolerates_noise():
+    categorizer = ArticleCategorizer(cache=PersistentCache(":memory:"), classifier=NO_MODEL)
+    parsed = categorizer._parse_batch_response('Kết quả: {"1": "tc", "2": "PHÁP LUẬT", "9": "KT", "x": "XH"}', 3)
+    assert parsed == {0: "TÀI CHÍNH", 1: "PHÁP LUẬT"}
+    assert categorizer._parse_batch_response("không có JSON", 3) == {}
+
+
+ARTICLES_TEXT = """Nguồn: Lao Động (06h00 - 08h00)
+Chuyên mục: Kinh doanh
+- Giá vàng tăng mạnh https://laodong.vn/tien-te/gia-vang-tang-1234.ldo
+- [https://laodong.vn/tien-te/lai-suat-5678.ldo]<span>Fri, 23 Jan</span>
+## Pháp luật
+https://vnexpress.net/bat-giu-nghi-pham-4321.html, Thu, 22 Jan
+Không có bài viết trong khung giờ đã chọn
+Tiêu đề: Hội nghị thượng đỉnh ASEAN | Chuyên mục: Thế giới | https://vov.vn/hoi-nghi-asean-1.vov
+https://dantri.com.vn/xa-hoi/mua-lon-gay-ngap.htm
+https://example.vn/bai-khong-ro-rang.html Một tiêu đề mơ hồ
+https://laodong.vn/tien-te/gia-vang-tang-1234.ldo
+"""
+
+
+def test_parse_lines_extracts_clean_urls_and_metadata():
+    entries = Categorizer.parse_lines(ARTICLES_TEXT)
+    assert [(url, section) for url, _, section in entries] == [
+        ("https://laodong.vn/tien-te/gia-vang-tang-1234.ldo", "Kinh tế"),
+        ("https://laodong.vn/tien-te/lai-suat-5678.ldo", "Kinh tế"),
+        ("https://vnexpress.net/bat-giu-nghi-pham-4321.html", "Pháp luật"),
+        # Inline metadata beats the heading above it
+        ("https://vov.vn/hoi-nghi-asean-1.vov", "Thế giới"),
+        ("https://dantri.com.vn/xa-hoi/mua-lon-gay-ngap.htm", "Pháp luật"),
+        ("https://example.vn/bai-khong-ro-rang.html", "Pháp luật"),
+    ]
+
+
+def test_local_categorize_calls_llm_only_for_unresolved_lines(monkeypatch):
+    calls = []
+
+    async def generate(prompt, **kwargs):
+        calls.append(prompt)
+        return '{"1": "TG"}'
+
+    monkeypatch.setattr(categorizer_module.gemini_client, "async_generate_content", generate)
+    text = (
+        "Chuyên mục: Kinh tế\n- https://laodong.vn/a.ldo\n"
+        "\n---\n"
+        "https://dantri.com.vn/phap-luat/vu-an.htm\n"
+        "https://example.vn/bai-mo-ho.html Một tiêu đề mơ hồ\n"
+    )
+    cache = PersistentCache(":memory:")
+    local = Categorizer(cache=cache, classifier=NO_MODEL, mode="local")
+
+    report = asyncio.run(local.categorize_articles(text))
+
+    assert report.startswith("Dưới đây là tổng hợp toàn bộ link tin tức tìm thấy:")
+    assert "## 1. Chuyên mục Kinh tế (1 bài)\n- https://laodong.vn/a.ldo" in report
+    assert "## 2. Chuyên mục Xã hội (0 bài)" in report
+    assert "## 3. Chuyên mục Thế giới (1 bài)\n- https://example.vn/bai-mo-ho.html" in report
+    assert "## 4. Chuyên mục Pháp luật (1 bài)\n- https://dantri.com.vn/phap-luat/vu-an.htm" in report
+    assert len(calls) == 1 and "bai-mo-ho" in calls[0] and "laodong" not in calls[0]
+
+    # Answer cached per URL; the ArticleCategorizer cache is reused too
+    cache.set(CATEGORY_CACHE_NS, "https://example.vn/other.html", "TÀI CHÍNH")
+    calls.clear()
+    again = asyncio.run(local.categorize_articles("https://example.vn/bai-mo-ho.html\nhttps://example.vn/other.html"))
+    assert calls == []
+    assert "Kinh tế (1 bài)\n- https://example.vn/other.html" in again
+    assert "Thế giới (1 bài)\n- https://example.vn/bai-mo-ho.html" in again
+
+
+def test_local_categorize_chunks_lines_and_never_guesses(monkeypatch):
+    calls = []
+    skip = {"https://example.vn/bai-3.html"}
+
+    async def generate(prompt, **kwargs):
+        calls.append(re.findall(r"^(\d+) \| .*?(https://\S+)$", prompt, re.M))
+        numbered = calls[-1]
+        if not numbered:
+            return "FULL REPORT"  # full CATEGORIZE_PROMPT
+        assert kwargs["max_tokens"] >= 4096
+        return "{" + ",".join(f'"{n}": "XH"' for n, url in numbered if url not in skip) + "}"
+
+    monkeypatch.setattr(categorizer_module.gemini_client, "async_generate_content", generate)
+    text = "\n".join(f"https://example.vn/bai-{i}.html Tiêu đề mơ hồ {i}" for i in range(5))
+    local = Categorizer(cache=PersistentCache(":memory:"), classifier=NO_MODEL, mode="local", batch_size=2)
+
+    # 3 chunked calls (2+2+1), the skipped line asked once more, then the full prompt
+    assert asyncio.run(local.categorize_articles(text)) == "FULL REPORT"
+    assert [len(c) for c in calls] == [2, 2, 1, 1, 0]
+
+    # Everything answered: no full-prompt call, no "Xã hội" default involved
+    skip.clear()
+    calls.clear()
+    report = asyncio.run(Categorizer(cache=PersistentCache(":memory:"), classifier=NO_MODEL, mode="local",
+                                     batch_size=2).categorize_articles(text))
+    assert "Xã hội (5 bài)" in report and len(calls) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,121 @@
+"""
+Unit tests for services.category_classifier (local naive Bayes categories).
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_category_classifier.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+import json
+
+import pytest
+
+import services.article_categorizer as categorizer_module
+from services.article_categorizer import ArticleCategorizer
+from services.category_classifier import (
+    DEFAULT_MODEL_PATH,
+    CategoryClassifier,
+    category_classifier,
+    NaiveBayesModel,
+    cross_validate,
+    features,
+    load_samples,
+    main,
+    url_label,
+)
+from services.persistent_cache import PersistentCache
+from config import settings
+
+SEED = os.path.join(os.path.dirname(__file__), "data", "category_seed.jsonl")
+
+
+def test_features_normalize_vietnamese_text():
+    # NFD input, HTML, digits and punctuation
+    tokens = features("Lãi suất̀ <b>GIẢM</b> 0,5%!", "")
+    assert "giảm" in tokens and "lãi_suất" in tokens
+    assert features("Lãi suất", "") == features("Lãi suất", "")
+    assert not any(t.isdigit() for t in tokens)
+
+
+def test_url_label_requires_evidence():
+    assert url_label("https://laodong.vn/rss/kinh-doanh.rss") == "KINH TẾ"
+    assert url_label("https://tienphong.vn/rss/phap-luat-12.rss") == "PHÁP LUẬT"
+    assert url_label("https://vov.vn/xa-hoi") == "XÃ HỘI"
+    # _extract_category_from_url's default / labels outside the 4 are not training evidence
+    assert url_label("https://example.com/rss/home.rss") is None
+    assert url_label("https://vnexpress.net/rss/the-gioi.rss") is None
+
+
+def test_model_roundtrip_and_confidence(tmp_path):
+    model = NaiveBayesModel.fit(load_samples([SEED]))
+    restored = NaiveBayesModel.from_dict(json.loads(json.dumps(model.to_dict())))
+    tokens = features("Ngân hàng giảm lãi suất cho vay", "")
+    assert restored.scores(tokens) == model.scores(tokens)
+
+    classifier = CategoryClassifier(str(tmp_path / "missing.json"))
+    assert classifier.predict("Ngân hàng giảm lãi suất") is None
+    classifier.set_model(model)
+    assert classifier.predict("Ngân hàng giảm lãi suất cho vay").label == "TÀI CHÍNH"
+    assert classifier.predict("Khởi tố vụ án lừa đảo, bắt tạm giam bị can").label == "PHÁP LUẬT"
+    assert classifier.predict("zzz qqq") is None
+
+
+def test_cli_train_and_evaluate(tmp_path, capsys):
+    archive = tmp_path / "archive.jsonl"
+    archive.write_text(
+        json.dumps({"title": "Cổ phiếu ngân hàng tăng trần", "url": "https://laodong.vn/rss/kinh-doanh.rss"}, ensure_ascii=False) + "\n"
+        + json.dumps({"title": "Không rõ chuyên mục", "url": "https://example.com/rss/home.rss"}, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    out = tmp_path / "model.json"
+    assert main(["train", "--data", SEED, str(archive), "--out", str(out)]) == 0
+    assert sum(json.loads(out.read_text(encoding="utf-8"))["doc_counts"].values()) == 161
+
+    report = cross_validate(load_samples([SEED]), folds=4, min_confidence=0.9)
+    assert report["samples"] == 160
+    assert report["confident_accuracy"] >= 0.85
+    assert main(["predict", "Giá vàng SJC lập kỷ lục", "--model", str(out)]) == 0
+    assert "TÀI CHÍNH" in capsys.readouterr().out
+
+
+def test_shipped_model_loads():
+    classifier = CategoryClassifier(DEFAULT_MODEL_PATH)
+    assert classifier.model is not None
+    assert classifier.predict("Bắt giữ đối tượng vận chuyển ma túy").label == "PHÁP LUẬT"
+
+
+def test_classifier_is_off_by_default():
+    # Seed-only model: confident_accuracy ~0.93 is too low to bypass the LLM unasked
+    assert CategoryClassifier(DEFAULT_MODEL_PATH).min_confidence >= 0.98
+    assert CategoryClassifier(DEFAULT_MODEL_PATH, enabled=False).predict("Bắt giữ đối tượng vận chuyển ma túy") is None
+    if not settings.CATEGORY_CLASSIFIER_ENABLED:
+        assert category_classifier.predict("Bắt giữ đối tượng vận chuyển ma túy") is None
+
+
+def test_categorizer_skips_llm_for_confident_predictions(monkeypatch):
+    calls = []
+
+    async def generate(prompt, **kwargs):
+        calls.append(prompt)
+        return '{"1": "XH"}'
+
+    monkeypatch.setattr(categorizer_module.gemini_client, "async_generate_content", generate)
+    classifier = CategoryClassifier(DEFAULT_MODEL_PATH, min_confidence=0.9)
+    categorizer = ArticleCategorizer(cache=PersistentCache(":memory:"), classifier=classifier)
+    articles = [
+        {"title": "Ngân hàng Nhà nước giữ nguyên lãi suất điều hành", "description": "", "url": "https://a.vn/1"},
+        {"title": "Khởi tố vụ án lừa đảo chiếm đoạt tài sản", "description": "", "url": "https://a.vn/2"},
+        {"title": "Một tiêu đề mơ hồ", "description": "", "url": "https://a.vn/3"},
+    ]
+    asyncio.run(categorizer.categorize_articles_batch(articles))
+    assert [a["category"] for a in articles[:2]] == ["TÀI CHÍNH", "PHÁP LUẬT"]
+    # Only the low-confidence article reached the LLM
+    assert len(calls) == 1 and "mơ hồ" in calls[0] and "lãi suất" not in calls[0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,115 @@
+"""
+Unit tests for services.compression.CompressionMiddleware (per-event flushed
+gzip for SSE / NDJSON, buffered compression for regular JSON).
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_compression.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+
+from services.compression import (
+    MODE_BUFFER,
+    MODE_OFF,
+    CompressionMiddleware,
+    negotiate_encoding,
+    parse_route_modes,
+)
+
+EVENTS = [f'data: {{"step": "progress", "n": {i}, "msg": "Đang tải nguồn {i}"}}\n\n'.encode() for i in range(3)]
+
+
+def _app(content_type, chunks, extra_headers=()):
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type.encode())] + list(extra_headers)
+        if len(chunks) == 1:
+            headers.append((b"content-length", str(len(chunks[0])).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+    return app
+
+
+def _call(middleware, path="/api/rss/fetch_stream", accept="gzip, deflate, br"):
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    scope = {"type": "http", "method": "POST", "path": path, "headers": [(b"accept-encoding", accept.encode())]}
+    asyncio.run(middleware(scope, receive, send))
+    headers = dict(sent[0]["headers"])
+    return headers, [m["body"] for m in sent[1:]]
+
+
+def test_sse_events_are_flushed_one_by_one():
+    middleware = CompressionMiddleware(_app("text/event-stream", EVENTS + [b""]), brotli=False)
+    headers, bodies = _call(middleware)
+
+    assert headers[b"content-encoding"] == b"gzip" and headers[b"vary"] == b"Accept-Encoding"
+    # Each chunk decompresses to its whole event on arrival (Z_SYNC_FLUSH), nothing held back
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert [decoder.decompress(body) for body in bodies[:3]] == EVENTS
+    decoder.decompress(bodies[3])
+    assert decoder.eof
+
+
+def test_json_is_compressed_only_when_large():
+    small = b'{"rss_feeds": []}'
+    headers, bodies = _call(CompressionMiddleware(_app("application/json", [small]), brotli=False), path="/api/rss/match")
+    assert b"content-encoding" not in headers and headers[b"content-length"] == str(len(small)).encode()
+    assert bodies == [small]
+
+    large = ('{"articles": [' + ",".join(['{"title": "Giá vàng tăng mạnh"}'] * 500) + "]}").encode()
+    headers, bodies = _call(CompressionMiddleware(_app("application/json", [large]), brotli=False), path="/api/rss/fetch")
+    assert headers[b"content-encoding"] == b"gzip" and b"content-length" not in headers
+    assert gzip.decompress(b"".join(bodies)) == large
+    assert len(b"".join(bodies)) < len(large) // 10
+
+
+def test_route_overrides_and_passthrough():
+    routes = parse_route_modes("/api/jobs=off, /api=buffer,/bad=zip,junk")
+    assert routes == {"/api/jobs": MODE_OFF, "/api": MODE_BUFFER}
+
+    middleware = CompressionMiddleware(_app("application/x-ndjson", EVENTS), routes=routes, brotli=False)
+    headers, bodies = _call(middleware, path="/api/jobs/1/events")
+    assert b"content-encoding" not in headers and bodies == EVENTS
+
+    # Buffered stream: one compressed body at the end only
+    headers, bodies = _call(middleware, path="/api/articles/summarize_stream")
+    assert headers[b"content-encoding"] == b"gzip"
+    assert gzip.decompress(b"".join(bodies)) == b"".join(EVENTS)
+
+    # Client without gzip / already-encoded / binary responses are untouched
+    assert _call(middleware, path="/api/x", accept="identity")[1] == EVENTS
+    encoded = CompressionMiddleware(_app("application/json", [b"x" * 4096], [(b"content-encoding", b"br")]), brotli=False)
+    assert _call(encoded, path="/api/x")[0][b"content-encoding"] == b"br"
+    image = CompressionMiddleware(_app("image/png", [b"x" * 4096]), brotli=False)
+    assert b"content-encoding" not in _call(image, path="/img")[0]
+
+
+@pytest.mark.parametrize("header, brotli, expected", [
+    ("gzip, deflate, br", True, "br"),
+    ("gzip, deflate, br", False, "gzip"),
+    ("br;q=0, gzip;q=0.5", True, "gzip"),
+    ("gzip;q=0", False, None),
+    ("*", False, "gzip"),
+    ("", False, None),
+])
+def test_negotiate_encoding(header, brotli, expected):
+    assert negotiate_encoding(header, brotli=brotli) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
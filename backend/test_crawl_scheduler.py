@@ -0,0 +1,121 @@
+"""
+Unit tests for services.crawl_scheduler.CrawlScheduler.
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_crawl_scheduler.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+
+from services.crawl_scheduler import CrawlScheduler, host_key, parse_host_limits
+
+
+def test_host_key_strips_www_and_path():
+    assert host_key("https://www.sggp.org.vn/rss/xahoi-199.rss") == "sggp.org.vn"
+    assert host_key("https://DANTRI.com.vn/rss/phap-luat.rss") == "dantri.com.vn"
+
+
+def test_parse_host_limits():
+    assert parse_host_limits("vov.vn=8, www.dantri.com.vn=2,bad,x=y") == {
+        "vov.vn": 8,
+        "dantri.com.vn": 2,
+    }
+
+
+def test_per_host_and_global_caps_are_respected():
+    scheduler = CrawlScheduler(max_in_flight=3, per_host=2)
+    peak = {"global": 0, "a": 0}
+
+    async def job(url: str):
+        async with scheduler.slot(url, owner="r1") as host:
+            peak["global"] = max(peak["global"], scheduler.in_flight)
+            if host == "a.vn":
+                peak["a"] = max(peak["a"], scheduler.host_in_flight("a.vn"))
+            await asyncio.sleep(0.01)
+
+    async def main():
+        urls = [f"https://a.vn/{i}" for i in range(6)] + [f"https://b.vn/{i}" for i in range(6)]
+        await asyncio.gather(*[job(u) for u in urls])
+
+    asyncio.run(main())
+    assert peak["global"] == 3
+    assert peak["a"] == 2
+    assert scheduler.in_flight == 0
+
+
+def test_fair_round_robin_between_owners():
+    scheduler = CrawlScheduler(max_in_flight=1, per_host=1)
+    order = []
+
+    async def job(owner: str, i: int):
+        async with scheduler.slot(f"https://a.vn/{owner}/{i}", owner=owner):
+            order.append(owner)
+            await asyncio.sleep(0)
+
+    async def main():
+        # Hold the only slot while owner "big" queues 4 requests, then "small" queues 2.
+        async with scheduler.slot("https://a.vn/blocker", owner="blocker"):
+            tasks = [asyncio.create_task(job("big", i)) for i in range(4)]
+            await asyncio.sleep(0)
+            tasks += [asyncio.create_task(job("small", i)) for i in range(2)]
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    # "small" must not wait for every "big" request to finish.
+    assert order == ["big", "small", "big", "small", "big", "big"]
+
+
+def test_cancelled_waiter_does_not_leak_slot():
+    scheduler = CrawlScheduler(max_in_flight=1, per_host=1)
+
+    async def main():
+        async with scheduler.slot("https://a.vn/1", owner="r1"):
+            waiter = asyncio.create_task(
+                scheduler.slot("https://a.vn/2", owner="r2").__aenter__()
+            )
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+        async with scheduler.slot("https://a.vn/3", owner="r1"):
+            assert scheduler.in_flight == 1
+
+    asyncio.run(main())
+    assert scheduler.in_flight == 0
+
+
+def test_low_priority_is_capped_and_yields_to_normal():
+    scheduler = CrawlScheduler(max_in_flight=2, per_host=4, low_max_in_flight=2, low_per_host=1)
+    order = []
+    peak_low_a = 0
+
+    async def job(url: str, low: bool, tag: str):
+        nonlocal peak_low_a
+        async with scheduler.slot(url, owner="r1", low_priority=low):
+            order.append(tag)
+            peak_low_a = max(peak_low_a, scheduler._host_low_in_flight.get("a.vn", 0))
+            await asyncio.sleep(0.01)
+
+    async def main():
+        # Both slots busy: queued low-priority work must wait for the normal request.
+        async with scheduler.slot("https://b.vn/x", owner="r0"), scheduler.slot("https://b.vn/y", owner="r0"):
+            tasks = [asyncio.create_task(job(f"https://a.vn/{i}", True, "low")) for i in range(3)]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.create_task(job("https://c.vn/1", False, "normal")))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert order[0] == "normal"
+    assert peak_low_a == 1
+    assert scheduler.in_flight == 0 and scheduler.low_in_flight == 0
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+"""
+Unit tests for services.date_parsing (fast-path pubDate parsing).
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_date_parsing.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from datetime import timedelta, timezone
+
+import pytest
+from dateutil import parser as date_parser
+
+from services.date_parsing import FeedDateParser, _normalize_gmt_offset
+
+# Formats seen in the feeds we crawl (RFC 2822 variants, ISO 8601, rss2json, VOV meta)
+SAMPLES = [
+    "Mon, 16 Mar 2026 23:00:00 +0700",
+    "Mon, 16 Mar 2026 23:00:00 GMT+7",
+    "Mon, 16 Mar 2026 16:00:00 GMT",
+    "16 Mar 2026 07:05:00 +0700",
+    "Mon,16 Mar 2026 07:05:00 +0700",
+    "Mon, 16 Mar 2026 07:05 +0700",
+    "2026-03-16T07:05:00+07:00",
+    "2026-03-16T00:05:00Z",
+    "2026-03-16T07:05:00.123+07:00",
+    "2026-03-16 00:05:00",
+    "2026-03-16",
+    "16/03/2026 07:05",
+    "March 16, 2026 7:05 AM",
+]
+
+
+def _legacy(value: str):
+    return date_parser.parse(_normalize_gmt_offset(value))
+
+
+@pytest.mark.parametrize("value", SAMPLES)
+def test_fast_path_matches_dateutil(value):
+    assert FeedDateParser().parse(value, feed_key="https://x.vn/rss") == _legacy(value)
+
+
+def test_gmt_plus_offset_means_east_of_utc():
+    dt = FeedDateParser().parse("Mon, 16 Mar 2026 23:00:00 GMT+7")
+    assert dt.utcoffset() == timedelta(hours=7)
+    assert dt.astimezone(timezone.utc).hour == 16
+
+
+def test_minus_zero_offset_is_utc():
+    # RFC 2822 "-0000" = UTC with unknown local zone; dateutil maps it to the
+    # server's local zone, the fast path returns naive (treated as UTC by callers).
+    dt = FeedDateParser().parse("Mon, 16 Mar 2026 16:00:00 -0000")
+    assert dt.tzinfo is None and dt.hour == 16
+
+
+def test_learns_strategy_per_feed_and_memoizes():
+    parser = FeedDateParser()
+    parser.parse("2026-03-16T07:05:00+07:00", feed_key="https://a.vn/rss")
+    parser.parse("Mon, 16 Mar 2026 23:00:00 +0700", feed_key="https://b.vn/rss")
+    assert parser.learned_strategy("https://a.vn/rss") == "iso"
+    assert parser.learned_strategy("https://b.vn/rss") == "rfc2822"
+
+    parser.parse("2026-03-16T07:05:00+07:00", feed_key="https://a.vn/rss")
+    assert parser.cache_info().hits == 1
+
+
+def test_unparseable_returns_none():
+    parser = FeedDateParser()
+    assert parser.parse("") is None
+    assert parser.parse("không rõ ngày") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
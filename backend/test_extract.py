@@ -94,5 +94,41 @@ def test_extract_meta_fallback():
     )
 
 
+# (fixture, article URL, sentence from the body, noise that must not leak in)
+SITE_CORPUS = [
+    ("laodong_article.html", "https://laodong.vn/kinh-doanh/thu-ngan-sach.ldo", "98,5% kế hoạch", "Trang chủ"),
+    ("dantri_article.html", "https://dantri.com.vn/kinh-doanh/goi-ho-tro.htm", "Nghị quyết số 45", "dantriAnalytics"),
+    ("hanoimoi_article.html", "https://hanoimoi.vn/phuong-hai-ba-trung-94-lo-duc.html", "94 phố Lò Đúc", "mbdinpage1"),
+    ("vnexpress_article.html", "https://vnexpress.net/cpi-thang-3-tang.html", "CPI tăng 3,1%", "Giá vàng hôm nay"),
+    ("tuoitre_article.html", "https://tuoitre.vn/phan-luong-nut-giao-an-phu.htm", "Mai Chí Thọ", "Tin liên quan số"),
+    ("vov_article.html", "https://vov.vn/the-gioi/hop-bao.vov", "bảo hộ công dân", "googletag"),
+]
+
+
+@pytest.mark.parametrize("fixture,url,expected,noise", SITE_CORPUS)
+def test_site_extractor_corpus(fixture, url, expected, noise):
+    """Per-site rules pick the body container (plus sapo) and drop page noise."""
+    from services.article_extractors import article_extractors
+
+    html = _load_fixture(fixture)
+    site_text = article_extractors.extract(url, html)
+    assert expected in site_text
+    assert noise not in site_text
+    assert Summarizer()._extract_content(html, limit=15000, url=url) == site_text
+
+
+def test_site_extractor_unknown_host_and_layout_miss():
+    """Unknown hosts / missing containers fall back to the generic chain."""
+    from services.article_extractors import article_extractors
+
+    html = _load_fixture("dantri_article.html")
+    assert article_extractors.for_url("https://example.com/a") is None
+    assert article_extractors.for_url("https://m.dantri.com.vn/a").name == "dantri"
+    assert article_extractors.extract("https://example.com/a", html) == ""
+    assert article_extractors.extract("https://vnexpress.net/a", html) == ""
+    # Generic chain still works for the same page
+    assert len(Summarizer()._extract_content(html, url="https://vnexpress.net/a")) >= 200
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
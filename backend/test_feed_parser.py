@@ -0,0 +1,131 @@
+"""
+Unit tests for services.feed_parser (lxml iterparse engine vs feedparser).
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_feed_parser.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+import html
+
+import feedparser
+import pytest
+
+from services.feed_parser import (
+    ENGINE_FEEDPARSER,
+    ENGINE_LXML,
+    EXECUTOR_OFF,
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    FeedParser,
+    ParseExecutor,
+)
+from services.rss_fetcher import RSSFetcher, _extract_hanoimoi_extras
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+lxml_parser = FeedParser(ENGINE_LXML)
+fetcher = RSSFetcher()
+
+
+def _load_fixture(filename: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, filename), encoding="utf-8") as f:
+        return f.read()
+
+
+def _normalized(entry) -> tuple:
+    """The fields _process_entry actually reads."""
+    return (
+        html.unescape(entry.get("title", "")),
+        entry.get("link", ""),
+        entry.get("published", ""),
+        fetcher._clean_description(entry.get("description", "") or entry.get("summary", "")),
+        fetcher._extract_thumbnail(entry),
+    )
+
+
+@pytest.mark.parametrize("fixture", ["dantri_feed.xml", "atom_feed.xml"])
+def test_lxml_engine_matches_feedparser(fixture):
+    content = _load_fixture(fixture)
+    fast = lxml_parser.parse(content)
+    slow = feedparser.parse(content)
+    assert fast.engine == ENGINE_LXML
+    assert len(fast.entries) == len(slow.entries) > 0
+    assert [_normalized(e) for e in fast.entries] == [_normalized(e) for e in slow.entries]
+
+
+def test_lxml_engine_unwraps_double_escaped_cdata():
+    content = _load_fixture("hanoimoi_feed.xml")
+    extras = _extract_hanoimoi_extras(content)
+    entries = lxml_parser.parse(content).entries
+    assert len(entries) == 48
+    for entry in entries:
+        assert fetcher._extract_thumbnail(entry) == extras[entry.link]["thumbnail"]
+        assert fetcher._clean_description(entry.summary) == extras[entry.link]["description"]
+
+
+def test_media_group_and_enclosure():
+    content = (
+        '<rss xmlns:media="http://search.yahoo.com/mrss/"><channel><item>'
+        "<title>A</title><link>https://x.vn/a</link>"
+        '<enclosure url="https://x.vn/e.jpg" type="image/jpeg" length="0"/>'
+        '<media:group><media:thumbnail url="https://x.vn/t.jpg"/></media:group>'
+        "</item></channel></rss>"
+    )
+    entry = lxml_parser.parse(content).entries[0]
+    assert entry.media_thumbnail[0]["url"] == "https://x.vn/t.jpg"
+    assert entry.enclosures[0]["href"] == "https://x.vn/e.jpg"
+    assert fetcher._extract_thumbnail(entry) == "https://x.vn/t.jpg"
+
+
+def test_bytes_input_respects_encoding_declaration():
+    content = '<?xml version="1.0" encoding="windows-1252"?><rss><channel><item><title>Cà phê Hà Nam</title></item></channel></rss>'
+    feed = lxml_parser.parse(content.encode("windows-1252"))
+    assert feed.entries[0].title == "Cà phê Hà Nam"
+
+
+def test_malformed_xml_falls_back_to_feedparser():
+    # Undefined HTML entity + undeclared media: prefix (rss2json output)
+    content = (
+        "<rss><channel><item><title>A&nbsp;B</title><link>https://x.vn/a</link>"
+        '<media:content url="https://x.vn/i.jpg" medium="image"/></item></channel></rss>'
+    )
+    feed = lxml_parser.parse(content)
+    assert feed.engine == ENGINE_FEEDPARSER
+    assert feed.entries[0].link == "https://x.vn/a"
+
+
+
+@pytest.mark.parametrize("mode", [EXECUTOR_THREAD, EXECUTOR_PROCESS])
+def test_parse_async_offloads_large_bodies(mode):
+    content = _load_fixture("dantri_feed.xml")
+    executor = ParseExecutor(mode, workers=1, min_bytes=1024)
+    parser = FeedParser(ENGINE_LXML, executor=executor)
+    try:
+        feed = asyncio.run(parser.parse_async(content))
+    finally:
+        executor.shutdown()
+    assert executor.offloaded == 1 and executor.inline == 0
+    assert feed.engine == ENGINE_LXML
+    assert [_normalized(e) for e in feed.entries] == [_normalized(e) for e in lxml_parser.parse(content).entries]
+
+
+def test_parse_async_keeps_small_bodies_inline():
+    small = "<rss><channel><item><title>A</title></item></channel></rss>"
+    executor = ParseExecutor(EXECUTOR_THREAD, workers=1, min_bytes=1024)
+    feed = asyncio.run(FeedParser(ENGINE_LXML, executor=executor).parse_async(small))
+    assert feed.entries[0].title == "A"
+    assert (executor.offloaded, executor.inline) == (0, 1)
+    assert executor._pool is None
+
+    off = ParseExecutor(EXECUTOR_OFF, min_bytes=0)
+    asyncio.run(FeedParser(ENGINE_LXML, executor=off).parse_async(_load_fixture("dantri_feed.xml")))
+    assert off.offloaded == 0 and off._pool is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,190 @@
+"""
+Tests for asynchronous summarization jobs (services/job_store.py,
+services/summarize_jobs.py, routes/jobs.py).
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_jobs.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+import json
+import socket
+import sqlite3
+import subprocess
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import routes.jobs
+from main import app
+from services.job_store import JOB_DONE, JOB_FAILED, JOB_QUEUED, JobStore
+from services.summarize_jobs import SummarizeJobManager, process_owner, summarize_jobs
+from services.summarizer import Summarizer
+
+URLS = ["https://a.vn/kinh-te/bai-1.htm", "https://b.vn/the-gioi/bai-2.htm", "https://c.vn/xa-hoi/bai-3.htm"]
+
+
+class FakeSummarizer(Summarizer):
+    def __init__(self):
+        super().__init__()
+        self.keys = []
+        self.active = self.peak = 0
+
+    async def summarize_article(self, url, metadata, api_key=None, timeout=120):
+        self.keys.append(api_key)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01 * (len(url) % 3))
+        self.active -= 1
+        return {"category": metadata["category"], "text": f"### [{url}]({url})\n- tóm tắt"}
+
+
+def _manager(store):
+    return SummarizeJobManager(store=store, summarizer_=FakeSummarizer(), workers=2, poll_interval=0.05)
+
+
+def _run_to_end(manager, urls, api_key="secret-key"):
+    async def run():
+        job = await manager.submit(urls, {}, api_key)
+        lines = [line async for line in manager.tail(job["id"])]
+        return job, lines
+    return asyncio.run(run())
+
+
+def test_job_runs_and_persists_partial_results_without_key():
+    store = JobStore(":memory:")
+    manager = _manager(store)
+    job, lines = _run_to_end(manager, URLS)
+
+    events = [json.loads(line) for line in lines]
+    assert [e["seq"] for e in events] == list(range(len(events)))
+    assert sorted(e["url"] for e in events if e["type"] == "article") == sorted(URLS)
+    assert events[-1]["type"] == "complete" and "KINH TẾ" in events[-1]["summary"]
+
+    stored = store.get(job["id"])
+    assert stored["status"] == JOB_DONE and stored["completed"] == len(URLS)
+    assert stored["result"] == events[-1]["summary"]
+    # The key reached the summarizer but was never persisted
+    assert manager.summarizer.keys == ["secret-key"] * len(URLS)
+    assert "secret-key" not in json.dumps(stored["payload"]) + "".join(lines)
+
+
+def test_job_articles_run_at_most_batch_size_at_once():
+    store = JobStore(":memory:")
+    manager = _manager(store)
+    manager.summarizer.batch_size = 2
+    urls = [f"https://a.vn/kinh-te/bai-{i}.htm" for i in range(9)]
+    job, lines = _run_to_end(manager, urls)
+
+    assert manager.summarizer.peak == 2
+    assert store.get(job["id"])["completed"] == len(urls)
+    assert sum(1 for line in lines if json.loads(line)["type"] == "article") == len(urls)
+
+
+def test_stream_resumes_from_offset():
+    store = JobStore(":memory:")
+    manager = _manager(store)
+    job, lines = _run_to_end(manager, URLS)
+
+    async def resume():
+        return [line async for line in manager.tail(job["id"], offset=3)]
+
+    assert asyncio.run(resume()) == lines[3:]
+
+
+def test_empty_job_fails_and_interrupted_jobs_are_failed():
+    store = JobStore(":memory:")
+    manager = _manager(store)
+    job, lines = _run_to_end(manager, [])
+    assert store.get(job["id"])["status"] == JOB_FAILED
+    assert json.loads(lines[-1])["type"] == "error"
+
+    orphan = store.create("summarize", {"urls": URLS, "articles_metadata": {}}, total=3)
+    assert asyncio.run(manager.fail_interrupted()) == 1
+    assert store.get(orphan["id"])["status"] == JOB_FAILED
+
+
+def test_fail_interrupted_spares_jobs_of_live_workers():
+    store = JobStore(":memory:")
+    manager = _manager(store)
+    host = socket.gethostname()
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+
+    def job(owner):
+        return store.create("summarize", {"urls": URLS, "articles_metadata": {}}, total=3, owner=owner)["id"]
+
+    mine, gone = job(process_owner()), job(f"{host}:{dead.pid}")
+    live, remote = job(f"{host}:{os.getppid()}"), job("other-host:1")
+
+    assert asyncio.run(manager.fail_interrupted()) == 2
+    assert [store.get(j)["status"] for j in (mine, gone)] == [JOB_FAILED] * 2
+    assert [store.get(j)["status"] for j in (live, remote)] == [JOB_QUEUED] * 2
+
+
+def test_store_io_runs_off_the_event_loop_and_migrates_owner(tmp_path):
+    threads = set()
+
+    class SpyStore(JobStore):
+        def append_event(self, job_id, event):
+            threads.add(threading.get_ident())
+            return super().append_event(job_id, event)
+
+    _run_to_end(_manager(SpyStore(":memory:")), URLS)
+    assert threads and threading.get_ident() not in threads
+
+    # A jobs table from before the owner column: its jobs have no known owner
+    path = str(tmp_path / "old.sqlite3")
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE jobs (id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, total INTEGER NOT NULL DEFAULT 0, "
+            "completed INTEGER NOT NULL DEFAULT 0, payload TEXT NOT NULL, result TEXT, error TEXT, created_at REAL NOT NULL, "
+            "updated_at REAL NOT NULL)"
+        )
+        conn.execute("INSERT INTO jobs (id, kind, status, payload, created_at, updated_at) VALUES ('old', 'summarize', 'running', '{}', 0, 0)")
+    assert JobStore(path).unfinished_owners() == {"old": ""}
+
+
+def test_purge_keeps_running_jobs():
+    store = JobStore(":memory:")
+    manager = _manager(store)
+    done, _ = _run_to_end(manager, URLS[:1])
+    running = store.create("summarize", {"urls": URLS, "articles_metadata": {}}, total=3)
+    time.sleep(0.01)
+    assert store.purge_older_than(0) == 1
+    assert store.get(done["id"]) is None and store.get(running["id"]) is not None
+
+
+def test_job_routes(monkeypatch):
+    store = JobStore(":memory:")
+    monkeypatch.setattr(routes.jobs, "job_store", store)
+    monkeypatch.setattr(summarize_jobs, "store", store)
+    monkeypatch.setattr(summarize_jobs, "summarizer", FakeSummarizer())
+
+    with TestClient(app) as client:
+        created = client.post("/api/jobs/summarize", json={"urls": URLS}, headers={"X-API-Key": "k"})
+        assert created.status_code == 202
+        job_id = created.json()["job_id"]
+
+        with client.stream("GET", f"/api/jobs/{job_id}/stream?offset=0") as response:
+            assert "application/x-ndjson" in response.headers["content-type"]
+            events = [json.loads(line) for line in response.iter_lines() if line.strip()]
+        assert events[-1]["type"] == "complete"
+
+        status = client.get(f"/api/jobs/{job_id}").json()
+        assert status["status"] == JOB_DONE
+        assert status["completed"] == status["total"] == len(URLS)
+        assert status["events"] == len(events)
+        assert status["result"] == events[-1]["summary"]
+
+        assert client.get("/api/jobs/does-not-exist").status_code == 404
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
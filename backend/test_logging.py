@@ -175,3 +175,54 @@ def test_redact_secrets_removes_api_key_tokens():
     assert "AIza-test-456" not in result, (
         f"redact_secrets did not remove key= param value from output: {result!r}"
     )
+
+
+# ---------------------------------------------------------------------------
+# 5. RequestLoggingMiddleware (pure ASGI) leaves body messages untouched
+# ---------------------------------------------------------------------------
+
+def test_request_logging_middleware_passes_stream_through():
+    import asyncio
+    from services.request_context import get_request_id
+    from services.request_logging import RequestLoggingMiddleware
+
+    chunks = [
+        {"type": "http.response.body", "body": b"data: 1\n\n", "more_body": True},
+        {"type": "http.response.body", "body": b"data: 2\n\n", "more_body": False},
+    ]
+    seen_ids = []
+
+    async def stream_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"text/event-stream"), (b"x-request-id", b"app")]})
+        for chunk in chunks:
+            seen_ids.append(get_request_id())
+            await send(chunk)
+
+    async def failing_app(scope, receive, send):
+        raise RuntimeError("boom")
+
+    async def run(app):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        scope = {"type": "http", "method": "GET", "path": "/stream", "client": ("1.2.3.4", 1),
+                 "headers": [(b"x-request-id", b"rid-123")]}
+        await RequestLoggingMiddleware(app)(scope, receive, send)
+        return sent
+
+    sent = asyncio.run(run(stream_app))
+    assert sent[0]["headers"][-1] == (b"x-request-id", b"rid-123")
+    assert [k for k, _ in sent[0]["headers"]].count(b"x-request-id") == 1
+    # Same message objects, no re-wrapping; request id visible while streaming, reset after
+    assert sent[1] is chunks[0] and sent[2] is chunks[1]
+    assert seen_ids == ["rid-123", "rid-123"] and get_request_id() is None
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(run(failing_app))
+    assert get_request_id() is None
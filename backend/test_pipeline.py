@@ -0,0 +1,208 @@
+"""
+Unit tests for services.pipeline (per-category fetch → dedup → verification).
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_pipeline.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+
+import pytest
+
+from services.pipeline import CATEGORY_DONE, FETCH_DONE, SOURCE_DONE, NewsPipeline
+from services.rss_fetcher import RSSFetcher
+
+FAST_ECONOMY = "https://fast.vn/rss/kinh-te.rss"
+SLOW_ECONOMY = "https://slow.vn/rss/kinh-te.rss"
+SLOW_WORLD = "https://slow.vn/rss/the-gioi.rss"
+
+
+class FakeFetcher(RSSFetcher):
+    def __init__(self, delays):
+        self.delays = delays
+
+    async def fetch_and_filter_iter(self, rss_urls, target_date, time_range):
+        if target_date == "bad":
+            raise ValueError("Invalid date format: bad")
+
+        async def one(url):
+            await asyncio.sleep(self.delays[url])
+            category = self._extract_category_from_url(url)
+            return url, [{"url": url + "#1", "title": url, "category": category}]
+
+        for next_done in asyncio.as_completed([one(u) for u in rss_urls]):
+            yield await next_done
+
+
+class FakeDeduper:
+    def __init__(self, log):
+        self.log = log
+
+    async def cluster_category(self, category, articles, api_key=None):
+        self.log.append(("dedup", category, len(articles)))
+        for a in articles:
+            a["group_id"] = category
+        return articles
+
+    async def merge_late(self, category, masters, late, api_key=None):
+        self.log.append(("merge", category, len(masters), len(late)))
+        for a in late:
+            a["group_id"] = masters[0]["group_id"]
+            a["is_master"] = False
+        return late
+
+
+class FakeVerifier:
+    def __init__(self, log):
+        self.log = log
+
+    async def ensure_cache_fresh(self):
+        self.log.append(("prewarm",))
+
+    async def verify_category(self, category, articles, api_key):
+        self.log.append(("verify", category, len(articles)))
+        for a in articles:
+            a["official_source_link"] = None
+        return articles
+
+
+def _pipeline(delays, log):
+    return NewsPipeline(FakeFetcher(delays), FakeDeduper(log), FakeVerifier(log))
+
+
+def test_category_chain_starts_before_slowest_source():
+    log = []
+    pipeline = _pipeline({FAST_ECONOMY: 0.01, SLOW_ECONOMY: 0.05, SLOW_WORLD: 0.3}, log)
+
+    async def main():
+        kinds = []
+        async for event in pipeline.run([FAST_ECONOMY, SLOW_ECONOMY, SLOW_WORLD], "16/03/2026", "6h00 đến 8h00", "key"):
+            kinds.append((event.kind, event.category or event.source))
+        return kinds
+
+    kinds = asyncio.run(main())
+    # KINH TẾ is verified while the world feed is still loading
+    assert kinds.index((CATEGORY_DONE, "KINH TẾ")) < kinds.index((SOURCE_DONE, SLOW_WORLD))
+    assert kinds[-1] == (CATEGORY_DONE, "THẾ GIỚI")
+    assert ("dedup", "KINH TẾ", 2) in log and ("verify", "THẾ GIỚI", 1) in log
+    assert log[0] == ("prewarm",)
+    assert sum(1 for k, _ in kinds if k == FETCH_DONE) == 1
+
+
+def test_collect_orders_by_requested_sources():
+    log = []
+    pipeline = _pipeline({SLOW_WORLD: 0.01, SLOW_ECONOMY: 0.05, FAST_ECONOMY: 0.02}, log)
+    articles = asyncio.run(pipeline.collect([SLOW_ECONOMY, SLOW_WORLD, FAST_ECONOMY], "16/03/2026", "6h00 đến 8h00", None, verify=False))
+    assert [a["url"] for a in articles] == [SLOW_ECONOMY + "#1", FAST_ECONOMY + "#1", SLOW_WORLD + "#1"]
+    assert all(a["group_id"] for a in articles)
+    assert not any(entry[0] in ("verify", "prewarm") for entry in log)
+
+
+class LateFetcher(FakeFetcher):
+    """The slow world feed also carries an economy story (same event as the fast feed's)."""
+
+    async def fetch_and_filter_iter(self, rss_urls, target_date, time_range):
+        async for url, articles in super().fetch_and_filter_iter(rss_urls, target_date, time_range):
+            if url == SLOW_WORLD:
+                articles = articles + [{"url": url + "#late", "title": FAST_ECONOMY, "category": "KINH TẾ"}]
+            yield url, articles
+
+
+def test_late_articles_merge_into_launched_category():
+    log = []
+    pipeline = NewsPipeline(LateFetcher({FAST_ECONOMY: 0.01, SLOW_WORLD: 0.1}), FakeDeduper(log), FakeVerifier(log))
+    articles = asyncio.run(pipeline.collect([FAST_ECONOMY, SLOW_WORLD], "16/03/2026", "6h00 đến 8h00", "key"))
+
+    # Deduped against KINH TẾ's masters, not as an independent batch
+    assert log.index(("dedup", "KINH TẾ", 1)) < log.index(("merge", "KINH TẾ", 1, 1))
+    assert sum(1 for e in log if e[0] == "dedup") == 2
+    late = next(a for a in articles if a["url"].endswith("#late"))
+    assert late["is_master"] is False and late["group_id"] == "KINH TẾ"
+    assert [a["url"] for a in articles][:2] == [FAST_ECONOMY + "#1", SLOW_WORLD + "#late"]
+
+
+def test_dedup_merge_late_against_masters(monkeypatch):
+    from services.dedup_service import DedupService
+
+    async def cluster(articles, api_key=None):
+        # "Same event" = same title; group id collides with an existing master's on purpose
+        for i, a in enumerate(articles):
+            a["group_id"] = {"Vàng tăng": "gia_vang", "Lãi suất": "lai_suat", "Khác": "g1"}[a["title"]]
+            a["is_master"] = i < 2 or a["title"] != "Vàng tăng"
+        return articles
+
+    service = DedupService()
+    monkeypatch.setattr(service, "_ai_cluster_articles", cluster)
+    masters = [
+        {"url": "m0", "title": "Vàng tăng", "group_id": "vang", "is_master": True, "duplicate_count": 1, "event_summary": "Giá vàng"},
+        {"url": "m1", "title": "Lãi suất", "group_id": "g1", "is_master": True, "duplicate_count": 0},
+    ]
+    late = [{"url": "l0", "title": "Khác"}, {"url": "l1", "title": "Vàng tăng"}]
+    merged = asyncio.run(service.merge_late("KINH TẾ", masters, late, "key"))
+
+    assert merged[1] == {**late[1], "group_id": "vang", "is_master": False, "duplicate_count": 0, "event_summary": "Giá vàng"}
+    assert masters[0]["duplicate_count"] == 2 and masters[0]["group_id"] == "vang"
+    assert merged[0]["group_id"] == "g1_late" and merged[0]["is_master"] is True
+    assert masters[1] == {"url": "m1", "title": "Lãi suất", "group_id": "g1", "is_master": True, "duplicate_count": 0}
+
+
+def _late_only_service(monkeypatch, seen=None):
+    """Clusters every late article into its "slug" (clashing on purpose), probes into their own group."""
+    from services.dedup_service import DedupService
+
+    async def cluster(articles, api_key=None):
+        if seen is not None:
+            seen.append(len(articles))
+        for a in articles:
+            a["group_id"] = a.get("slug") or a["url"]
+            a["is_master"] = True
+        return articles
+
+    service = DedupService()
+    monkeypatch.setattr(service, "_ai_cluster_articles", cluster)
+    return service
+
+
+def test_merge_late_ids_stay_unique_across_batches(monkeypatch):
+    service = _late_only_service(monkeypatch)
+    masters = [{"url": "m0", "title": "A", "group_id": "g1", "is_master": True, "duplicate_count": 0}]
+
+    first = asyncio.run(service.merge_late("KINH TẾ", masters, [{"url": "l0", "title": "B", "slug": "g1"}], "key"))
+    assert first[0]["group_id"] == "g1_late"
+
+    # Second late batch: the first batch's masters are now among the category's masters
+    second = asyncio.run(service.merge_late("KINH TẾ", masters + first, [
+        {"url": "l1", "title": "C", "slug": "g1"},
+        {"url": "l2", "title": "C'", "slug": "g1"},
+        {"url": "l3", "title": "D", "slug": "g1_late"},
+    ], "key"))
+    ids = [a["group_id"] for a in second]
+    assert ids[0] == ids[1] == "g1_late2"
+    assert ids[2] not in {"g1", "g1_late", "g1_late2"}
+
+
+def test_merge_late_caps_only_the_late_slice(monkeypatch, capsys):
+    seen = []
+    service = _late_only_service(monkeypatch, seen)
+    monkeypatch.setattr(service, "MAX_ARTICLES_PER_CATEGORY", 2)
+    masters = [{"url": f"m{i}", "title": f"M{i}", "group_id": f"m{i}", "is_master": True} for i in range(3)]
+    late = [{"url": f"l{i}", "title": f"L{i}"} for i in range(3)]
+
+    merged = asyncio.run(service.merge_late("KINH TẾ", masters, late, "key"))
+    # Every master is compared; the late overflow is dropped with a log line
+    assert seen == [5] and [a["url"] for a in merged] == ["l0", "l1"]
+    assert "dropping 1" in capsys.readouterr().out
+
+
+def test_invalid_date_propagates():
+    pipeline = _pipeline({FAST_ECONOMY: 0}, [])
+    with pytest.raises(ValueError):
+        asyncio.run(pipeline.collect([FAST_ECONOMY], "bad", "6h00 đến 8h00", None))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
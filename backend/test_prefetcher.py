@@ -0,0 +1,153 @@
+"""
+Unit tests for services.article_prefetcher / services.article_cache.
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_prefetcher.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+
+import pytest
+
+from services.article_cache import ArticleCache
+from services.article_prefetcher import ArticlePrefetcher
+from services.pipeline import NewsPipeline
+from test_pipeline import FAST_ECONOMY, SLOW_ECONOMY, SLOW_WORLD, FakeFetcher, FakeVerifier
+
+HTML = "<html><body><article><p>" + "Nội dung bài báo đầy đủ. " * 20 + "</p></article></body></html>"
+
+
+class FakeLoader:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.fetched = []
+
+    async def _fetch_article_html(self, url, timeout=25, low_priority=False):
+        assert low_priority
+        await asyncio.sleep(self.delay)
+        self.fetched.append(url)
+        return HTML
+
+    def _extract_content(self, html, limit=8000, url=""):
+        return "Nội dung bài báo đầy đủ."
+
+
+def test_cache_ttl_and_lru():
+    cache = ArticleCache(ttl_sec=60, max_entries=2)
+    cache.set("https://a.vn/1/", "one")
+    cache.set("https://a.vn/2", "two")
+    assert cache.get("https://a.vn/1") == "one"  # trailing slash ignored, refreshes LRU
+    cache.set("https://a.vn/3", "three")
+    assert "https://a.vn/2" not in cache and len(cache) == 2
+
+    expired = ArticleCache(ttl_sec=0, max_entries=2)
+    expired.set("https://a.vn/1", "one")
+    assert expired.get("https://a.vn/1") is None
+
+
+def test_prefetch_fills_cache_within_limit():
+    async def run():
+        loader, cache = FakeLoader(), ArticleCache()
+        prefetcher = ArticlePrefetcher(loader, cache)
+        started = prefetcher.prefetch(["https://a.vn/1", "https://a.vn/2", "https://a.vn/1", "https://a.vn/3"], limit=2)
+        while prefetcher.pending:
+            await asyncio.sleep(0.01)
+        return started, loader.fetched, cache
+
+    started, fetched, cache = asyncio.run(run())
+    assert started == 2 and fetched == ["https://a.vn/1", "https://a.vn/2"]
+    assert cache.get("https://a.vn/1") == "Nội dung bài báo đầy đủ."
+
+
+def test_cancel_stops_pending_prefetch():
+    async def run():
+        loader, cache = FakeLoader(delay=0.05), ArticleCache()
+        prefetcher = ArticlePrefetcher(loader, cache)
+        prefetcher.prefetch(["https://a.vn/1", "https://a.vn/2"], limit=10)
+        cancelled = prefetcher.cancel(["https://a.vn/2"])
+        await asyncio.sleep(0.1)
+        return cancelled, loader.fetched, prefetcher.pending
+
+    cancelled, fetched, pending = asyncio.run(run())
+    assert cancelled == 1 and fetched == ["https://a.vn/1"] and pending == 0
+
+
+class MasterDeduper:
+    """Keeps the first article of each category as master."""
+
+    async def cluster_category(self, category, articles, api_key=None):
+        for i, a in enumerate(articles):
+            a["is_master"] = i == 0
+        return articles
+
+
+class RecordingPrefetcher:
+    """Like ArticlePrefetcher: skips URLs already pending, cancel() counts the pending ones."""
+
+    def __init__(self):
+        self.started, self.cancelled = [], []
+        self._pending = set()
+
+    def prefetch(self, urls, limit):
+        urls = [u for u in dict.fromkeys(urls) if u not in self._pending][:limit]
+        self.started.extend(urls)
+        self._pending.update(urls)
+        return len(urls)
+
+    def cancel(self, urls):
+        urls = list(urls)
+        self.cancelled.extend(urls)
+        pending = [u for u in urls if u in self._pending]
+        self._pending.difference_update(pending)
+        return len(pending)
+
+
+def test_pipeline_prefetches_sources_and_cancels_duplicates():
+    prefetcher = RecordingPrefetcher()
+    pipeline = NewsPipeline(
+        FakeFetcher({FAST_ECONOMY: 0.0, SLOW_ECONOMY: 0.02, SLOW_WORLD: 0.01}),
+        MasterDeduper(),
+        FakeVerifier([]),
+        prefetcher=prefetcher,
+    )
+    asyncio.run(pipeline.collect([FAST_ECONOMY, SLOW_ECONOMY, SLOW_WORLD], "16/03/2026", "6h00 đến 8h00", "key"))
+
+    assert sorted(prefetcher.started) == sorted(u + "#1" for u in (FAST_ECONOMY, SLOW_ECONOMY, SLOW_WORLD))
+    assert prefetcher.cancelled == [SLOW_ECONOMY + "#1"]
+
+
+
+class TwoPerSourceFetcher(FakeFetcher):
+    async def fetch_and_filter_iter(self, rss_urls, target_date, time_range):
+        async for url, articles in super().fetch_and_filter_iter(rss_urls, target_date, time_range):
+            yield url, articles + [{**articles[0], "url": url + "#2"}]
+
+
+def test_pipeline_prefetch_budget_reaches_masters_of_later_sources(monkeypatch):
+    import services.pipeline as pipeline_module
+
+    monkeypatch.setattr(pipeline_module.settings, "ARTICLE_PREFETCH_MAX_PER_RUN", 2)
+    prefetcher = RecordingPrefetcher()
+    pipeline = NewsPipeline(
+        TwoPerSourceFetcher({FAST_ECONOMY: 0.0, SLOW_ECONOMY: 0.02, SLOW_WORLD: 0.1}),
+        MasterDeduper(),
+        FakeVerifier([]),
+        prefetcher=prefetcher,
+    )
+    # SLOW_ECONOMY is listed first, so its first article is the economy master
+    asyncio.run(pipeline.collect([SLOW_ECONOMY, FAST_ECONOMY, SLOW_WORLD], "16/03/2026", "6h00 đến 8h00", "key"))
+
+    # The fast source's articles spend the whole budget; once dedup marks them
+    # duplicates, their budget is refunded to the master and the world feed
+    assert prefetcher.started == [FAST_ECONOMY + "#1", FAST_ECONOMY + "#2", SLOW_ECONOMY + "#1", SLOW_WORLD + "#1"]
+    assert sorted(prefetcher.cancelled) == sorted(
+        [FAST_ECONOMY + "#1", FAST_ECONOMY + "#2", SLOW_ECONOMY + "#2", SLOW_WORLD + "#2"]
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+"""
+Unit tests for services.article_record.ArticleRecord (slotted article type
+used from RSSFetcher through dedup / verification to the response) and the
+services.fast_json serializers that encode it.
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_records.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import json
+
+import pytest
+
+from routes.news import Article
+from services import fast_json
+from services.article_record import ArticleRecord, json_default
+from services.response_cache import _sse
+
+
+def _record(**kwargs):
+    return ArticleRecord(
+        "https://x.vn/a", "Tiêu đề", "KINH TẾ", "07:00 16/03/2026", "DÂN TRÍ",
+        **kwargs,
+    )
+
+
+def test_record_is_slotted_and_interns_labels():
+    record = _record()
+    assert not hasattr(record, "__dict__")
+    other = ArticleRecord("u", "t", "".join(["KINH ", "TẾ"]), "", "".join(["DÂN ", "TRÍ"]))
+    assert other.category is record.category and other.source is record.source
+
+
+def test_mapping_semantics_match_the_old_dicts():
+    record = _record()
+    assert record["url"] == "https://x.vn/a"
+    assert "group_id" not in record and record.get("duplicate_count", 0) == 0
+    with pytest.raises(KeyError):
+        record["group_id"]
+
+    record["group_id"] = "vang"
+    record["is_master"] = False
+    record["_exact_duplicate_group"] = "tiêu đề"
+    record["official_source_link"] = None
+    assert "group_id" in record and "official_source_link" in record
+    assert record["_exact_duplicate_group"] == "tiêu đề"
+    assert list(record)[-4:] == ["group_id", "is_master", "official_source_link", "_exact_duplicate_group"]
+    with pytest.raises(KeyError):
+        record["extra"] = 1
+
+    del record["group_id"]
+    assert "group_id" not in record
+
+
+def test_description_is_cleaned_lazily():
+    record = _record(raw_description="<p>Giá vàng&nbsp;tăng   mạnh.....</p>")
+    assert record._description is None
+    assert record["description"] == "Giá vàng tăng mạnh…"
+    assert record._raw_description == ""
+
+    record["description"] = "từ trang"
+    assert record.description == "từ trang"
+
+
+def test_serializes_to_the_article_response_shape():
+    record = _record(thumbnail="https://x.vn/t.jpg", raw_description="<b>Mô tả</b>")
+    record["_is_exact_master"] = True
+    record["duplicate_count"] = 2
+
+    data = record.to_dict()
+    assert data == Article(**data).model_dump()
+    assert data["description"] == "Mô tả" and data["is_master"] is True and data["group_id"] == ""
+    assert "_is_exact_master" not in data
+
+    assert json.loads(json.dumps([record], default=json_default)) == [data]
+    event = json.loads(_sse({"step": "complete", "articles": [record]})[len("data: "):])
+    assert event["articles"] == [data]
+    assert ArticleRecord.from_mapping(data).to_dict() == data
+
+
+
+@pytest.mark.parametrize("serializer", ["json", "orjson"])
+def test_serializers_produce_the_same_events(serializer):
+    if serializer == "orjson" and not fast_json.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    dumps = fast_json.get_dumps(serializer)
+    record = _record(raw_description="Hà Nội <i>mưa</i>")
+    event = {"step": "complete", "articles": [record], "metrics": {"retries": 1}}
+    raw = dumps(event)
+    assert isinstance(raw, bytes) and "Hà Nội".encode() in raw
+    assert json.loads(raw) == json.loads(json.dumps(event, default=json_default))
+
+
+@pytest.mark.parametrize("serializer", ["json", "orjson"])
+def test_unknown_values_are_rejected_not_stringified(serializer):
+    if serializer == "orjson" and not fast_json.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    dumps = fast_json.get_dumps(serializer)
+    for value in ({1, 2}, ValueError("boom"), object()):
+        with pytest.raises(TypeError):
+            dumps({"step": "complete", "value": value})
+
+
+def test_orjson_response_renders_records():
+    response = fast_json.ORJSONResponse({"articles": [_record()]}, headers={"X-Cache": "HIT"})
+    assert response.headers["x-cache"] == "HIT"
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body)["articles"][0]["source"] == "DÂN TRÍ"
+    assert fast_json.ndjson_line({"type": "progress"}).endswith(b"}\n")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,192 @@
+"""
+Unit tests for services.response_cache (request-level result cache + singleflight).
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_response_cache.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from config import settings
+from services.response_cache import (
+    CACHE_HIT,
+    CACHE_JOIN,
+    CACHE_MISS,
+    VN_TZ,
+    FetchResultCache,
+    Flight,
+    fetch_cache_key,
+    fetch_cache_ttl,
+)
+
+URLS = ["https://a.vn/rss/kinh-te.rss", "https://b.vn/rss/the-gioi.rss"]
+
+
+def _key(urls=URLS, date="16/03/2026", time_range="6h00 đến 8h00", api_key="key-a"):
+    return fetch_cache_key(urls, date, time_range, "openai", api_key, True, True)
+
+
+def _events(calls, delay=0.0, fail=False):
+    def factory():
+        async def gen():
+            calls.append(1)
+            yield {"step": "fetch_rss", "status": "running"}
+            await asyncio.sleep(delay)
+            if fail:
+                yield {"step": "error", "status": "error", "message": "boom"}
+                return
+            yield {"step": "complete", "status": "done", "articles": [{"url": "u", "title": "t"}]}
+        return gen()
+    return factory
+
+
+def _steps(lines):
+    return [json.loads(line[len("data: "):])["step"] for line in lines]
+
+
+async def _drain(flight):
+    return [line async for line in flight.tail()]
+
+
+# ---------------------------------------------------------------------------
+# Key / TTL
+# ---------------------------------------------------------------------------
+
+def test_key_ignores_url_order_duplicates_and_whitespace():
+    assert _key(URLS) == _key(list(reversed(URLS)) + [URLS[0]])
+    assert _key(time_range="6h00 đến 8h00") == _key(time_range=" 6h00  đến 8h00 ")
+
+
+def test_key_separates_date_range_and_api_key():
+    assert _key() != _key(date="17/03/2026")
+    assert _key() != _key(time_range="8h00 đến 10h00")
+    assert _key() != _key(api_key=None)
+    # Another user's key never gets this key's (possibly degraded) result
+    assert _key(api_key="key-a") != _key(api_key="key-b")
+    assert "key-a" not in _key()
+
+
+def test_ttl_short_for_today_long_for_past():
+    now = datetime(2026, 3, 16, 10, 0, tzinfo=VN_TZ)
+    assert fetch_cache_ttl("16/03/2026", now) == settings.FETCH_CACHE_TTL_TODAY_SEC
+    assert fetch_cache_ttl("15/03/2026", now) == settings.FETCH_CACHE_TTL_PAST_SEC
+    assert fetch_cache_ttl("not a date", now) == 0
+
+
+# ---------------------------------------------------------------------------
+# Singleflight / replay
+# ---------------------------------------------------------------------------
+
+def test_concurrent_requests_share_one_computation():
+    async def run():
+        cache = FetchResultCache()
+        calls = []
+        first, s1 = cache.get_or_start("k", 60, _events(calls, delay=0.05))
+        second, s2 = cache.get_or_start("k", 60, _events(calls))
+        lines_a, lines_b = await asyncio.gather(_drain(first), _drain(second))
+        return calls, first is second, s1, s2, lines_a, lines_b
+
+    calls, same, s1, s2, lines_a, lines_b = asyncio.run(run())
+    assert len(calls) == 1 and same
+    assert (s1, s2) == (CACHE_MISS, CACHE_JOIN)
+    assert lines_a == lines_b and _steps(lines_a) == ["fetch_rss", "complete"]
+
+
+def test_finished_flight_replays_instantly():
+    async def run():
+        cache = FetchResultCache()
+        calls = []
+        flight, _ = cache.get_or_start("k", 60, _events(calls))
+        await flight.wait()
+        again, status = cache.get_or_start("k", 60, _events(calls))
+        return calls, status, again.result, await _drain(again)
+
+    calls, status, result, lines = asyncio.run(run())
+    assert len(calls) == 1 and status == CACHE_HIT
+    assert result == [{"url": "u", "title": "t"}]
+    assert _steps(lines) == ["fetch_rss", "complete"]
+
+
+def test_errors_and_expired_entries_are_recomputed():
+    async def run():
+        cache = FetchResultCache()
+        calls = []
+        failed, _ = cache.get_or_start("err", 60, _events(calls, fail=True))
+        await failed.wait()
+        _, after_error = cache.get_or_start("err", 60, _events(calls))
+
+        expired, _ = cache.get_or_start("ttl0", 0, _events(calls))
+        await expired.wait()
+        _, after_expiry = cache.get_or_start("ttl0", 0, _events(calls))
+        return failed.error, after_error, after_expiry
+
+    error, after_error, after_expiry = asyncio.run(run())
+    assert error == "boom"
+    assert after_error == CACHE_MISS
+    assert after_expiry == CACHE_MISS
+
+
+def test_finished_flights_are_bounded_by_bytes():
+    async def run():
+        cache = FetchResultCache(max_bytes=1)
+        first, _ = cache.get_or_start("a", 60, _events([]))
+        await first.wait()
+        second, _ = cache.get_or_start("b", 60, _events([]))
+        await second.wait()
+        # Over budget: finished flights are dropped, least recently used first...
+        _, status_a = cache.get_or_start("a", 60, _events([], delay=0.05))
+        # ...but in-flight ones stay joinable
+        _, status_join = cache.get_or_start("a", 60, _events([]))
+        return first.size, status_a, status_join, cache.result_set(second.set_id)
+
+    size, status_a, status_join, result_b = asyncio.run(run())
+    assert size > 0 and status_a == CACHE_MISS and status_join == CACHE_JOIN and result_b is None
+
+
+def test_result_set_is_served_while_fresh():
+    async def run():
+        cache = FetchResultCache()
+        flight, _ = cache.get_or_start("set", 60, _events([]))
+        pending = cache.result_set(flight.set_id)
+        lines = await _drain(flight)
+        failed, _ = cache.get_or_start("err", 60, _events([], fail=True))
+        await failed.wait()
+        by_key = cache.result_set("set")
+        return flight, pending, cache.result_set(flight.set_id), cache.result_set(failed.set_id), by_key, lines
+
+    flight, pending, result, failed, by_key, lines = asyncio.run(run())
+    assert pending is None and failed is None
+    assert result == [{"url": "u", "title": "t"}]
+    # The complete event tells clients which set to page through: a random id,
+    # never the cache key (which anyone can derive from a request + key hash)
+    result_set = json.loads(lines[-1][len("data: "):])["result_set"]
+    assert result_set == flight.set_id and len(result_set) >= 16
+    assert by_key is None and Flight("set").set_id != result_set
+
+
+def test_flight_survives_exception_in_generator():
+    def factory():
+        async def gen():
+            yield {"step": "fetch_rss", "status": "running"}
+            raise RuntimeError("network down")
+        return gen()
+
+    async def run():
+        flight, _ = FetchResultCache().get_or_start("k", 60, factory)
+        return flight, await _drain(flight)
+
+    flight, lines = asyncio.run(run())
+    assert flight.done and flight.error == "network down"
+    assert _steps(lines) == ["fetch_rss", "error"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
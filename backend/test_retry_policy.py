@@ -0,0 +1,108 @@
+"""
+Unit tests for services.retry_policy and the summarizer retry path.
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_retry_policy.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+
+import pytest
+
+import services.summarizer as summarizer_module
+from services.retry_policy import RetryPolicy, RetryStats, run_with_stats
+from services.summarizer import Summarizer
+
+ARTICLE_HTML = "<html><body><article>" + "<p>Nội dung bài viết đủ dài để tóm tắt.</p>" * 20 + "</article></body></html>"
+SUMMARY = "### [Tiêu đề](https://example.com/a)\n" + "- Ý chính của bài viết được tóm tắt ở đây rõ ràng.\n" * 5
+
+
+def test_delay_is_jittered_exponential_and_capped():
+    policy = RetryPolicy(base_delay=1.0, multiplier=2.0, max_delay=5.0, jitter=1.0)
+    assert policy.delay(1, rng=lambda: 1.0) == 1.0
+    assert policy.delay(2, rng=lambda: 1.0) == 2.0
+    assert policy.delay(3, rng=lambda: 0.5) == 2.0
+    assert policy.delay(10, rng=lambda: 1.0) == 5.0
+    assert policy.delay(3, rng=lambda: 0.0) == 0.0
+    # Half jitter keeps at least half of the ceiling
+    assert RetryPolicy(base_delay=2.0, jitter=0.5).delay(1, rng=lambda: 0.0) == 1.0
+
+
+def test_sleep_records_on_current_stats_only():
+    policy = RetryPolicy(base_delay=0.001, jitter=0.0, legacy_delay=lambda retry: 2.0 * retry)
+    stats = RetryStats()
+
+    async def main():
+        await policy.sleep(1)  # no stats in context: not recorded anywhere
+        await run_with_stats(stats, policy.sleep(2))
+
+    asyncio.run(main())
+    assert stats.retries == 1
+    assert stats.fixed_sleep_sec == 4.0
+    assert stats.as_dict()["saved_sec"] == pytest.approx(4.0, abs=0.01)
+
+
+class _FlakySummarizer(Summarizer):
+    """First fetch of every URL in *flaky* fails; records fetch order."""
+
+    def __init__(self, flaky):
+        super().__init__()
+        self.flaky = set(flaky)
+        self.calls = []
+
+    async def _fetch_article_html(self, url, timeout=25, low_priority=False):
+        self.calls.append(url)
+        if url in self.flaky:
+            self.flaky.discard(url)
+            return ""
+        return ARTICLE_HTML
+
+
+@pytest.fixture
+def fast_ai(monkeypatch):
+    async def generate(**kwargs):
+        return SUMMARY
+
+    monkeypatch.setattr(summarizer_module.gemini_client, "async_generate_content", generate)
+    monkeypatch.setattr(summarizer_module, "FETCH_RETRY", RetryPolicy(attempts=3, base_delay=0.05, jitter=0.0))
+
+
+def test_semaphore_released_while_waiting_to_retry(fast_ai):
+    urls = ["https://example.com/retry-a", "https://example.com/retry-b"]
+
+    async def main():
+        s = _FlakySummarizer(flaky=[urls[0]])
+        s.semaphore = asyncio.Semaphore(1)
+        stats = RetryStats()
+        results = await asyncio.gather(*(run_with_stats(stats, s._process_single_article(u, {"title": "T"}, None)) for u in urls))
+        return s, stats, results
+
+    s, stats, results = asyncio.run(main())
+    # b is fetched while a is backing off, not after a's retry
+    assert s.calls == [urls[0], urls[1], urls[0]]
+    assert all(r["text"] == SUMMARY.strip() for r in results)
+    assert stats.retries == 1
+
+
+def test_generator_reports_saved_seconds(fast_ai):
+    urls = [f"https://example.com/metrics-{i}" for i in range(3)]
+    s = _FlakySummarizer(flaky=[])
+    s.batch_size = 2
+
+    async def main():
+        return [u async for u in s.summarize_articles_generator(urls)]
+
+    events = asyncio.run(main())
+    metrics = events[-1]["metrics"]
+    assert events[-1]["type"] == "complete"
+    assert metrics["retries"] == 0
+    # 0.5 s per article + 0.5 s between the two batches, none of it slept
+    assert metrics["saved_sec"] == metrics["fixed_sleep_sec"] == 2.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,165 @@
+"""
+Unit tests for RSS parsing helpers in services.rss_fetcher.
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_rss_fetcher.py -v
+"""
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from datetime import datetime, time
+
+from services.feed_parser import feed_parser
+from services.rss_fetcher import RSSFetcher, VN_TZ, _apply_hanoimoi_extras, _extract_hanoimoi_extras
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _load_fixture(filename: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, filename), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_hanoimoi_extras_from_double_escaped_cdata():
+    extras = _extract_hanoimoi_extras(_load_fixture("hanoimoi_feed.xml"))
+    assert len(extras) == 48
+
+    url = "https://hanoimoi.vn/phuong-hai-ba-trung-mong-som-dua-khu-dat-vang-94-pho-lo-duc-vao-su-dung-731520.html"
+    assert extras[url]["thumbnail"].startswith("https://hnm.1cdn.vn/thumbs/600x315/")
+    assert extras[url]["description"].startswith("Mặc dù nằm ở vị trí đắc địa")
+    assert "<" not in extras[url]["description"]
+
+
+def test_hanoimoi_extras_ignore_channel_link_and_items_without_cdata():
+    content = (
+        "<rss><channel><link>https://hanoimoi.vn/xa-hoi</link>"
+        "<item><link>https://hanoimoi.vn/a.html</link><description>plain</description></item>"
+        "<item><link>https://hanoimoi.vn/b.html</link>"
+        "<description>&lt;![CDATA[&lt;p&gt;Nội dung&lt;/p&gt;]]&gt;</description></item>"
+        "</channel></rss>"
+    )
+    extras = _extract_hanoimoi_extras(content)
+    assert list(extras) == ["https://hanoimoi.vn/b.html"]
+    assert extras["https://hanoimoi.vn/b.html"] == {"thumbnail": "", "description": "Nội dung"}
+
+
+def test_apply_hanoimoi_extras_keeps_existing_description():
+    extras = {"https://hanoimoi.vn/a.html": {"thumbnail": "https://img/a.jpg", "description": "từ CDATA"}}
+    article = {"url": "https://hanoimoi.vn/a.html", "description": "từ RSS", "thumbnail": ""}
+    _apply_hanoimoi_extras(article, extras)
+    assert article == {"url": "https://hanoimoi.vn/a.html", "description": "từ RSS", "thumbnail": "https://img/a.jpg"}
+
+
+def _counting_fetcher():
+    fetcher = RSSFetcher()
+    calls = []
+    original = fetcher._entry_pub_date
+
+    def spy(entry, rss_url):
+        calls.append(entry)
+        return original(entry, rss_url)
+
+    fetcher._entry_pub_date = spy
+    return fetcher, calls
+
+
+def test_filter_entries_stops_early_with_same_result():
+    entries = feed_parser.parse(_load_fixture("dantri_feed.xml")).entries
+    rss_url = "https://dantri.com.vn/rss/kinh-doanh.rss"
+    target = datetime(2026, 3, 16)
+    start, end = time(20, 0), time(22, 0)
+
+    full = [a for a in (RSSFetcher()._process_entry(e, target, start, end, rss_url) for e in entries) if a]
+    fetcher, calls = _counting_fetcher()
+    fast = fetcher._filter_entries(entries, target, start, end, rss_url)
+
+    assert fast == full and len(fast) > 0
+    assert len(calls) < len(entries) // 2
+
+
+def test_filter_entries_does_not_stop_on_old_pinned_items():
+    def item(link, published):
+        return {"link": link, "title": link, "published": published, "summary": ""}
+
+    pinned = [item(f"https://x.vn/old-{i}", "Mon, 02 Mar 2026 08:00:00 +0700") for i in range(6)]
+    fresh = item("https://x.vn/new", "Mon, 16 Mar 2026 07:00:00 +0700")
+    fetcher, _ = _counting_fetcher()
+    articles = fetcher._filter_entries(pinned + [fresh], datetime(2026, 3, 16), time(6, 0), time(8, 0), "https://x.vn/rss")
+    assert [a["url"] for a in articles] == ["https://x.vn/new"]
+
+
+def test_window_start_cross_midnight_is_start_of_day():
+    target = datetime(2026, 3, 16)
+    assert RSSFetcher._window_start(target, time(6, 0), time(8, 0)) == datetime(2026, 3, 16, 6, 0, tzinfo=VN_TZ)
+    assert RSSFetcher._window_start(target, time(21, 0), time(6, 0)) == datetime(2026, 3, 16, 0, 0, tzinfo=VN_TZ)
+
+
+def test_fetch_and_filter_iter_yields_fast_sources_first():
+    fetcher = RSSFetcher()
+
+    async def fake_fetch(client, rss_url, *window):
+        await asyncio.sleep(0.2 if "slow" in rss_url else 0.01)
+        return [{"url": rss_url + "#1"}]
+
+    fetcher._fetch_rss_articles = fake_fetch
+    urls = ["https://slow.vn/rss/a.rss", "https://fast.vn/rss/b.rss"]
+
+    async def main():
+        streamed = [url async for url, _ in fetcher.fetch_and_filter_iter(urls, "16/03/2026", "6h00 đến 8h00")]
+        collected = await fetcher.fetch_and_filter(urls, "16/03/2026", "6h00 đến 8h00")
+        return streamed, collected
+
+    streamed, collected = asyncio.run(main())
+    assert streamed == ["https://fast.vn/rss/b.rss", "https://slow.vn/rss/a.rss"]
+    # Non-streaming result keeps the requested source order
+    assert [a["url"] for a in collected] == ["https://slow.vn/rss/a.rss#1", "https://fast.vn/rss/b.rss#1"]
+
+
+def test_plain_feed_is_streamed_capped_and_status_checked(monkeypatch, capsys):
+    import httpx
+
+    import services.rss_fetcher as rss_fetcher_module
+
+    feed = _load_fixture("dantri_feed.xml").encode("utf-8")
+    rss_url = "https://dantri.com.vn/rss/kinh-doanh.rss"
+    target = datetime(2026, 3, 16)
+    window = (target, time(0, 0), time(23, 59))
+    parsed = []
+    original_parse = feed_parser.parse_async
+
+    async def spy_parse(content, engine=None):
+        parsed.append(len(content))
+        return await original_parse(content, engine)
+
+    monkeypatch.setattr(feed_parser, "parse_async", spy_parse)
+
+    def handler(request):
+        if request.url.path.endswith("missing.rss"):
+            return httpx.Response(404, content=b"<rss><channel><item><title>x</title></item></channel></rss>")
+        return httpx.Response(200, headers={"content-type": "application/rss+xml; charset=utf-8"}, content=feed)
+
+    async def fetch(url):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await RSSFetcher()._fetch_rss_articles(client, url, *window)
+
+    full = asyncio.run(fetch(rss_url))
+    assert full
+
+    # Non-2xx bodies are never parsed
+    assert asyncio.run(fetch("https://dantri.com.vn/rss/missing.rss")) == []
+    assert len(parsed) == 1 and "HTTP 404" in capsys.readouterr().out
+
+    # Over FEED_MAX_BYTES: only the prefix is read and the truncation is logged
+    monkeypatch.setattr(rss_fetcher_module.settings, "FEED_MAX_BYTES", len(feed) // 2)
+    capped = asyncio.run(fetch(rss_url))
+    assert parsed[-1] <= len(feed) // 2 and len(capped) <= len(full)
+    assert "feed truncated at FEED_MAX_BYTES" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__, "-v"])
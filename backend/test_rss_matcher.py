@@ -0,0 +1,91 @@
+"""
+Unit tests for RSSMatcher and the source registry (SourceIndex routing index,
+per-feed records driving RSSFetcher's strategy dispatch).
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_rss_matcher.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+
+from config import settings
+from services.rss_matcher import rss_matcher
+from services.crawl_scheduler import crawl_scheduler
+from services.rss_fetcher import rss_fetcher
+from services.source_registry import (
+    STRATEGY_HANOIMOI_HTML,
+    STRATEGY_HANOIMOI_RSS,
+    STRATEGY_HTTP,
+    STRATEGY_SECURE,
+    STRATEGY_VOV_HTML,
+    Newspaper,
+    SourceIndex,
+    source_index,
+)
+
+
+@pytest.mark.parametrize("name", ["lao động", "Lao  Động", "lao dong", "LAODONG", "ld", "Báo Lao Động", "lao dongg"])
+def test_resolve_normalizes_aliases(name):
+    assert source_index.resolve(name) == "laodong.vn"
+
+
+def test_resolve_rejects_unknown_and_ambiguous_names():
+    assert source_index.resolve("xyz") is None
+    assert source_index.resolve("") is None
+    # "tt" = Tuổi Trẻ or Tin Tức: not guessed
+    assert source_index.resolve("tt") is None
+
+
+def test_match_feeds_keeps_database_order():
+    feeds = rss_matcher.match_feeds("nhân dân, dân trí,lao dong, không tồn tại")
+    expected = [
+        url for url in settings.RSS_DATABASE
+        if any(domain in url for domain in ("laodong.vn", "dantri.com.vn", "nhandan.vn"))
+    ]
+    assert feeds == expected and feeds
+    assert rss_matcher.match_feeds("dân trí, Dân Trí") == rss_matcher.match_feeds("dantri")
+
+
+def test_strategy_for_url():
+    assert source_index.strategy_for("https://laodong.vn/rss/home.rss") == STRATEGY_SECURE
+    assert source_index.strategy_for("https://vov.vn/xa-hoi") == STRATEGY_VOV_HTML
+    assert source_index.strategy_for("https://www.vietnamplus.vn/rss/home.rss") == STRATEGY_HTTP
+    assert source_index.strategy_for("https://unknown.example/feed") == STRATEGY_HTTP
+
+
+def test_feed_records_are_precomputed():
+    record = source_index.record_for("https://vov.vn/phap-luat")
+    assert (record.source, record.category, record.strategy, record.parser) == ("VOV", "PHÁP LUẬT", STRATEGY_VOV_HTML, "html")
+    assert record.needs_proxy and record.host_limit == 8
+    assert crawl_scheduler.host_limit("vov.vn") == 8
+
+    assert source_index.strategy_for("https://hanoimoi.vn/rss/kinh-te") == STRATEGY_HANOIMOI_RSS
+    assert source_index.strategy_for("https://hanoimoi.vn/kinh-te") == STRATEGY_HANOIMOI_HTML
+    for url in settings.RSS_DATABASE:
+        assert source_index.record_for(url) is source_index.record_for(url)
+
+    # URLs outside the registry keep the old fallbacks
+    unknown = source_index.record_for("https://www.example.com/the-gioi/a.html")
+    assert (unknown.source, unknown.category, unknown.strategy) == ("EXAMPLE.COM", "THẾ GIỚI", STRATEGY_HTTP)
+    assert rss_fetcher._extract_source("https://dantri.com.vn/rss/kinh-doanh.rss") == "DÂN TRÍ"
+    assert rss_fetcher._extract_category_from_url("https://example.com/feed") == "XÃ HỘI"
+
+
+def test_new_newspaper_is_a_data_change():
+    index = SourceIndex(
+        [Newspaper("baomoi.example", "BÁO MỚI", ("báo mới",), STRATEGY_SECURE, parser="feedparser")],
+        ["https://baomoi.example/rss/phap-luat.rss"],
+    )
+    assert index.resolve("bao moi") == "baomoi.example"
+    record = index.record_for("https://baomoi.example/rss/phap-luat.rss")
+    assert (record.source, record.category, record.strategy, record.parser) == (
+        "BÁO MỚI", "PHÁP LUẬT", STRATEGY_SECURE, "feedparser",
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,184 @@
+"""
+Unit tests for services.stream_fetch (VOV published_time path, charset
+decoding, article body early stop) and services.persistent_cache.
+
+Tests are run from the backend/ directory:
+    cd backend && python3 -m pytest test_stream_fetch.py -v
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import asyncio
+
+import httpx
+
+from services.persistent_cache import PersistentCache
+from services.rss_fetcher import _HEAD_END_RE, _VOV_PUBLISHED_TIME_RES
+from services.article_extractors import article_extractors
+from services.stream_fetch import PatternStop, read_capped, stream_text
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+HEAD = (
+    '<html><head><title>VOV</title>'
+    '<meta property="article:published_time" content="2026-03-16T07:05:00+07:00">'
+    "</head>"
+)
+BODY = "<body>" + ("<p>nội dung bài viết</p>" * 20000) + "</body></html>"
+
+
+def _client(chunk_size: int = 4096) -> httpx.AsyncClient:
+    payload = (HEAD + BODY).encode("utf-8")
+
+    async def chunks():
+        for i in range(0, len(payload), chunk_size):
+            yield payload[i:i + chunk_size]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/html; charset=utf-8"}, content=chunks())
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_stream_stops_at_published_time_meta():
+    async def main():
+        async with _client() as client:
+            stop = PatternStop([*_VOV_PUBLISHED_TIME_RES, _HEAD_END_RE])
+            result = await stream_text(client, "https://vov.vn/a.vov", stop=stop)
+            return stop, result
+
+    stop, result = asyncio.run(main())
+    assert result.stopped_early and not result.truncated
+    assert stop.match.group(1) == "2026-03-16T07:05:00+07:00"
+    assert result.bytes_read < len((HEAD + BODY).encode("utf-8")) // 10
+
+
+def test_pattern_stop_matches_across_chunk_boundary():
+    async def main():
+        async with _client(chunk_size=7) as client:
+            stop = PatternStop(list(_VOV_PUBLISHED_TIME_RES))
+            await stream_text(client, "https://vov.vn/a.vov", stop=stop)
+            return stop
+
+    stop = asyncio.run(main())
+    assert stop.match is not None
+    assert stop.match.group(1).startswith("2026-03-16T07:05")
+
+
+def test_stream_respects_max_bytes():
+    async def main():
+        async with _client() as client:
+            return await stream_text(client, "https://vov.vn/a.vov", max_bytes=10000)
+
+    result = asyncio.run(main())
+    assert result.bytes_read == 10000
+    assert result.stopped_early and result.truncated
+
+
+def _payload_client(payload: bytes, content_type: str, chunk_size: int = 4096) -> httpx.AsyncClient:
+    async def chunks():
+        for i in range(0, len(payload), chunk_size):
+            yield payload[i:i + chunk_size]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": content_type}, content=chunks())
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_charset_sniffed_from_meta_when_header_has_none():
+    html = '<html><head><meta charset="iso-8859-1"></head><body><p>Café crème</p></body></html>'
+
+    async def main():
+        async with _payload_client(html.encode("iso-8859-1"), "text/html", chunk_size=5) as client:
+            return await stream_text(client, "https://example.com/a")
+
+    result = asyncio.run(main())
+    assert "Café crème" in result.text
+
+
+def test_read_capped_decodes_split_multibyte_chars():
+    payload = "Thủ tướng Chính phủ".encode("utf-8")
+
+    async def chunks():
+        for i in range(len(payload)):
+            yield payload[i:i + 1]
+
+    result = asyncio.run(read_capped(chunks(), "utf-8"))
+    assert result.text == "Thủ tướng Chính phủ"
+    assert result.bytes_read == len(payload)
+    assert not result.stopped_early
+
+
+def test_article_stream_stops_when_body_container_closes():
+    with open(os.path.join(FIXTURES_DIR, "vnexpress_article.html"), encoding="utf-8") as f:
+        page = f.read()
+    article_bytes = len(page.encode("utf-8"))
+    # Comments/footer/scripts after the article body that we never need
+    page = page.replace("</body>", '<div class="comments">' + ("<p>bình luận</p>" * 20000) + "</div></body>")
+    payload = page.encode("utf-8")
+    url = "https://vnexpress.net/cpi-thang-3-tang.html"
+
+    async def main():
+        async with _payload_client(payload, "text/html; charset=utf-8") as client:
+            return await stream_text(client, url, stop=article_extractors.body_stop(url))
+
+    result = asyncio.run(main())
+    assert result.stopped_early
+    # Stopped within one chunk of the end of the original article page
+    assert result.bytes_read <= article_bytes + 4096
+    assert result.bytes_read < len(payload) // 4
+    assert "CPI tăng 3,1%" in article_extractors.extract(url, result.text)
+    assert article_extractors.body_stop("https://example.com/a") is None
+
+
+def test_persistent_cache_roundtrip(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = PersistentCache(path)
+    cache.set_many("vov_published_time", {"https://vov.vn/a.vov": "2026-03-16T07:05:00+07:00"})
+
+    reopened = PersistentCache(path)
+    assert reopened.get("vov_published_time", "https://vov.vn/a.vov") == "2026-03-16T07:05:00+07:00"
+    assert reopened.get_many("vov_published_time", ["https://vov.vn/b.vov"]) == {}
+    assert reopened.get("other_namespace", "https://vov.vn/a.vov") is None
+
+
+def test_persistent_cache_bounds(tmp_path, monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+    from services import persistent_cache as module
+
+    clock = [1_000_000.0]
+    monkeypatch.setattr(module, "time", SimpleNamespace(time=lambda: clock[0]))
+    bounds = {"max_age_sec": 100, "namespace_max_age": {"short": 10}}
+    sqlite_cache = PersistentCache(str(tmp_path / "c.sqlite3"), max_rows=3, **bounds)
+    # Unopenable path → in-memory LRU fallback with the same bounds
+    memory_cache = PersistentCache(str(tmp_path / "\0bad"), memory_max_entries=3, **bounds)
+    for cache in (sqlite_cache, memory_cache):
+        cache.set_many("short", {"a": "1"})
+        cache.set_many("long", {"a": "1"})
+        clock[0] += 50
+        # Re-writing keeps the original created_at: age counts from first observation
+        cache.set_many("long", {"a": "2"})
+        assert cache.get("short", "a") is None and cache.get("long", "a") == "2"
+        clock[0] += 60
+        assert cache.get("long", "a") is None
+
+        asyncio.run(cache.aset_many("long", {f"k{i}": str(i) for i in range(5)}))
+        found = asyncio.run(cache.aget_many("long", [f"k{i}" for i in range(5)]))
+        assert len(found) == 3
+        cache.set_many("short", {"b": "1"})
+    assert memory_cache._conn is None and len(memory_cache._memory) == 3
+
+    # Pruned on write, not just hidden
+    conn = module.sqlite3.connect(str(tmp_path / "c.sqlite3"))
+    assert conn.execute("SELECT COUNT(*) FROM kv_cache WHERE namespace = 'long'").fetchone()[0] == 3
+    assert conn.execute("SELECT COUNT(*) FROM kv_cache WHERE namespace = 'short'").fetchone()[0] == 1
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__, "-v"])
@@ -85,5 +85,29 @@ def test_has_bullet_short_bullet_rejected():
         pytest.skip("_has_bullet_content not yet implemented (plan 03)")
 
 
+def test_summarize_article_never_raises():
+    """Single-article API: slow/failing articles become {'error': ...} results."""
+    import asyncio
+
+    class SlowSummarizer(Summarizer):
+        async def _process_single_article(self, url, metadata, api_key):
+            await asyncio.sleep(1)
+
+    result = asyncio.run(
+        SlowSummarizer().summarize_article("http://x.vn/a", {"title": "Bài chậm"}, timeout=0.01)
+    )
+    assert result == {"error": "Timeout xử lý bài: Bài chậm"}
+
+
+def test_format_summary_groups_by_category():
+    summary = Summarizer.format_summary([
+        {"category": "THẾ GIỚI", "text": "### [B](u2)\n- b"},
+        {"category": "kinh tế", "text": "### [A](u1)\n- a"},
+        {"error": "x"},
+    ])
+    assert summary.index("## KINH TẾ (1 bài)") < summary.index("## THẾ GIỚI (1 bài)")
+    assert "Không thể tóm tắt (1 bài)" in summary
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -173,7 +173,17 @@ export default function Home() {
                                 return step;
                             }));
 
-                            // Handle complete event
+                            // Per-source results while other sources are still loading
+                            if (event.step === 'articles_partial') {
+                                setProcessSteps(prev => prev.map(step =>
+                                    step.id === 'fetch_rss' ? { ...step, status: event.status, message: event.message || '' } : step
+                                ));
+                                if (event.articles?.length) {
+                                    setArticles(prev => [...prev, ...event.articles]);
+                                }
+                            }
+
+                            // Handle complete event (final list replaces partial results)
                             if (event.step === 'complete' && event.articles) {
                                 console.log('✅ Received articles:', event.articles.length);
                                 articlesReceived = true;
@@ -535,8 +545,8 @@ export default function Home() {
                     </div>
                 )}
 
-                {/* Articles List */}
-                {!loading && articles.length > 0 && (
+                {/* Articles List (also shown while sources are still streaming in) */}
+                {(!loading || currentProgressStep === 1) && articles.length > 0 && (
                     <div className="animate-slide-up">
                         <ArticleList articles={articles} onSelectArticles={handleSummarize} />
                     </div>